@@ -223,7 +223,6 @@ class BedrockAgentDietCoach:
         try:
             print(f"Starting image analysis for user: {user_id}")
             print(f"Image data size: {len(image_data)} bytes")
-            import base64
             
             # 이미지 타입 감지
             media_type = "image/jpeg"
@@ -236,10 +235,6 @@ class BedrockAgentDietCoach:
             
             print(f"Detected media type: {media_type}")
             
-            # 이미지를 base64로 인코딩
-            image_base64 = base64.b64encode(image_data).decode('utf-8')
-            print(f"Base64 encoded image length: {len(image_base64)}")
-            
             bedrock_client = boto3.client(
                 'bedrock-runtime',
                 region_name='ap-northeast-2'
@@ -5,7 +5,8 @@ Conversation Memory System
 
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
-import json
+
+from src.utils.helpers import extract_json, fast_json_loads
 
 
 class ConversationMemory:
@@ -230,15 +231,12 @@ class ConversationMemory:
             )
             
             # JSON 파싱 시도
-            import re
-            import json
-            
             response_text = response.get("response", "") if isinstance(response, dict) else str(response)
             
-            array_match = re.search(r'\[.*?\]', response_text)
-            if array_match:
+            array_text = extract_json(response_text, opener="[")
+            if array_text:
                 try:
-                    topics = json.loads(array_match.group())
+                    topics = fast_json_loads(array_text)
                     return topics[:5] if isinstance(topics, list) else []
                 except:
                     pass
@@ -334,16 +332,13 @@ class ConversationMemory:
             )
             
             # JSON 파싱 시도
-            import re
-            import json
-            
             response_text = response.get("response", "") if isinstance(response, dict) else str(response)
             
             # 배열 패턴 찾기
-            array_match = re.search(r'\[.*?\]', response_text)
-            if array_match:
+            array_text = extract_json(response_text, opener="[")
+            if array_text:
                 try:
-                    foods = json.loads(array_match.group())
+                    foods = fast_json_loads(array_text)
                     return foods if isinstance(foods, list) else []
                 except:
                     pass
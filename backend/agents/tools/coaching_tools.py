@@ -8,7 +8,7 @@ from datetime import datetime, timedelta
 
 from src.services.bedrock_service import bedrock_service
 from src.services.dynamodb_service import dynamodb_service
-from src.utils.helpers import calculate_bmr, calculate_tdee
+from src.utils.helpers import calculate_bmr, calculate_tdee, extract_json, fast_json_loads
 
 
 async def generate_personalized_advice(
@@ -257,7 +257,7 @@ async def _generate_dynamic_exercise_recommendations(
 다음 조건에 맞는 운동을 추천해주세요:
 
 - 건강 목표: {user_profile.health_goal.value}
-- 선호 운동: {', '.join([ex.value for ex in user_profile.preferred_exercises])}
+- 선호 운동: {user_profile.preferred_exercises_text}
 - 오늘 칼로리: {current_calories:.0f}kcal (목표: {target_calories:.0f}kcal, 차이: {calorie_diff:+.0f}kcal)
 - 현재 활동: {current_activity}
 - 활동 수준: {user_profile.activity_level}
@@ -280,15 +280,12 @@ async def _generate_dynamic_exercise_recommendations(
         )
         
         # JSON 파싱 시도
-        import re
-        import json
-        
         response_text = response.get("response", "") if isinstance(response, dict) else str(response)
         
-        array_match = re.search(r'\[.*\]', response_text, re.DOTALL)
-        if array_match:
+        array_text = extract_json(response_text, opener="[")
+        if array_text:
             try:
-                recommendations = json.loads(array_match.group())
+                recommendations = fast_json_loads(array_text)
                 if isinstance(recommendations, list) and recommendations:
                     return recommendations
             except:
@@ -400,15 +397,12 @@ async def _generate_meal_suggestion(meal_type: str, target_calories: float, user
         )
         
         # JSON 파싱 시도
-        import re
-        import json
-        
         response_text = response.get("response", "") if isinstance(response, dict) else str(response)
         
-        json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-        if json_match:
+        json_text = extract_json(response_text)
+        if json_text:
             try:
-                suggestion = json.loads(json_match.group())
+                suggestion = fast_json_loads(json_text)
                 return {
                     "menu": suggestion.get("menu", f"{meal_type} 메뉴"),
                     "calories": suggestion.get("calories", target_calories),
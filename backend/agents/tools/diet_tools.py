@@ -24,9 +24,6 @@ async def analyze_food_image_detailed(user_id: str, image_data: Any, meal_type:
         # Bedrock Claude로 이미지 분석
         bedrock_client = boto3.client('bedrock-runtime', region_name='ap-northeast-2')
         
-        # 이미지를 base64로 인코딩
-        image_base64 = base64.b64encode(image_bytes).decode('utf-8')
-        
         # 상세 분석 프롬프트
         analysis_prompt = f"""
 이 음식 이미지를 전문 영양사 관점에서 상세히 분석해주세요.
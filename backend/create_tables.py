@@ -33,6 +33,18 @@ def create_tables():
             ],
             'BillingMode': 'PAY_PER_REQUEST'
         },
+        {
+            'TableName': 'image_analysis_cache',
+            'KeySchema': [
+                {'AttributeName': 'user_id', 'KeyType': 'HASH'},
+                {'AttributeName': 'image_key', 'KeyType': 'RANGE'}
+            ],
+            'AttributeDefinitions': [
+                {'AttributeName': 'user_id', 'AttributeType': 'S'},
+                {'AttributeName': 'image_key', 'AttributeType': 'S'}
+            ],
+            'BillingMode': 'PAY_PER_REQUEST'
+        },
         {
             'TableName': 'schedule_records',
             'KeySchema': [
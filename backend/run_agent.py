@@ -17,10 +17,23 @@ if __name__ == "__main__":
     print(f"📡 서버 주소: http://{host}:{port}")
     print(f"📚 API 문서: http://{host}:{port}/docs")
     
-    uvicorn.run(
-        "agents.api.agent_api:app",
-        host=host,
-        port=port,
-        reload=debug,
-        log_level="info"
-    )
\ No newline at end of file
+    if debug:
+        # 개발: 파일 변경 감지 후 자동 재시작
+        uvicorn.run(
+            "agents.api.agent_api:app",
+            host=host,
+            port=port,
+            reload=True,
+            log_level="info"
+        )
+    else:
+        # 운영: 멀티 워커 + uvloop/httptools (설치된 경우 "auto"가 선택, Windows는 asyncio로 대체)
+        uvicorn.run(
+            "agents.api.agent_api:app",
+            host=host,
+            port=port,
+            workers=int(os.getenv("WORKERS", "4")),
+            loop="auto",
+            http="auto",
+            log_level="info"
+        )
\ No newline at end of file
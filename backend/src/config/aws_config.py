@@ -3,18 +3,54 @@ AWS 서비스 설정 및 클라이언트 관리 모듈
 각 AWS 서비스별 클라이언트를 중앙 집중식으로 관리
 """
 
+import asyncio
 import boto3
 import os
-from typing import Optional
+import threading
+from contextlib import AsyncExitStack
+from typing import Any, Optional
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from dotenv import load_dotenv
 import logging
 
+try:
+    # 선택 의존성: 설치되어 있으면 Bedrock 호출을 이벤트 루프에서 비동기로 처리
+    from aiobotocore.config import AioConfig
+    from aiobotocore.session import get_session as get_aio_session
+except ImportError:
+    AioConfig = None
+    get_aio_session = None
+
 # 환경 변수 로드
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# 모든 클라이언트 공통 설정 (연결이 안 될 때 오래 멈추지 않도록 타임아웃/재시도 제한,
+# keep-alive로 연결을 재사용해 요청마다 TLS 핸드셰이크를 하지 않도록 함)
+CLIENT_CONFIG = Config(
+    connect_timeout=5,
+    retries={'max_attempts': 3, 'mode': 'standard'},
+    tcp_keepalive=True
+)
+
+# Bedrock은 동시 호출이 많으므로 연결 풀을 넉넉히 잡고,
+# adaptive 모드로 스로틀링 시 클라이언트 측에서 요청 속도를 낮춤
+BEDROCK_CLIENT_OPTIONS = {
+    'connect_timeout': 5,
+    'tcp_keepalive': True,
+    'max_pool_connections': 64,
+    'retries': {'max_attempts': 6, 'mode': 'adaptive'}
+}
+BEDROCK_CLIENT_CONFIG = Config(**BEDROCK_CLIENT_OPTIONS)
+
+# aiobotocore(aiohttp) 커넥터 설정: DNS 캐시와 유휴 연결 유지 시간(초)
+AIO_CONNECTOR_ARGS = {
+    'ttl_dns_cache': 300,
+    'keepalive_timeout': 60
+}
+
 
 class AWSConfig:
     """AWS 서비스 설정 및 클라이언트 관리 클래스"""
@@ -34,7 +70,15 @@ class AWSConfig:
         self._sns_client = None
         self._lambda_client = None
         
-        self._validate_credentials()
+        # aiobotocore 비동기 클라이언트 (이벤트 루프, 클라이언트, 종료 스택)
+        self._bedrock_async: Optional[tuple[asyncio.AbstractEventLoop, Any, AsyncExitStack]] = None
+        
+        # 동시 요청에서 클라이언트가 중복 생성되지 않도록 보호
+        self._lock = threading.Lock()
+        
+        # 자격 증명 확인은 import 시점이 아닌 첫 클라이언트 생성 시 한 번만 수행
+        # (자격 증명 체인 탐색 중 EC2 메타데이터 조회로 지연될 수 있음)
+        self._credentials_checked = False
     
     def _validate_credentials(self) -> None:
         """AWS 자격 증명 유효성 검사"""
@@ -53,52 +97,107 @@ class AWSConfig:
             except Exception as e:
                 logger.warning(f"AWS credentials validation failed: {e}. Continuing with default configuration.")
     
-    def _create_client(self, service_name: str) -> boto3.client:
+    def _create_client(self, service_name: str, config: Config = CLIENT_CONFIG) -> boto3.client:
         """AWS 클라이언트 생성 헬퍼 메서드"""
+        if not self._credentials_checked:
+            self._validate_credentials()
+            self._credentials_checked = True
+        
         try:
             # 환경 변수나 AWS 프로필 사용
             return boto3.client(
                 service_name,
-                region_name=self.region
+                region_name=self.region,
+                config=config
             )
         except ClientError as e:
             logger.error(f"Failed to create {service_name} client: {e}")
             raise
     
+    def _get_or_create_client(
+        self,
+        attr_name: str,
+        service_name: str,
+        config: Config = CLIENT_CONFIG
+    ) -> boto3.client:
+        """캐시된 클라이언트 반환 (없으면 double-checked locking으로 한 번만 생성)"""
+        client = getattr(self, attr_name)
+        if client is None:
+            with self._lock:
+                client = getattr(self, attr_name)
+                if client is None:
+                    client = self._create_client(service_name, config)
+                    setattr(self, attr_name, client)
+        return client
+    
     @property
     def s3_client(self) -> boto3.client:
         """S3 클라이언트 반환 (싱글톤 패턴)"""
-        if self._s3_client is None:
-            self._s3_client = self._create_client('s3')
-        return self._s3_client
+        return self._get_or_create_client('_s3_client', 's3')
     
     @property
     def dynamodb_client(self) -> boto3.client:
         """DynamoDB 클라이언트 반환 (싱글톤 패턴)"""
-        if self._dynamodb_client is None:
-            self._dynamodb_client = self._create_client('dynamodb')
-        return self._dynamodb_client
+        return self._get_or_create_client('_dynamodb_client', 'dynamodb')
     
     @property
     def bedrock_client(self) -> boto3.client:
         """Bedrock 클라이언트 반환 (싱글톤 패턴)"""
-        if self._bedrock_client is None:
-            self._bedrock_client = self._create_client('bedrock-runtime')
-        return self._bedrock_client
+        return self._get_or_create_client('_bedrock_client', 'bedrock-runtime', BEDROCK_CLIENT_CONFIG)
     
     @property
     def sns_client(self) -> boto3.client:
         """SNS 클라이언트 반환 (싱글톤 패턴)"""
-        if self._sns_client is None:
-            self._sns_client = self._create_client('sns')
-        return self._sns_client
+        return self._get_or_create_client('_sns_client', 'sns')
     
     @property
     def lambda_client(self) -> boto3.client:
         """Lambda 클라이언트 반환 (싱글톤 패턴)"""
-        if self._lambda_client is None:
-            self._lambda_client = self._create_client('lambda')
-        return self._lambda_client
+        return self._get_or_create_client('_lambda_client', 'lambda')
+
+    
+    @property
+    def has_async_clients(self) -> bool:
+        """aiobotocore 비동기 클라이언트 사용 가능 여부"""
+        return get_aio_session is not None
+    
+    async def get_bedrock_async_client(self) -> Any:
+        """
+        Bedrock 비동기 클라이언트 반환 (현재 이벤트 루프당 하나를 생성해 재사용)
+        
+        Returns:
+            aiobotocore bedrock-runtime 클라이언트
+        """
+        if get_aio_session is None:
+            raise RuntimeError("aiobotocore is not installed")
+        
+        loop = asyncio.get_running_loop()
+        if self._bedrock_async is not None and self._bedrock_async[0] is loop:
+            return self._bedrock_async[1]
+        
+        stack = AsyncExitStack()
+        client = await stack.enter_async_context(
+            get_aio_session().create_client(
+                'bedrock-runtime',
+                region_name=self.region,
+                config=AioConfig(connector_args=AIO_CONNECTOR_ARGS, **BEDROCK_CLIENT_OPTIONS)
+            )
+        )
+        
+        # 생성 중 다른 코루틴이 먼저 만들었으면 그쪽을 사용
+        if self._bedrock_async is not None and self._bedrock_async[0] is loop:
+            await stack.aclose()
+            return self._bedrock_async[1]
+        
+        self._bedrock_async = (loop, client, stack)
+        return client
+    
+    async def close_async_clients(self) -> None:
+        """비동기 클라이언트 종료 (애플리케이션 종료 시 호출)"""
+        if self._bedrock_async is not None:
+            _, _, stack = self._bedrock_async
+            self._bedrock_async = None
+            await stack.aclose()
 
 
 class AWSResourceConfig:
@@ -114,10 +213,18 @@ class AWSResourceConfig:
         self.diet_table = os.getenv('DYNAMODB_DIET_TABLE', 'diet_records')
         self.schedule_table = os.getenv('DYNAMODB_SCHEDULE_TABLE', 'schedule_records')
         self.user_table = os.getenv('DYNAMODB_USER_TABLE', 'user_profiles')
+        self.image_analysis_table = os.getenv('DYNAMODB_IMAGE_ANALYSIS_TABLE', 'image_analysis_cache')
         
         # Bedrock 모델 설정 (us-east-1 리전용)
         self.bedrock_model_id = 'us.anthropic.claude-sonnet-4-20250514-v1:0'
         self.bedrock_image_model_id = 'us.anthropic.claude-sonnet-4-20250514-v1:0'
+        # 짧은 작업(의도 분석, 코칭 메시지)용 빠른 모델 / 식단 추천용 고성능 모델
+        self.bedrock_fast_model_id = os.getenv(
+            'BEDROCK_FAST_MODEL_ID', 'us.anthropic.claude-3-5-haiku-20241022-v1:0'
+        )
+        self.bedrock_strong_model_id = os.getenv('BEDROCK_STRONG_MODEL_ID', self.bedrock_model_id)
+        # 지연 시간 최적화 추론 (지원 모델/리전에서만 활성화)
+        self.bedrock_latency_optimized = os.getenv('BEDROCK_LATENCY_OPTIMIZED', 'false').lower() == 'true'
         
         # SNS 설정
         self.sns_topic_arn = os.getenv('SNS_TOPIC_ARN')
@@ -5,7 +5,7 @@ FastAPI 기반 웹 서비스
 
 from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from typing import List, Optional
 import uvicorn
 from datetime import datetime
@@ -18,6 +18,8 @@ from .models.data_models import (
 from .pipelines.food_analysis_pipeline import food_analysis_pipeline
 from .pipelines.coaching_pipeline import coaching_pipeline
 from .services.dynamodb_service import dynamodb_service
+from .services.bedrock_service import coaching_batcher
+from .config.aws_config import aws_config
 from .utils.logger import setup_logger
 from .utils.helpers import generate_unique_id
 
@@ -164,13 +166,10 @@ async def analyze_meal_image(
         if not image.content_type.startswith('image/'):
             raise HTTPException(status_code=400, detail="이미지 파일만 업로드 가능합니다.")
         
-        # 이미지 데이터 읽기
-        image_data = await image.read()
-        
-        # 파이프라인으로 처리
+        # 파이프라인으로 처리 (업로드 파일 객체를 그대로 스트리밍)
         meal_record = await food_analysis_pipeline.process_meal_image(
             user_id=user_id,
-            image_data=image_data,
+            image_stream=image.file,
             filename=image.filename,
             meal_type=meal_type,
             people_count=people_count,
@@ -204,6 +203,34 @@ async def analyze_meal_image(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/meals/analyze/stream")
+async def stream_meal_analysis(
+    people_count: int = Form(1),
+    image: UploadFile = File(...)
+):
+    """
+    식사 이미지 음식 분석 스트리밍 (저장 없이 인식된 음식 항목을 한 줄씩 전송)
+    
+    Args:
+        people_count: 함께 식사한 인원 수
+        image: 업로드된 이미지 파일
+    
+    Returns:
+        음식 항목 JSON을 줄 단위로 보내는 application/x-ndjson 스트리밍 응답
+    """
+    if not image.content_type.startswith('image/'):
+        raise HTTPException(status_code=400, detail="이미지 파일만 업로드 가능합니다.")
+    
+    async def food_item_lines():
+        async for food_item in food_analysis_pipeline.stream_food_analysis(
+            image_stream=image.file,
+            people_count=people_count
+        ):
+            yield food_item.model_dump_json() + "\n"
+    
+    return StreamingResponse(food_item_lines(), media_type="application/x-ndjson")
+
+
 @app.get("/meals/{user_id}", response_model=APIResponse)
 async def get_user_meals(
     user_id: str,
@@ -284,6 +311,28 @@ async def generate_daily_coaching(user_id: str, context: Optional[str] = None):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/coaching/daily/{user_id}/stream")
+async def stream_daily_coaching(user_id: str, context: Optional[str] = None):
+    """
+    일일 코칭 메시지 스트리밍 (생성되는 텍스트를 바로 전송)
+    
+    Args:
+        user_id: 사용자 ID
+        context: 추가 컨텍스트
+    
+    Returns:
+        text/plain 스트리밍 응답
+    """
+    logger.info(f"Streaming daily coaching for user: {user_id}")
+    
+    # 스트리밍을 시작하면 상태 코드를 바꿀 수 없으므로 프로필 확인을 먼저 수행
+    coaching_stream = await coaching_pipeline.stream_daily_coaching(user_id=user_id, context=context)
+    if coaching_stream is None:
+        raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
+    
+    return StreamingResponse(coaching_stream, media_type="text/plain; charset=utf-8")
+
+
 @app.post("/coaching/chat/{user_id}", response_model=APIResponse)
 async def chat_with_coach(
     user_id: str,
@@ -427,6 +476,8 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """애플리케이션 종료 시 실행"""
+    await coaching_batcher.aclose()
+    await aws_config.close_async_clients()
     logger.info("AI 식단 코치 애플리케이션이 종료되었습니다.")
 
 
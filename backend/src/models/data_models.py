@@ -6,6 +6,7 @@ Pydantic을 사용한 타입 안전성과 데이터 검증
 from pydantic import BaseModel, Field, validator
 from typing import List, Optional, Dict, Any
 from datetime import datetime
+from dataclasses import dataclass, field
 from enum import Enum
 
 
@@ -35,6 +36,10 @@ class NutritionInfo(BaseModel):
     fat: float = Field(..., description="지방 (g)")
     fiber: Optional[float] = Field(None, description="식이섬유 (g)")
     sodium: Optional[float] = Field(None, description="나트륨 (mg)")
+    
+    def as_vec(self) -> tuple[float, float, float, float]:
+        """주요 영양소 벡터 (칼로리, 탄수화물, 단백질, 지방)"""
+        return (self.calories, self.carbohydrates, self.protein, self.fat)
 
 
 class FoodItem(BaseModel):
@@ -58,6 +63,15 @@ class MealRecord(BaseModel):
     notes: Optional[str] = Field(None, description="추가 메모")
 
 
+@dataclass(slots=True)
+class MealStats:
+    """식사 통계 집계용 경량 레코드 (검증 없이 필요한 필드만 보관)"""
+    meal_type: str
+    calories: float
+    protein: float
+    food_names: List[str] = field(default_factory=list)
+
+
 class UserProfile(BaseModel):
     """사용자 프로필 모델"""
     user_id: str = Field(..., description="사용자 ID")
@@ -74,6 +88,29 @@ class UserProfile(BaseModel):
     target_calories: Optional[float] = Field(None, description="목표 칼로리")
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
+    
+    @property
+    def preferred_exercises_text(self) -> str:
+        """프롬프트용 선호 운동 문자열 (정렬 후 쉼표로 연결)"""
+        return ', '.join(sorted(ex.value for ex in self.preferred_exercises))
+    
+    def to_prompt_context(self) -> Dict[str, Any]:
+        """
+        프롬프트 템플릿에 넣을 프로필 값 모음
+        
+        모델 인스턴스에 캐시하지 않으므로 필드를 바꾸거나 복사해도 항상 현재 값을 반영합니다.
+        
+        Returns:
+            name, age, health_goal, preferred_exercises, target_calories, dietary_restrictions 키를 가진 딕셔너리
+        """
+        return {
+            'name': self.name,
+            'age': self.age,
+            'health_goal': self.health_goal.value,
+            'preferred_exercises': self.preferred_exercises_text,
+            'target_calories': self.target_calories,
+            'dietary_restrictions': ', '.join(self.dietary_restrictions) if self.dietary_restrictions else '없음'
+        }
 
 
 class ScheduleEvent(BaseModel):
@@ -3,14 +3,14 @@ AI 코칭 파이프라인
 개인 맞춤형 코칭 메시지 생성 및 관리
 """
 
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional
 from datetime import datetime, timedelta
 
 from ..models.data_models import (
     UserProfile, MealRecord, CoachingMessage, 
     ExerciseRecommendation, DietRecommendation, DailyReport
 )
-from ..services.bedrock_service import bedrock_service
+from ..services.bedrock_service import bedrock_service, coaching_batcher, NLP_MAX_TOKENS
 from ..services.dynamodb_service import dynamodb_service
 from ..utils.logger import setup_logger
 from ..utils.helpers import generate_unique_id, calculate_bmr, calculate_tdee
@@ -24,6 +24,7 @@ class CoachingPipeline:
     def __init__(self):
         """파이프라인 초기화"""
         self.bedrock_service = bedrock_service
+        self.coaching_batcher = coaching_batcher
         self.dynamodb_service = dynamodb_service
     
     async def generate_daily_coaching(
@@ -44,34 +45,14 @@ class CoachingPipeline:
         try:
             logger.info(f"Generating daily coaching for user: {user_id}")
             
-            # 1. 사용자 프로필 조회
-            user_profile = await self.dynamodb_service.get_user_profile(user_id)
-            if not user_profile:
-                logger.error(f"User profile not found: {user_id}")
+            # 1~3. 사용자 프로필과 최근 식사 기록 조회
+            coaching_inputs = await self._load_daily_coaching_inputs(user_id)
+            if not coaching_inputs:
                 return None
+            user_profile, meals_data = coaching_inputs
             
-            # 2. 최근 식사 기록 조회 (최근 3일)
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=3)
-            recent_meals = await self.dynamodb_service.get_user_meals(
-                user_id=user_id,
-                start_date=start_date,
-                end_date=end_date,
-                limit=20
-            )
-            
-            # 3. 식사 기록을 딕셔너리 형태로 변환
-            meals_data = []
-            for meal in recent_meals:
-                meals_data.append({
-                    "meal_type": meal.meal_type,
-                    "timestamp": meal.timestamp.isoformat(),
-                    "total_calories": meal.total_nutrition.calories,
-                    "foods": [food.name for food in meal.foods]
-                })
-            
-            # 4. Bedrock으로 코칭 메시지 생성
-            coaching_message = await self.bedrock_service.generate_coaching_message(
+            # 4. Bedrock으로 코칭 메시지 생성 (동시 요청은 한 번의 호출로 묶어 처리)
+            coaching_message = await self.coaching_batcher.submit(
                 user_profile=user_profile,
                 recent_meals=meals_data,
                 context=context or ""
@@ -84,6 +65,73 @@ class CoachingPipeline:
             logger.error(f"Error generating daily coaching: {e}")
             return None
     
+    async def stream_daily_coaching(
+        self,
+        user_id: str,
+        context: Optional[str] = None
+    ) -> Optional[AsyncIterator[str]]:
+        """
+        일일 코칭 메시지 스트림 준비 (응답을 시작하기 전에 프로필을 먼저 확인)
+        
+        Args:
+            user_id: 사용자 ID
+            context: 추가 컨텍스트 정보
+        
+        Returns:
+            코칭 메시지 텍스트 조각을 생성되는 대로 내보내는 스트림 또는 None (프로필이 없는 경우)
+        """
+        coaching_inputs = await self._load_daily_coaching_inputs(user_id)
+        if not coaching_inputs:
+            return None
+        user_profile, meals_data = coaching_inputs
+        
+        return self.bedrock_service.stream_coaching_message(
+            user_profile=user_profile,
+            recent_meals=meals_data,
+            context=context or ""
+        )
+    
+    async def _load_daily_coaching_inputs(
+        self,
+        user_id: str
+    ) -> Optional[tuple[UserProfile, List[Dict[str, Any]]]]:
+        """
+        일일 코칭에 필요한 사용자 프로필과 최근 3일 식사 기록 조회
+        
+        Args:
+            user_id: 사용자 ID
+        
+        Returns:
+            (사용자 프로필, 식사 기록 딕셔너리 리스트) 또는 None
+        """
+        # 1. 사용자 프로필 조회
+        user_profile = await self.dynamodb_service.get_user_profile(user_id)
+        if not user_profile:
+            logger.error(f"User profile not found: {user_id}")
+            return None
+        
+        # 2. 최근 식사 기록 조회 (최근 3일)
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=3)
+        recent_meals = await self.dynamodb_service.get_user_meals(
+            user_id=user_id,
+            start_date=start_date,
+            end_date=end_date,
+            limit=20
+        )
+        
+        # 3. 식사 기록을 딕셔너리 형태로 변환
+        meals_data = []
+        for meal in recent_meals:
+            meals_data.append({
+                "meal_type": meal.meal_type,
+                "timestamp": meal.timestamp.isoformat(),
+                "total_calories": meal.total_nutrition.calories,
+                "foods": [food.name for food in meal.foods]
+            })
+        
+        return user_profile, meals_data
+    
     async def generate_meal_feedback(
         self,
         user_id: str,
@@ -239,11 +287,13 @@ class CoachingPipeline:
                 logger.error(f"User profile not found: {user_id}")
                 return {"error": "사용자 정보를 찾을 수 없습니다."}
             
-            # 2. 자연어 처리
+            # 2. 자연어 처리 (짧은 대화 응답이므로 빠른 모델과 작은 토큰 한도 사용)
             nlp_result = await self.bedrock_service.process_natural_language(
                 user_input=user_input,
                 user_profile=user_profile,
-                conversation_history=conversation_history
+                conversation_history=conversation_history,
+                model_id=self.bedrock_service.fast_model_id,
+                max_tokens=NLP_MAX_TOKENS
             )
             
             # 3. 의도에 따른 추가 처리
@@ -298,10 +348,10 @@ class CoachingPipeline:
         if not meals:
             return {"message": "분석할 식사 기록이 없습니다."}
         
-        total_calories = sum(meal.total_nutrition.calories for meal in meals)
-        total_protein = sum(meal.total_nutrition.protein for meal in meals)
-        total_carbs = sum(meal.total_nutrition.carbohydrates for meal in meals)
-        total_fat = sum(meal.total_nutrition.fat for meal in meals)
+        # 식사별 영양소 벡터를 한 번만 만들고 열 단위로 합산
+        total_calories, total_carbs, total_protein, total_fat = (
+            sum(column) for column in zip(*(meal.total_nutrition.as_vec() for meal in meals))
+        )
         
         target_calories = self._calculate_target_calories(user_profile)
         target_weekly_calories = target_calories * 7
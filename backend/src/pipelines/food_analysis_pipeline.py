@@ -3,15 +3,18 @@
 이미지 업로드부터 영양소 분석까지의 전체 프로세스
 """
 
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+import asyncio
+import hashlib
+from collections import Counter, defaultdict
+from typing import IO, AsyncIterator, List, Optional, Dict, Any
+from datetime import datetime, timedelta
 
 from ..models.data_models import MealRecord, FoodItem, NutritionInfo
 from ..services.s3_service import s3_service
 from ..services.bedrock_service import bedrock_service
 from ..services.dynamodb_service import dynamodb_service
 from ..utils.logger import setup_logger
-from ..utils.helpers import generate_unique_id
+from ..utils.helpers import generate_unique_id, TTLCache
 
 logger = setup_logger(__name__)
 
@@ -24,56 +27,100 @@ class FoodAnalysisPipeline:
         self.s3_service = s3_service
         self.bedrock_service = bedrock_service
         self.dynamodb_service = dynamodb_service
+        
+        # 식사 분석 요약 캐시: (user_id, date_range_days, 오늘 날짜) -> 요약
+        self._summary_cache = TTLCache(maxsize=1024, ttl=300)
     
     async def process_meal_image(
         self,
         user_id: str,
-        image_data: bytes,
+        image_stream: IO[bytes],
         filename: str,
         meal_type: str,
         people_count: int = 1,
-        notes: Optional[str] = None
+        notes: Optional[str] = None,
+        timestamp: Optional[datetime] = None
     ) -> Optional[MealRecord]:
         """
         식사 이미지 전체 처리 파이프라인
         
         Args:
             user_id: 사용자 ID
-            image_data: 이미지 바이트 데이터
+            image_stream: 이미지 파일 객체 (읽기 가능한 바이너리 스트림)
             filename: 원본 파일명
             meal_type: 식사 종류 (아침/점심/저녁/간식)
             people_count: 함께 식사한 인원 수
             notes: 추가 메모
+            timestamp: 식사 기록 시각 (None이면 현재 시각)
         
         Returns:
             처리된 식사 기록 또는 None
         """
         try:
-            logger.info(f"Starting meal image processing for user: {user_id}")
+            logger.info("Starting meal image processing for user: %s", user_id)
             
             # 1. 고유 식사 ID 생성
             meal_id = generate_unique_id("meal")
             
-            # 2. S3에 이미지 업로드
-            logger.info("Uploading image to S3...")
-            image_url = await self.s3_service.upload_image(
-                image_data=image_data,
+            # 2. 같은 이미지가 이미 있으면 업로드/분석 결과 재사용
+            image_hash = self._hash_image_stream(image_stream)
+            food_items = None
+            
+            image_url = await self.s3_service.find_image_by_hash(
                 user_id=user_id,
-                filename=filename,
-                meal_id=meal_id
+                image_hash=image_hash,
+                filename=filename
             )
             
+            if image_url:
+                logger.info("Image already uploaded, reusing: %s", image_url)
+                food_items = await self.dynamodb_service.get_food_items_by_hash(
+                    user_id=user_id,
+                    image_hash=image_hash,
+                    people_count=people_count
+                )
+            
+            # 3. S3 업로드와 Bedrock 음식 분석 (서로 독립적이므로 동시에 실행)
+            if food_items is None:
+                # Converse API는 S3 URI 이미지를 받지 않으므로 바이트를 먼저 읽고,
+                # 업로드 스레드와 스트림 위치가 겹치지 않도록 되감은 뒤 시작
+                image_stream.seek(0)
+                image_data = image_stream.read()
+                image_stream.seek(0)
+                
+                analysis = self.bedrock_service.analyze_food_image(
+                    image_data=image_data,
+                    people_count=people_count
+                )
+                
+                if image_url:
+                    logger.info("Analyzing food image with Bedrock...")
+                    food_items = await analysis
+                else:
+                    logger.info("Uploading image to S3 and analyzing with Bedrock...")
+                    image_url, food_items = await asyncio.gather(
+                        self.s3_service.upload_image_stream(
+                            image_stream=image_stream,
+                            user_id=user_id,
+                            filename=filename,
+                            meal_id=meal_id,
+                            image_hash=image_hash
+                        ),
+                        analysis
+                    )
+                
+                if image_url and food_items:
+                    await self.dynamodb_service.save_food_items_by_hash(
+                        user_id=user_id,
+                        image_hash=image_hash,
+                        people_count=people_count,
+                        food_items=food_items
+                    )
+            
             if not image_url:
                 logger.error("Failed to upload image to S3")
                 return None
             
-            # 3. Bedrock으로 음식 분석
-            logger.info("Analyzing food image with Bedrock...")
-            food_items = await self.bedrock_service.analyze_food_image(
-                image_data=image_data,
-                people_count=people_count
-            )
-            
             if not food_items:
                 logger.warning("No food items detected in image")
                 # 기본 음식 항목 생성
@@ -86,7 +133,7 @@ class FoodAnalysisPipeline:
             meal_record = MealRecord(
                 user_id=user_id,
                 meal_id=meal_id,
-                timestamp=datetime.now(),
+                timestamp=timestamp or datetime.now(),
                 meal_type=meal_type,
                 image_url=image_url,
                 foods=food_items,
@@ -101,17 +148,43 @@ class FoodAnalysisPipeline:
             
             if not success:
                 logger.error("Failed to save meal record to DynamoDB")
-                # S3에서 이미지 삭제 (롤백)
-                await self.s3_service.delete_image(image_url)
+                # 이미지 키는 내용 해시 기반이라 다른 식사 기록이 같은 객체를 참조할 수 있으므로
+                # 롤백으로 삭제하지 않음 (남은 객체는 다음 업로드 때 재사용됨)
                 return None
             
-            logger.info(f"Successfully processed meal image: {meal_id}")
+            self._invalidate_summary_cache(user_id)
+            
+            logger.info("Successfully processed meal image: %s", meal_id)
             return meal_record
             
         except Exception as e:
-            logger.error(f"Error in meal image processing pipeline: {e}")
+            logger.error("Error in meal image processing pipeline: %s", e)
             return None
     
+    async def stream_food_analysis(
+        self,
+        image_stream: IO[bytes],
+        people_count: int = 1
+    ) -> AsyncIterator[FoodItem]:
+        """
+        식사 이미지 음식 분석 스트리밍 (저장하지 않는 미리보기용, 인식되는 대로 음식 항목 반환)
+        
+        Args:
+            image_stream: 이미지 파일 객체
+            people_count: 함께 식사한 인원 수
+        
+        Yields:
+            분석된 음식 항목
+        """
+        image_stream.seek(0)
+        image_data = image_stream.read()
+        
+        async for food_item in self.bedrock_service.stream_food_analysis(
+            image_data=image_data,
+            people_count=people_count
+        ):
+            yield food_item
+    
     async def reanalyze_meal(
         self,
         meal_id: str,
@@ -130,18 +203,20 @@ class FoodAnalysisPipeline:
             재분석된 식사 기록 또는 None
         """
         try:
-            logger.info(f"Starting meal reanalysis: {meal_id}")
+            logger.info("Starting meal reanalysis: %s", meal_id)
             
             # 1. 기존 식사 기록 조회
-            meals = await self.dynamodb_service.get_user_meals(user_id, limit=100)
-            existing_meal = next((meal for meal in meals if meal.meal_id == meal_id), None)
+            existing_meal = await self.dynamodb_service.get_meal_record(
+                user_id=user_id,
+                meal_id=meal_id
+            )
             
             if not existing_meal:
-                logger.error(f"Meal record not found: {meal_id}")
+                logger.error("Meal record not found: %s", meal_id)
                 return None
             
             if not existing_meal.image_url:
-                logger.error(f"No image URL found for meal: {meal_id}")
+                logger.error("No image URL found for meal: %s", meal_id)
                 return None
             
             # 2. S3에서 이미지 다운로드
@@ -190,57 +265,107 @@ class FoodAnalysisPipeline:
                 logger.error("Failed to update meal record in DynamoDB")
                 return None
             
-            logger.info(f"Successfully reanalyzed meal: {meal_id}")
+            self._invalidate_summary_cache(user_id)
+            
+            logger.info("Successfully reanalyzed meal: %s", meal_id)
             return updated_meal
             
         except Exception as e:
-            logger.error(f"Error in meal reanalysis pipeline: {e}")
+            logger.error("Error in meal reanalysis pipeline: %s", e)
             return None
     
     async def batch_process_images(
         self,
         user_id: str,
-        image_batch: List[Dict[str, Any]]
+        image_batch: List[Dict[str, Any]],
+        concurrency: int = 10
     ) -> List[Optional[MealRecord]]:
         """
-        여러 이미지 일괄 처리
+        여러 이미지 일괄 처리 (최대 concurrency개까지 동시 처리)
         
         Args:
             user_id: 사용자 ID
             image_batch: 이미지 배치 정보 리스트
-                [{"image_data": bytes, "filename": str, "meal_type": str, ...}, ...]
+                [{"image_stream": IO[bytes], "filename": str, "meal_type": str, ...}, ...]
+            concurrency: 동시에 처리할 최대 이미지 수
         
         Returns:
-            처리된 식사 기록 리스트
+            처리된 식사 기록 리스트 (입력 순서 유지, 실패 항목은 None)
         """
         try:
-            logger.info(f"Starting batch processing of {len(image_batch)} images")
-            
-            results = []
-            
-            for i, image_info in enumerate(image_batch):
-                logger.info(f"Processing image {i+1}/{len(image_batch)}")
-                
-                meal_record = await self.process_meal_image(
-                    user_id=user_id,
-                    image_data=image_info["image_data"],
-                    filename=image_info["filename"],
-                    meal_type=image_info["meal_type"],
-                    people_count=image_info.get("people_count", 1),
-                    notes=image_info.get("notes")
-                )
-                
-                results.append(meal_record)
+            logger.info("Starting batch processing of %d images", len(image_batch))
+            
+            semaphore = asyncio.Semaphore(concurrency)
+            # 배치 내 모든 식사 기록에 같은 시각 사용
+            now = datetime.now()
+            
+            async def _process_one(i: int, image_info: Dict[str, Any]) -> Optional[MealRecord]:
+                async with semaphore:
+                    logger.info("Processing image %d/%d", i + 1, len(image_batch))
+                    
+                    return await self.process_meal_image(
+                        user_id=user_id,
+                        image_stream=image_info["image_stream"],
+                        filename=image_info["filename"],
+                        meal_type=image_info["meal_type"],
+                        people_count=image_info.get("people_count", 1),
+                        notes=image_info.get("notes"),
+                        timestamp=now
+                    )
+            
+            outcomes = await asyncio.gather(
+                *(_process_one(i, image_info) for i, image_info in enumerate(image_batch)),
+                return_exceptions=True
+            )
+            results = [None if isinstance(outcome, BaseException) else outcome for outcome in outcomes]
             
             successful_count = sum(1 for result in results if result is not None)
-            logger.info(f"Batch processing completed: {successful_count}/{len(image_batch)} successful")
+            logger.info("Batch processing completed: %d/%d successful", successful_count, len(image_batch))
             
             return results
             
         except Exception as e:
-            logger.error(f"Error in batch image processing: {e}")
+            logger.error("Error in batch image processing: %s", e)
             return []
     
+    def _hash_image_stream(self, image_stream: IO[bytes], chunk_size: int = 1024 * 1024) -> str:
+        """
+        이미지 스트림 내용 해시 (청크 단위로 읽은 뒤 처음으로 되감음)
+        
+        readinto를 지원하는 스트림은 버퍼 하나를 재사용해 청크마다 bytes를 새로 만들지 않습니다.
+        
+        Args:
+            image_stream: 이미지 파일 객체
+            chunk_size: 한 번에 읽을 바이트 수
+        
+        Returns:
+            BLAKE2b 128비트 해시 (16진수 문자열)
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        readinto = getattr(image_stream, "readinto", None)
+        
+        if readinto is not None:
+            buffer = memoryview(bytearray(chunk_size))
+            while size := readinto(buffer):
+                hasher.update(buffer[:size])
+        else:
+            for chunk in iter(lambda: image_stream.read(chunk_size), b""):
+                hasher.update(chunk)
+        
+        image_stream.seek(0)
+        return hasher.hexdigest()
+    
+    def _invalidate_summary_cache(self, user_id: str) -> None:
+        """
+        사용자의 식사 분석 요약 캐시 무효화
+        
+        Args:
+            user_id: 사용자 ID
+        """
+        for key in self._summary_cache.keys():
+            if key[0] == user_id:
+                self._summary_cache.pop(key)
+    
     def _calculate_total_nutrition(self, food_items: List[FoodItem]) -> NutritionInfo:
         """
         음식 항목들의 총 영양소 계산
@@ -251,12 +376,16 @@ class FoodAnalysisPipeline:
         Returns:
             총 영양소 정보
         """
-        total_calories = sum(food.nutrition.calories for food in food_items)
-        total_carbs = sum(food.nutrition.carbohydrates for food in food_items)
-        total_protein = sum(food.nutrition.protein for food in food_items)
-        total_fat = sum(food.nutrition.fat for food in food_items)
-        total_fiber = sum(food.nutrition.fiber or 0 for food in food_items)
-        total_sodium = sum(food.nutrition.sodium or 0 for food in food_items)
+        # 한 번의 순회로 모든 영양소 합산
+        total_calories = total_carbs = total_protein = total_fat = total_fiber = total_sodium = 0.0
+        for food in food_items:
+            nutrition = food.nutrition
+            total_calories += nutrition.calories
+            total_carbs += nutrition.carbohydrates
+            total_protein += nutrition.protein
+            total_fat += nutrition.fat
+            total_fiber += nutrition.fiber or 0
+            total_sodium += nutrition.sodium or 0
         
         return NutritionInfo(
             calories=round(total_calories, 2),
@@ -301,12 +430,19 @@ class FoodAnalysisPipeline:
         Returns:
             분석 요약 정보
         """
+        now = datetime.now()
+        cache_key = (user_id, date_range_days, now.date().isoformat())
+        cached = self._summary_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             # 지정된 기간의 식사 기록 조회
-            end_date = datetime.now()
+            end_date = now
             start_date = end_date - timedelta(days=date_range_days)
             
-            meals = await self.dynamodb_service.get_user_meals(
+            # 통계에 필요한 속성만 조회 (이미지 URL, 메모 등 제외)
+            meals = await self.dynamodb_service.get_user_meal_stats(
                 user_id=user_id,
                 start_date=start_date,
                 end_date=end_date
@@ -315,32 +451,34 @@ class FoodAnalysisPipeline:
             if not meals:
                 return {"message": "분석할 식사 기록이 없습니다."}
             
-            # 통계 계산
+            # 통계 계산 (식사 목록을 한 번만 순회)
             total_meals = len(meals)
-            avg_calories = sum(meal.total_nutrition.calories for meal in meals) / total_meals
-            avg_protein = sum(meal.total_nutrition.protein for meal in meals) / total_meals
+            total_calories = 0
+            total_protein = 0
+            meal_type_totals = defaultdict(lambda: [0, 0])
+            food_frequency = Counter()
             
-            # 식사 종류별 분석
-            meal_types = {}
             for meal in meals:
-                meal_type = meal.meal_type
-                if meal_type not in meal_types:
-                    meal_types[meal_type] = {"count": 0, "total_calories": 0}
-                meal_types[meal_type]["count"] += 1
-                meal_types[meal_type]["total_calories"] += meal.total_nutrition.calories
+                total_calories += meal.calories
+                total_protein += meal.protein
+                
+                # 식사 종류별 분석
+                totals = meal_type_totals[meal.meal_type]
+                totals[0] += 1
+                totals[1] += meal.calories
+                
+                # 음식별 빈도
+                food_frequency.update(meal.food_names)
+            
+            avg_calories = total_calories / total_meals
+            avg_protein = total_protein / total_meals
+            meal_types = {
+                meal_type: {"count": count, "total_calories": type_calories}
+                for meal_type, (count, type_calories) in meal_type_totals.items()
+            }
             
             # 가장 자주 먹은 음식
-            food_frequency = {}
-            for meal in meals:
-                for food in meal.foods:
-                    food_name = food.name
-                    food_frequency[food_name] = food_frequency.get(food_name, 0) + 1
-            
-            most_frequent_foods = sorted(
-                food_frequency.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:5]
+            most_frequent_foods = food_frequency.most_common(5)
             
             summary = {
                 "period": f"{date_range_days}일간",
@@ -349,13 +487,14 @@ class FoodAnalysisPipeline:
                 "average_protein_per_meal": round(avg_protein, 2),
                 "meal_types_distribution": meal_types,
                 "most_frequent_foods": most_frequent_foods,
-                "analysis_date": datetime.now().isoformat()
+                "analysis_date": now.isoformat()
             }
             
+            self._summary_cache[cache_key] = summary
             return summary
             
         except Exception as e:
-            logger.error(f"Error generating meal analysis summary: {e}")
+            logger.error("Error generating meal analysis summary: %s", e)
             return {"error": "분석 요약 생성 중 오류가 발생했습니다."}
 
 
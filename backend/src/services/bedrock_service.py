@@ -3,18 +3,187 @@ Bedrock 서비스 모듈
 AI 모델을 통한 이미지 분석, 자연어 처리, 코칭 메시지 생성
 """
 
+import asyncio
+import io
 import json
-import base64
-from typing import List, Dict, Any, Optional
+import hashlib
+import os
+import random
+import time
+from collections import deque
+from functools import lru_cache
+from typing import AsyncIterator, List, Dict, Any, Optional
 from botocore.exceptions import ClientError
+from PIL import Image
 
 from ..config.aws_config import aws_config, aws_resources
 from ..models.data_models import FoodItem, NutritionInfo, CoachingMessage, UserProfile
 from ..utils.logger import setup_logger
-from ..utils.helpers import generate_unique_id
+from ..utils.helpers import (
+    generate_unique_id, AsyncTokenBucket, IncrementalJsonScanner, TTLCache,
+    extract_json, fast_json_loads
+)
 
 logger = setup_logger(__name__)
 
+# 작업별 최대 생성 토큰 수 (짧은 작업은 작게 잡아 생성 시간 단축)
+COACHING_MAX_TOKENS = 300
+NLP_MAX_TOKENS = 600
+DEFAULT_MAX_TOKENS = 2000
+
+# 모델이 내부적으로 축소하는 기준 크기 (이보다 큰 이미지는 미리 줄여 전송량과 이미지 토큰 절감)
+BEDROCK_IMAGE_MAX_DIMENSION = 1568
+
+# 코칭 메시지 마이크로 배치: 최대 묶음 크기와 요청을 모으는 최대 대기 시간(초)
+COACHING_BATCH_MAX_SIZE = 8
+COACHING_BATCH_MAX_WAIT = 0.05
+
+# 동시에 진행할 최대 Bedrock 호출 수 (온디맨드 RPS 할당량에 맞춰 조정)
+BEDROCK_MAX_CONCURRENCY = int(os.getenv('BEDROCK_MAX_CONCURRENCY', '8'))
+
+# 프롬프트 응답 캐시 설정 (정확히 같은 프롬프트 → 즉시 재사용)
+PROMPT_CACHE_MAX_SIZE = 1024
+PROMPT_CACHE_TTL = int(os.getenv('BEDROCK_PROMPT_CACHE_TTL', '300'))
+
+# 의미 기반 캐시: 임베딩 코사인 거리가 이 값보다 작으면 재사용 (0이면 사용 안 함)
+SEMANTIC_CACHE_MAX_DISTANCE = float(os.getenv('BEDROCK_SEMANTIC_CACHE_DISTANCE', '0'))
+SEMANTIC_CACHE_MAX_SIZE = 256
+EMBEDDING_MODEL_ID = os.getenv('BEDROCK_EMBEDDING_MODEL_ID', 'amazon.titan-embed-text-v2:0')
+
+# 초당 Bedrock 호출 수 제한 (계정의 모델별 할당량에 맞춰 설정, 0이면 사용 안 함)
+BEDROCK_REQUESTS_PER_SECOND = float(os.getenv('BEDROCK_REQUESTS_PER_SECOND', '0'))
+
+# ThrottlingException 재시도 횟수, 첫 대기 시간(초, 매 회 2배씩 증가)과 최대 대기 시간
+# 실제 대기 시간은 0~계산값 사이에서 무작위로 골라 재시도가 한꺼번에 몰리지 않도록 함
+BEDROCK_THROTTLE_RETRIES = 5
+BEDROCK_THROTTLE_BASE_DELAY = 0.5
+BEDROCK_THROTTLE_MAX_DELAY = 30.0
+
+
+# 프롬프트 템플릿 (고정 문구는 모듈 로드 시 한 번만 만들고 호출마다 변수만 채움)
+_FOOD_ANALYSIS_PROMPT_TMPL = """
+이 음식 이미지를 분석하여 다음 정보를 JSON 형태로 제공해주세요:
+
+1. 이미지에서 식별되는 모든 음식 항목
+2. 각 음식의 예상 섭취량 (총 {people_count}명이 함께 식사한다고 가정하여 1인분 계산)
+3. 각 음식의 영양소 정보 (칼로리, 탄수화물, 단백질, 지방)
+4. 분석 신뢰도 (0-1 사이)
+
+응답 형식:
+{{
+  "foods": [
+    {{
+      "name": "음식명",
+      "quantity": "1인분 섭취량",
+      "nutrition": {{
+        "calories": 칼로리,
+        "carbohydrates": 탄수화물(g),
+        "protein": 단백질(g),
+        "fat": 지방(g)
+      }},
+      "confidence": 신뢰도
+    }}
+  ]
+}}
+
+정확한 분석을 위해 한국 음식 기준으로 영양소를 계산해주세요.
+"""
+
+_COACHING_PROMPT_TMPL = """
+사용자 프로필:
+- 이름: {name}
+- 나이: {age}세
+- 건강 목표: {health_goal}
+- 선호 운동: {preferred_exercises}
+- 목표 칼로리: {target_calories}kcal
+
+최근 식사 기록:
+{meals_summary}
+
+추가 컨텍스트: {context}
+
+위 정보를 바탕으로 개인 맞춤형 코칭 메시지를 생성해주세요.
+- 친근하고 격려하는 톤으로 작성
+- 구체적이고 실행 가능한 조언 포함
+- 100자 내외로 간결하게 작성
+- 사용자의 목표와 현재 상황을 고려한 맞춤형 내용
+"""
+
+_BATCH_COACHING_PROMPT_TMPL = """
+아래 {count}명의 사용자 각각에 대해 코칭 메시지를 하나씩 작성해주세요.
+각 사용자 블록의 지침을 그대로 따르세요.
+
+{sections}
+
+응답은 다른 설명 없이 JSON 문자열 배열 하나로만 작성해주세요.
+배열 길이는 정확히 {count}이고, i번째 원소가 [USER i]의 메시지입니다.
+"""
+
+_NLP_PROMPT_TMPL = """
+사용자 입력: "{user_input}"
+
+사용자 프로필:
+- 건강 목표: {health_goal}
+- 선호 운동: {preferred_exercises}
+
+대화 기록:
+{history_text}
+
+다음 형식으로 분석 결과를 JSON으로 제공해주세요:
+{{
+  "intent": "의도 (food_inquiry, exercise_advice, progress_check, general_chat 등)",
+  "entities": {{
+    "food_items": ["언급된 음식들"],
+    "exercise_types": ["언급된 운동들"],
+    "time_references": ["시간 관련 표현들"]
+  }},
+  "response": "사용자에게 제공할 응답",
+  "confidence": 분석_신뢰도
+}}
+
+친근하고 도움이 되는 응답을 생성해주세요.
+"""
+
+_DIET_PROMPT_TMPL = """
+사용자 프로필:
+- 건강 목표: {health_goal}
+- 식이 제한사항: {dietary_restrictions}
+
+현재 영양소 섭취:
+- 칼로리: {current.calories}kcal
+- 탄수화물: {current.carbohydrates}g
+- 단백질: {current.protein}g
+- 지방: {current.fat}g
+
+목표 영양소:
+- 칼로리: {target.calories}kcal
+- 탄수화물: {target.carbohydrates}g
+- 단백질: {target.protein}g
+- 지방: {target.fat}g
+
+부족한 영양소를 보충할 수 있는 식단을 추천해주세요.
+다음 형식으로 JSON 응답을 제공해주세요:
+
+{{
+  "recommendations": [
+    {{
+      "meal_type": "식사 종류",
+      "foods": ["추천 음식 목록"],
+      "nutrition_benefit": "영양학적 이점",
+      "preparation_tip": "조리 팁"
+    }}
+  ]
+}}
+
+한국 음식 위주로 실용적인 추천을 해주세요.
+"""
+
+
+@lru_cache(maxsize=32)
+def _food_analysis_prompt(people_count: int) -> str:
+    """인원 수별 음식 분석 프롬프트 (인원 수만 바뀌므로 완성된 문자열을 캐시)"""
+    return _FOOD_ANALYSIS_PROMPT_TMPL.format(people_count=people_count)
+
 
 class BedrockService:
     """Bedrock AI 서비스 관리 클래스"""
@@ -24,6 +193,11 @@ class BedrockService:
         self.client = aws_config.bedrock_client
         self.model_id = aws_resources.bedrock_model_id
         self.image_model_id = aws_resources.bedrock_image_model_id
+        self.fast_model_id = aws_resources.bedrock_fast_model_id
+        self.strong_model_id = aws_resources.bedrock_strong_model_id
+        self.performance_config = {'latency': 'optimized'} if aws_resources.bedrock_latency_optimized else None
+        self._semaphore = asyncio.Semaphore(BEDROCK_MAX_CONCURRENCY)
+        self._limiter = AsyncTokenBucket(BEDROCK_REQUESTS_PER_SECOND) if BEDROCK_REQUESTS_PER_SECOND > 0 else None
     
     async def analyze_food_image(
         self,
@@ -41,8 +215,8 @@ class BedrockService:
             분석된 음식 항목 리스트
         """
         try:
-            # 이미지를 base64로 인코딩
-            image_base64 = base64.b64encode(image_data).decode('utf-8')
+            # 큰 이미지는 축소 후 전송 (CPU 작업이므로 스레드에서 실행)
+            image_data = await asyncio.to_thread(self._prepare_image, image_data)
             
             # 프롬프트 구성
             prompt = self._create_food_analysis_prompt(people_count)
@@ -50,7 +224,7 @@ class BedrockService:
             # Bedrock 호출
             response = await self._invoke_bedrock_with_image(
                 prompt=prompt,
-                image_base64=image_base64,
+                image_data=image_data,
                 model_id=self.image_model_id
             )
             
@@ -64,6 +238,50 @@ class BedrockService:
             logger.error(f"Failed to analyze food image: {e}")
             return []
     
+    async def stream_food_analysis(
+        self,
+        image_data: bytes,
+        people_count: int = 1
+    ) -> AsyncIterator[FoodItem]:
+        """
+        음식 이미지 스트리밍 분석 (응답의 음식 항목 JSON이 닫히는 즉시 하나씩 반환)
+        
+        Args:
+            image_data: 이미지 바이트 데이터
+            people_count: 함께 식사한 인원 수
+        
+        Yields:
+            분석된 음식 항목
+        """
+        image_data = await asyncio.to_thread(self._prepare_image, image_data)
+        prompt = self._create_food_analysis_prompt(people_count)
+        
+        # {"foods": [ {...}, ... ]} 에서 배열 원소(깊이 2)를 꺼냄
+        scanner = IncrementalJsonScanner(item_depth=2)
+        text_parts = []
+        item_count = 0
+        
+        async for chunk in self._converse_stream(
+            **self._image_request(prompt, image_data, self.image_model_id)
+        ):
+            text_parts.append(chunk)
+            for item_text in scanner.feed(chunk):
+                try:
+                    food_item = self._food_item_from_dict(fast_json_loads(item_text))
+                except Exception as e:
+                    logger.warning(f"Skipping malformed streamed food item: {e}")
+                    continue
+                item_count += 1
+                yield food_item
+        
+        # 항목 단위로 꺼내지 못했으면 전체 응답을 한 번에 파싱
+        if item_count == 0:
+            for food_item in self._parse_food_analysis_response("".join(text_parts)):
+                item_count += 1
+                yield food_item
+        
+        logger.info(f"Streamed food image analysis: {item_count} items found")
+    
     async def generate_coaching_message(
         self,
         user_profile: UserProfile,
@@ -85,8 +303,13 @@ class BedrockService:
             # 프롬프트 구성
             prompt = self._create_coaching_prompt(user_profile, recent_meals, context)
             
-            # Bedrock 호출
-            response = await self._invoke_bedrock_text(prompt)
+            # Bedrock 호출 (짧은 메시지이므로 빠른 모델 사용)
+            response = await self._invoke_bedrock_text(
+                prompt,
+                model_id=self.fast_model_id,
+                max_tokens=COACHING_MAX_TOKENS,
+                performance_config=self.performance_config
+            )
             
             # 코칭 메시지 생성
             coaching_message = CoachingMessage(
@@ -113,11 +336,92 @@ class BedrockService:
                 priority="normal"
             )
     
+    async def generate_coaching_messages_batch(
+        self,
+        requests: List[tuple[UserProfile, List[Dict[str, Any]], str]]
+    ) -> List[CoachingMessage]:
+        """
+        여러 사용자의 코칭 메시지를 한 번의 Bedrock 호출로 생성
+        
+        Args:
+            requests: (사용자 프로필, 최근 식사 기록, 추가 컨텍스트) 리스트
+        
+        Returns:
+            요청 순서와 같은 코칭 메시지 리스트
+        """
+        if len(requests) == 1:
+            return [await self.generate_coaching_message(*requests[0])]
+        
+        try:
+            prompt = self._create_batch_coaching_prompt(requests)
+            
+            response = await self._invoke_bedrock_text(
+                prompt,
+                model_id=self.fast_model_id,
+                max_tokens=COACHING_MAX_TOKENS * len(requests),
+                performance_config=self.performance_config
+            )
+            
+            contents = self._parse_batch_coaching_response(response, len(requests))
+            
+            messages = [
+                CoachingMessage(
+                    message_id=generate_unique_id("coaching"),
+                    user_id=user_profile.user_id,
+                    message_type="advice",
+                    content=content,
+                    is_voice=False,
+                    priority="normal"
+                )
+                for (user_profile, _, _), content in zip(requests, contents)
+            ]
+            
+            logger.info(f"Generated {len(messages)} coaching messages in one batch")
+            return messages
+            
+        except Exception as e:
+            # 배치 응답을 나눌 수 없으면 사용자별로 개별 생성
+            logger.warning(f"Batch coaching generation failed, falling back to individual calls: {e}")
+            return list(await asyncio.gather(
+                *(self.generate_coaching_message(*request) for request in requests)
+            ))
+    
+    async def stream_coaching_message(
+        self,
+        user_profile: UserProfile,
+        recent_meals: List[Dict[str, Any]],
+        context: str = ""
+    ) -> AsyncIterator[str]:
+        """
+        개인 맞춤형 코칭 메시지를 생성되는 대로 스트리밍
+        
+        Args:
+            user_profile: 사용자 프로필
+            recent_meals: 최근 식사 기록
+            context: 추가 컨텍스트
+        
+        Yields:
+            생성된 메시지 텍스트 조각
+        """
+        prompt = self._create_coaching_prompt(user_profile, recent_meals, context)
+        
+        async for chunk in self._invoke_bedrock_text_stream(
+            prompt,
+            model_id=self.fast_model_id,
+            max_tokens=COACHING_MAX_TOKENS,
+            performance_config=self.performance_config
+        ):
+            yield chunk
+        
+        logger.info(f"Streamed coaching message for user: {user_profile.user_id}")
+    
     async def process_natural_language(
         self,
         user_input: str,
         user_profile: UserProfile,
-        conversation_history: List[Dict[str, str]] = None
+        conversation_history: List[Dict[str, str]] = None,
+        model_id: Optional[str] = None,
+        max_tokens: int = DEFAULT_MAX_TOKENS
     ) -> Dict[str, Any]:
         """
         자연어 처리 및 의도 분석
@@ -126,6 +430,8 @@ class BedrockService:
             user_input: 사용자 입력
             user_profile: 사용자 프로필
             conversation_history: 대화 기록
+            model_id: 사용할 모델 ID (기본값: self.model_id, 짧은 대화 응답은 fast_model_id 권장)
+            max_tokens: 최대 생성 토큰 수 (JSON 목록/계획 등 긴 출력은 기본값 유지)
         
         Returns:
             처리된 결과 (의도, 엔티티, 응답 등)
@@ -135,7 +441,12 @@ class BedrockService:
             prompt = self._create_nlp_prompt(user_input, user_profile, conversation_history)
             
             # Bedrock 호출
-            response = await self._invoke_bedrock_text(prompt)
+            response = await self._invoke_bedrock_text(
+                prompt,
+                model_id=model_id,
+                max_tokens=max_tokens,
+                performance_config=self.performance_config
+            )
             
             # 응답 파싱
             result = self._parse_nlp_response(response)
@@ -175,8 +486,8 @@ class BedrockService:
                 user_profile, current_nutrition, target_nutrition
             )
             
-            # Bedrock 호출
-            response = await self._invoke_bedrock_text(prompt)
+            # Bedrock 호출 (식단 추천은 고성능 모델 사용, 같은 영양 상태면 캐시 재사용 가능)
+            response = await self._invoke_cacheable_text(prompt, model_id=self.strong_model_id)
             
             # 응답 파싱
             recommendations = self._parse_diet_recommendations(response)
@@ -191,108 +502,274 @@ class BedrockService:
     async def _invoke_bedrock_with_image(
         self,
         prompt: str,
-        image_base64: str,
+        image_data: bytes,
         model_id: str
     ) -> str:
         """
-        이미지와 함께 Bedrock 모델 호출
+        이미지와 함께 Bedrock 모델 호출 (Converse는 원본 바이트를 받으므로 base64 인코딩 불필요)
         
         Args:
             prompt: 텍스트 프롬프트
-            image_base64: Base64 인코딩된 이미지
+            image_data: 이미지 바이트 데이터
             model_id: 사용할 모델 ID
         
         Returns:
             모델 응답
         """
-        body = {
-            "anthropic_version": "bedrock-2023-05-31",
-            "max_tokens": 2000,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "image",
-                            "source": {
-                                "type": "base64",
-                                "media_type": "image/jpeg",
-                                "data": image_base64
-                            }
-                        },
-                        {
-                            "type": "text",
-                            "text": prompt
-                        }
-                    ]
-                }
-            ]
-        }
+        response = await self._converse(**self._image_request(prompt, image_data, model_id))
         
-        response = self.client.converse(
-            modelId=model_id,
-            messages=body['messages']
+        return response['output']['message']['content'][0]['text']
+    
+    async def _invoke_bedrock_text(
+        self,
+        prompt: str,
+        model_id: Optional[str] = None,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        performance_config: Optional[Dict[str, str]] = None
+    ) -> str:
+        """
+        텍스트 전용 Bedrock 모델 호출
+        
+        Args:
+            prompt: 텍스트 프롬프트
+            model_id: 사용할 모델 ID (기본값: self.model_id)
+            max_tokens: 최대 생성 토큰 수
+            performance_config: 추론 성능 설정 (예: {'latency': 'optimized'})
+        
+        Returns:
+            모델 응답
+        """
+        response = await self._converse(
+            **self._text_request(prompt, model_id, max_tokens, performance_config)
         )
         
         return response['output']['message']['content'][0]['text']
     
-    async def _invoke_bedrock_text(self, prompt: str) -> str:
+    async def _invoke_cacheable_text(
+        self,
+        prompt: str,
+        model_id: Optional[str] = None,
+        max_tokens: int = DEFAULT_MAX_TOKENS
+    ) -> str:
         """
-        텍스트 전용 Bedrock 모델 호출
+        같은 프롬프트에 같은 답을 재사용해도 되는 분석용 텍스트 호출 (기본 구현은 캐시 없이 호출)
+        
+        코칭 메시지나 대화 응답처럼 매번 새로 생성해야 하는 호출은 _invoke_bedrock_text를 사용합니다.
         
         Args:
             prompt: 텍스트 프롬프트
+            model_id: 사용할 모델 ID (기본값: self.model_id)
+            max_tokens: 최대 생성 토큰 수
         
         Returns:
             모델 응답
         """
-        body = {
-            "anthropic_version": "bedrock-2023-05-31",
-            "max_tokens": 2000,
+        return await self._invoke_bedrock_text(prompt, model_id=model_id, max_tokens=max_tokens)
+    
+    async def _invoke_bedrock_text_stream(
+        self,
+        prompt: str,
+        model_id: Optional[str] = None,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        performance_config: Optional[Dict[str, str]] = None
+    ) -> AsyncIterator[str]:
+        """
+        텍스트 전용 Bedrock 스트리밍 호출 (ConverseStream)
+        
+        Args:
+            prompt: 텍스트 프롬프트
+            model_id: 사용할 모델 ID (기본값: self.model_id)
+            max_tokens: 최대 생성 토큰 수
+            performance_config: 추론 성능 설정
+        
+        Yields:
+            모델이 생성하는 텍스트 조각
+        """
+        request = self._text_request(prompt, model_id, max_tokens, performance_config)
+        
+        async for chunk in self._converse_stream(**request):
+            yield chunk
+    
+    @staticmethod
+    def _prepare_image(image_data: bytes) -> bytes:
+        """
+        Bedrock 전송용 이미지 준비 (최대 변 BEDROCK_IMAGE_MAX_DIMENSION으로 축소 후 JPEG 압축)
+        
+        Args:
+            image_data: 원본 이미지 바이트 데이터
+        
+        Returns:
+            축소된 JPEG 바이트 (이미 작거나 처리 실패 시 원본)
+        """
+        try:
+            image = Image.open(io.BytesIO(image_data))
+            if max(image.size) <= BEDROCK_IMAGE_MAX_DIMENSION:
+                return image_data
+            
+            if image.mode in ('RGBA', 'LA', 'P'):
+                image = image.convert('RGBA')
+                background = Image.new('RGB', image.size, (255, 255, 255))
+                background.paste(image, mask=image.split()[-1])
+                image = background
+            elif image.mode != 'RGB':
+                image = image.convert('RGB')
+            
+            image.thumbnail(
+                (BEDROCK_IMAGE_MAX_DIMENSION, BEDROCK_IMAGE_MAX_DIMENSION),
+                Image.Resampling.LANCZOS
+            )
+            
+            output = io.BytesIO()
+            image.save(output, format='JPEG', quality=85, optimize=True)
+            return output.getvalue()
+            
+        except Exception as e:
+            logger.warning(f"Image resize for Bedrock failed, sending original: {e}")
+            return image_data
+    
+    @staticmethod
+    def _detect_image_format(image_data: bytes) -> str:
+        """매직 바이트로 Converse 이미지 형식 판별 (알 수 없으면 jpeg)"""
+        if image_data.startswith(b'\x89PNG'):
+            return "png"
+        if image_data.startswith(b'GIF8'):
+            return "gif"
+        if image_data[:4] == b'RIFF' and image_data[8:12] == b'WEBP':
+            return "webp"
+        return "jpeg"
+    
+    def _image_request(self, prompt: str, image_data: bytes, model_id: str) -> Dict[str, Any]:
+        """이미지 + 텍스트 Converse 요청 인자 구성"""
+        return {
+            "modelId": model_id,
             "messages": [
                 {
                     "role": "user",
-                    "content": prompt
+                    "content": [
+                        {
+                            "image": {
+                                "format": self._detect_image_format(image_data),
+                                "source": {"bytes": image_data}
+                            }
+                        },
+                        {"text": prompt}
+                    ]
                 }
-            ]
+            ],
+            "inferenceConfig": {"maxTokens": DEFAULT_MAX_TOKENS}
         }
+    
+    def _text_request(
+        self,
+        prompt: str,
+        model_id: Optional[str],
+        max_tokens: int,
+        performance_config: Optional[Dict[str, str]]
+    ) -> Dict[str, Any]:
+        """텍스트 전용 Converse 요청 인자 구성"""
+        request = {
+            "modelId": model_id or self.model_id,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [{"text": prompt}]
+                }
+            ],
+            "inferenceConfig": {"maxTokens": max_tokens}
+        }
+        if performance_config:
+            request["performanceConfig"] = performance_config
+        return request
+    
+    async def _converse_stream(self, **kwargs: Any) -> AsyncIterator[str]:
+        """
+        Bedrock ConverseStream API 호출 후 텍스트 델타만 순서대로 전달
         
-        response = self.client.converse(
-            modelId=self.model_id,
-            messages=body['messages']
-        )
+        aiobotocore가 없으면 동기 스트림을 스레드에서 읽어 큐로 넘깁니다.
         
-        return response['output']['message']['content'][0]['text']
+        Args:
+            **kwargs: converse_stream 호출 인자 (modelId, messages 등)
+        
+        Yields:
+            텍스트 델타
+        """
+        if self._limiter is not None:
+            await self._limiter.acquire()
+        
+        async with self._semaphore:
+            if aws_config.has_async_clients:
+                client = await aws_config.get_bedrock_async_client()
+                response = await client.converse_stream(**kwargs)
+                async for event in response['stream']:
+                    text = event.get('contentBlockDelta', {}).get('delta', {}).get('text')
+                    if text:
+                        yield text
+                return
+            
+            loop = asyncio.get_running_loop()
+            queue: asyncio.Queue = asyncio.Queue()
+            done = object()
+            
+            def pump() -> None:
+                try:
+                    response = self.client.converse_stream(**kwargs)
+                    for event in response['stream']:
+                        text = event.get('contentBlockDelta', {}).get('delta', {}).get('text')
+                        if text:
+                            loop.call_soon_threadsafe(queue.put_nowait, text)
+                except Exception as e:
+                    loop.call_soon_threadsafe(queue.put_nowait, e)
+                finally:
+                    loop.call_soon_threadsafe(queue.put_nowait, done)
+            
+            pump_task = asyncio.ensure_future(asyncio.to_thread(pump))
+            try:
+                while (item := await queue.get()) is not done:
+                    if isinstance(item, Exception):
+                        raise item
+                    yield item
+            finally:
+                await pump_task
+    
+    async def _converse(self, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Bedrock Converse API 호출 (이벤트 루프를 막지 않음)
+        
+        aiobotocore가 설치되어 있으면 비동기 클라이언트로 직접 await하고,
+        없으면 동기 boto3 클라이언트를 스레드에서 실행합니다.
+        호출 속도는 토큰 버킷, 동시 호출 수는 세마포어로 제한하고,
+        ThrottlingException은 지터를 준 지수 백오프로 재시도합니다.
+        
+        Args:
+            **kwargs: converse 호출 인자 (modelId, messages 등)
+        
+        Returns:
+            converse 응답
+        """
+        for attempt in range(BEDROCK_THROTTLE_RETRIES + 1):
+            if self._limiter is not None:
+                await self._limiter.acquire()
+            try:
+                async with self._semaphore:
+                    if aws_config.has_async_clients:
+                        client = await aws_config.get_bedrock_async_client()
+                        return await client.converse(**kwargs)
+                    return await asyncio.to_thread(self.client.converse, **kwargs)
+            except ClientError as e:
+                if (
+                    e.response.get('Error', {}).get('Code') != 'ThrottlingException'
+                    or attempt == BEDROCK_THROTTLE_RETRIES
+                ):
+                    raise
+                delay = random.uniform(
+                    0, min(BEDROCK_THROTTLE_MAX_DELAY, BEDROCK_THROTTLE_BASE_DELAY * (2 ** attempt))
+                )
+                logger.warning(f"Bedrock throttled, retrying in {delay:.2f}s ({attempt + 1}/{BEDROCK_THROTTLE_RETRIES})")
+                await asyncio.sleep(delay)
     
     def _create_food_analysis_prompt(self, people_count: int) -> str:
         """음식 분석용 프롬프트 생성"""
-        return f"""
-이 음식 이미지를 분석하여 다음 정보를 JSON 형태로 제공해주세요:
-
-1. 이미지에서 식별되는 모든 음식 항목
-2. 각 음식의 예상 섭취량 (총 {people_count}명이 함께 식사한다고 가정하여 1인분 계산)
-3. 각 음식의 영양소 정보 (칼로리, 탄수화물, 단백질, 지방)
-4. 분석 신뢰도 (0-1 사이)
-
-응답 형식:
-{{
-  "foods": [
-    {{
-      "name": "음식명",
-      "quantity": "1인분 섭취량",
-      "nutrition": {{
-        "calories": 칼로리,
-        "carbohydrates": 탄수화물(g),
-        "protein": 단백질(g),
-        "fat": 지방(g)
-      }},
-      "confidence": 신뢰도
-    }}
-  ]
-}}
-
-정확한 분석을 위해 한국 음식 기준으로 영양소를 계산해주세요.
-"""
+        return _food_analysis_prompt(people_count)
     
     def _create_coaching_prompt(
         self,
@@ -301,69 +778,46 @@ class BedrockService:
         context: str
     ) -> str:
         """코칭 메시지 생성용 프롬프트 생성"""
-        meals_summary = "\n".join([
+        meals_summary = "\n".join(
             f"- {meal.get('meal_type', '식사')}: {meal.get('total_calories', 0)}kcal"
             for meal in recent_meals[-5:]  # 최근 5끼
-        ])
+        )
         
-        return f"""
-사용자 프로필:
-- 이름: {user_profile.name}
-- 나이: {user_profile.age}세
-- 건강 목표: {user_profile.health_goal.value}
-- 선호 운동: {', '.join([ex.value for ex in user_profile.preferred_exercises])}
-- 목표 칼로리: {user_profile.target_calories}kcal
-
-최근 식사 기록:
-{meals_summary}
-
-추가 컨텍스트: {context}
-
-위 정보를 바탕으로 개인 맞춤형 코칭 메시지를 생성해주세요.
-- 친근하고 격려하는 톤으로 작성
-- 구체적이고 실행 가능한 조언 포함
-- 100자 내외로 간결하게 작성
-- 사용자의 목표와 현재 상황을 고려한 맞춤형 내용
-"""
+        return _COACHING_PROMPT_TMPL.format(
+            **user_profile.to_prompt_context(),
+            meals_summary=meals_summary,
+            context=context
+        )
+    
+    def _create_batch_coaching_prompt(
+        self,
+        requests: List[tuple[UserProfile, List[Dict[str, Any]], str]]
+    ) -> str:
+        """여러 사용자 코칭 메시지를 한 번에 생성하는 프롬프트 생성"""
+        sections = "\n".join(
+            f"[USER {i}]{self._create_coaching_prompt(user_profile, recent_meals, context)}"
+            for i, (user_profile, recent_meals, context) in enumerate(requests, start=1)
+        )
+        
+        return _BATCH_COACHING_PROMPT_TMPL.format(count=len(requests), sections=sections)
     
     def _create_nlp_prompt(
         self,
         user_input: str,
         user_profile: UserProfile,
-        conversation_history: List[Dict[str, str]]
+        conversation_history: Optional[List[Dict[str, str]]]
     ) -> str:
         """자연어 처리용 프롬프트 생성"""
-        history_text = ""
-        if conversation_history:
-            history_text = "\n".join([
-                f"{msg['role']}: {msg['content']}"
-                for msg in conversation_history[-5:]  # 최근 5개 대화
-            ])
-        
-        return f"""
-사용자 입력: "{user_input}"
-
-사용자 프로필:
-- 건강 목표: {user_profile.health_goal.value}
-- 선호 운동: {', '.join([ex.value for ex in user_profile.preferred_exercises])}
-
-대화 기록:
-{history_text}
-
-다음 형식으로 분석 결과를 JSON으로 제공해주세요:
-{{
-  "intent": "의도 (food_inquiry, exercise_advice, progress_check, general_chat 등)",
-  "entities": {{
-    "food_items": ["언급된 음식들"],
-    "exercise_types": ["언급된 운동들"],
-    "time_references": ["시간 관련 표현들"]
-  }},
-  "response": "사용자에게 제공할 응답",
-  "confidence": 분석_신뢰도
-}}
-
-친근하고 도움이 되는 응답을 생성해주세요.
-"""
+        history_text = "\n".join(
+            f"{msg['role']}: {msg['content']}"
+            for msg in (conversation_history or [])[-5:]  # 최근 5개 대화 (없으면 빈 기록)
+        )
+        
+        return _NLP_PROMPT_TMPL.format(
+            **user_profile.to_prompt_context(),
+            user_input=user_input,
+            history_text=history_text
+        )
     
     def _create_diet_recommendation_prompt(
         self,
@@ -372,82 +826,50 @@ class BedrockService:
         target_nutrition: NutritionInfo
     ) -> str:
         """식단 추천용 프롬프트 생성"""
-        return f"""
-사용자 프로필:
-- 건강 목표: {user_profile.health_goal.value}
-- 식이 제한사항: {', '.join(user_profile.dietary_restrictions) if user_profile.dietary_restrictions else '없음'}
-
-현재 영양소 섭취:
-- 칼로리: {current_nutrition.calories}kcal
-- 탄수화물: {current_nutrition.carbohydrates}g
-- 단백질: {current_nutrition.protein}g
-- 지방: {current_nutrition.fat}g
-
-목표 영양소:
-- 칼로리: {target_nutrition.calories}kcal
-- 탄수화물: {target_nutrition.carbohydrates}g
-- 단백질: {target_nutrition.protein}g
-- 지방: {target_nutrition.fat}g
-
-부족한 영양소를 보충할 수 있는 식단을 추천해주세요.
-다음 형식으로 JSON 응답을 제공해주세요:
-
-{{
-  "recommendations": [
-    {{
-      "meal_type": "식사 종류",
-      "foods": ["추천 음식 목록"],
-      "nutrition_benefit": "영양학적 이점",
-      "preparation_tip": "조리 팁"
-    }}
-  ]
-}}
-
-한국 음식 위주로 실용적인 추천을 해주세요.
-"""
+        return _DIET_PROMPT_TMPL.format(
+            **user_profile.to_prompt_context(),
+            current=current_nutrition,
+            target=target_nutrition
+        )
     
     def _parse_food_analysis_response(self, response: str) -> List[FoodItem]:
         """음식 분석 응답 파싱"""
         try:
             # JSON 추출
-            import re
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if not json_match:
+            json_text = extract_json(response)
+            if not json_text:
                 return []
             
-            data = json.loads(json_match.group())
-            food_items = []
-            
-            for food_data in data.get('foods', []):
-                nutrition = NutritionInfo(
-                    calories=food_data['nutrition']['calories'],
-                    carbohydrates=food_data['nutrition']['carbohydrates'],
-                    protein=food_data['nutrition']['protein'],
-                    fat=food_data['nutrition']['fat']
-                )
-                
-                food_item = FoodItem(
-                    name=food_data['name'],
-                    quantity=food_data['quantity'],
-                    nutrition=nutrition,
-                    confidence=food_data['confidence']
-                )
-                
-                food_items.append(food_item)
+            data = fast_json_loads(json_text)
             
-            return food_items
+            return [self._food_item_from_dict(food_data) for food_data in data.get('foods', [])]
             
         except Exception as e:
             logger.error(f"Failed to parse food analysis response: {e}")
             return []
     
+    def _food_item_from_dict(self, food_data: Dict[str, Any]) -> FoodItem:
+        """응답 JSON의 음식 항목 하나를 FoodItem으로 변환"""
+        nutrition = NutritionInfo(
+            calories=food_data['nutrition']['calories'],
+            carbohydrates=food_data['nutrition']['carbohydrates'],
+            protein=food_data['nutrition']['protein'],
+            fat=food_data['nutrition']['fat']
+        )
+        
+        return FoodItem(
+            name=food_data['name'],
+            quantity=food_data['quantity'],
+            nutrition=nutrition,
+            confidence=food_data['confidence']
+        )
+    
     def _parse_nlp_response(self, response: str) -> Dict[str, Any]:
         """자연어 처리 응답 파싱"""
         try:
-            import re
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
+            json_text = extract_json(response)
+            if json_text:
+                return fast_json_loads(json_text)
             else:
                 return {
                     "intent": "general_chat",
@@ -464,13 +886,29 @@ class BedrockService:
                 "confidence": 0.0
             }
     
+    def _parse_batch_coaching_response(self, response: str, count: int) -> List[str]:
+        """
+        배치 코칭 응답(JSON 문자열 배열) 파싱
+        
+        Raises:
+            ValueError: 배열을 찾을 수 없거나 길이가 맞지 않는 경우
+        """
+        json_text = extract_json(response, opener="[")
+        if not json_text:
+            raise ValueError("No JSON array in batch coaching response")
+        
+        contents = fast_json_loads(json_text)
+        if len(contents) != count or not all(isinstance(content, str) for content in contents):
+            raise ValueError(f"Expected {count} coaching messages, got {len(contents)}")
+        
+        return [content.strip() for content in contents]
+    
     def _parse_diet_recommendations(self, response: str) -> List[Dict[str, Any]]:
         """식단 추천 응답 파싱"""
         try:
-            import re
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                data = json.loads(json_match.group())
+            json_text = extract_json(response)
+            if json_text:
+                data = fast_json_loads(json_text)
                 return data.get('recommendations', [])
             else:
                 return []
@@ -479,5 +917,246 @@ class BedrockService:
             return []
 
 
+
+class CachedBedrockService(BedrockService):
+    """
+    프롬프트 캐시를 앞에 둔 Bedrock 서비스
+    
+    이미지 분석과 식단 추천처럼 결과를 재사용해도 되는 분석 호출만 캐시하고,
+    코칭 메시지와 대화 응답은 매번 새로 생성합니다.
+    
+    1단계: 공백을 정규화한 프롬프트의 해시로 정확히 일치하는 응답 재사용
+    2단계 (선택): Titan 임베딩 코사인 거리가 임계값 이내인 이전 응답 재사용
+    """
+    
+    def __init__(self):
+        """캐시 초기화"""
+        super().__init__()
+        self._prompt_cache = TTLCache(maxsize=PROMPT_CACHE_MAX_SIZE, ttl=PROMPT_CACHE_TTL)
+        # (모델 ID, 임베딩, 응답, 만료 시각)
+        self._semantic_cache: deque = deque(maxlen=SEMANTIC_CACHE_MAX_SIZE)
+    
+    async def _invoke_cacheable_text(
+        self,
+        prompt: str,
+        model_id: Optional[str] = None,
+        max_tokens: int = DEFAULT_MAX_TOKENS
+    ) -> str:
+        """캐시 조회 후 없으면 Bedrock 호출"""
+        model_id = model_id or self.model_id
+        key = self._prompt_key(prompt, model_id, str(max_tokens))
+        cached = self._prompt_cache.get(key)
+        if cached is not None:
+            logger.info("Prompt cache hit")
+            return cached
+        
+        embedding = None
+        if SEMANTIC_CACHE_MAX_DISTANCE > 0:
+            embedding = await self._embed(prompt)
+            if embedding:
+                # 내적 계산은 이벤트 루프 밖에서 수행 (deque는 루프에서만 바뀌므로 스냅샷을 넘김)
+                cached = await asyncio.to_thread(
+                    self._find_similar, model_id, embedding, list(self._semantic_cache)
+                )
+            if cached is not None:
+                logger.info("Semantic prompt cache hit")
+                self._prompt_cache[key] = cached
+                return cached
+        
+        response = await self._invoke_bedrock_text(prompt, model_id=model_id, max_tokens=max_tokens)
+        
+        self._prompt_cache[key] = response
+        if embedding:
+            self._semantic_cache.append((model_id, embedding, response, time.monotonic() + PROMPT_CACHE_TTL))
+        return response
+    
+    async def _invoke_bedrock_with_image(
+        self,
+        prompt: str,
+        image_data: bytes,
+        model_id: str
+    ) -> str:
+        """같은 이미지 + 프롬프트 조합이면 캐시된 응답 재사용"""
+        image_digest = hashlib.blake2b(image_data, digest_size=16).hexdigest()
+        key = self._prompt_key(prompt, model_id, image_digest)
+        cached = self._prompt_cache.get(key)
+        if cached is not None:
+            logger.info("Image prompt cache hit")
+            return cached
+        
+        response = await super()._invoke_bedrock_with_image(prompt, image_data, model_id)
+        
+        self._prompt_cache[key] = response
+        return response
+    
+    @staticmethod
+    def _prompt_key(prompt: str, *extra: str) -> str:
+        """공백 차이를 무시한 캐시 키 생성"""
+        hasher = hashlib.blake2b(" ".join(prompt.split()).encode('utf-8'), digest_size=16)
+        for part in extra:
+            hasher.update(b"\x1f")
+            hasher.update(part.encode('utf-8'))
+        return hasher.hexdigest()
+    
+    async def _embed(self, text: str) -> Optional[List[float]]:
+        """
+        Titan 임베딩 생성 (정규화된 벡터)
+        
+        Args:
+            text: 임베딩할 텍스트
+        
+        Returns:
+            임베딩 벡터 또는 None
+        """
+        try:
+            response = await asyncio.to_thread(
+                self.client.invoke_model,
+                modelId=EMBEDDING_MODEL_ID,
+                body=json.dumps({"inputText": text, "normalize": True})
+            )
+            return json.loads(response['body'].read())['embedding']
+        except Exception as e:
+            logger.warning(f"Failed to embed prompt for semantic cache: {e}")
+            return None
+    
+    @staticmethod
+    def _find_similar(
+        model_id: str,
+        embedding: List[float],
+        entries: List[tuple[str, List[float], str, float]]
+    ) -> Optional[str]:
+        """임계값 이내로 가장 가까운 캐시 응답 조회 (정규화 벡터이므로 거리 = 1 - 내적)"""
+        now = time.monotonic()
+        best_response = None
+        best_distance = SEMANTIC_CACHE_MAX_DISTANCE
+        
+        for cached_model_id, cached_embedding, response, expires_at in entries:
+            if cached_model_id != model_id or expires_at < now:
+                continue
+            distance = 1.0 - sum(a * b for a, b in zip(embedding, cached_embedding))
+            if distance < best_distance:
+                best_response, best_distance = response, distance
+        
+        return best_response
+
+
+class CoachingMessageBatcher:
+    """
+    동시에 들어온 코칭 메시지 요청을 짧게 모아 한 번의 Bedrock 호출로 처리하는 마이크로 배처
+    
+    첫 요청 후 최대 COACHING_BATCH_MAX_WAIT초 또는 COACHING_BATCH_MAX_SIZE개까지 모아서 전송합니다.
+    """
+    
+    def __init__(
+        self,
+        service: BedrockService,
+        max_batch_size: int = COACHING_BATCH_MAX_SIZE,
+        max_wait: float = COACHING_BATCH_MAX_WAIT
+    ):
+        self.service = service
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._dispatches: set = set()
+    
+    async def submit(
+        self,
+        user_profile: UserProfile,
+        recent_meals: List[Dict[str, Any]],
+        context: str = ""
+    ) -> CoachingMessage:
+        """
+        코칭 메시지 요청을 배치에 넣고 결과를 기다림
+        
+        Args:
+            user_profile: 사용자 프로필
+            recent_meals: 최근 식사 기록
+            context: 추가 컨텍스트
+        
+        Returns:
+            생성된 코칭 메시지
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._collect())
+        
+        future = loop.create_future()
+        self._queue.put_nowait(((user_profile, recent_meals, context), future))
+        return await future
+    
+    async def _collect(self) -> None:
+        """요청을 모아 배치 단위로 전송 (전송은 기다리지 않고 다음 배치를 모음)"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            
+            try:
+                while len(batch) < self.max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # 모으던 중 종료되면 이미 꺼낸 요청도 취소
+                for _, future in batch:
+                    future.cancel()
+                raise
+            
+            task = loop.create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+    
+    async def _dispatch(self, batch: List[tuple[tuple, asyncio.Future]]) -> None:
+        """배치 하나를 생성하고 각 요청자에게 결과 전달"""
+        try:
+            messages = await self.service.generate_coaching_messages_batch(
+                [request for request, _ in batch]
+            )
+            if len(messages) != len(batch):
+                raise ValueError(f"Expected {len(batch)} coaching messages, got {len(messages)}")
+            for (_, future), message in zip(batch, messages):
+                if not future.done():
+                    future.set_result(message)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            # 전송이 취소된 경우 요청자가 무한정 기다리지 않도록 함께 취소
+            for _, future in batch:
+                if not future.done():
+                    future.cancel()
+    
+    async def aclose(self) -> None:
+        """수집 태스크와 진행 중인 배치 전송을 취소하고 대기 중인 요청을 정리 (애플리케이션 종료 시 호출)"""
+        # 다른(이미 닫힌) 이벤트 루프의 태스크는 기다릴 수 없으므로 참조만 정리
+        if self._loop is asyncio.get_running_loop():
+            tasks = list(self._dispatches)
+            if self._worker is not None:
+                tasks.append(self._worker)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            
+            # 큐에 남아 아직 배치로 묶이지 않은 요청도 취소
+            while self._queue is not None and not self._queue.empty():
+                _, future = self._queue.get_nowait()
+                future.cancel()
+        
+        self._loop = None
+        self._queue = None
+        self._worker = None
+        self._dispatches.clear()
+
+
 # 전역 인스턴스
-bedrock_service = BedrockService()
\ No newline at end of file
+bedrock_service = CachedBedrockService()
+coaching_batcher = CoachingMessageBatcher(bedrock_service)
\ No newline at end of file
@@ -9,7 +9,7 @@ from datetime import datetime, timedelta
 from botocore.exceptions import ClientError
 
 from ..config.aws_config import aws_config, aws_resources
-from ..models.data_models import UserProfile, MealRecord, ScheduleEvent, CoachingMessage
+from ..models.data_models import UserProfile, MealRecord, MealStats, ScheduleEvent, CoachingMessage, FoodItem
 from ..utils.logger import setup_logger
 from ..utils.helpers import format_datetime
 
@@ -25,6 +25,7 @@ class DynamoDBService:
         self.diet_table = aws_resources.diet_table
         self.schedule_table = aws_resources.schedule_table
         self.user_table = aws_resources.user_table
+        self.image_analysis_table = aws_resources.image_analysis_table
     
     # 사용자 프로필 관리
     async def save_user_profile(self, user_profile: UserProfile) -> bool:
@@ -148,6 +149,116 @@ class DynamoDBService:
             logger.error(f"Unexpected error saving meal record: {e}")
             return False
     
+    async def get_meal_record(self, user_id: str, meal_id: str) -> Optional[MealRecord]:
+        """
+        단일 식사 기록 조회 (user_id + meal_id 복합 키로 GetItem)
+        
+        Args:
+            user_id: 사용자 ID
+            meal_id: 식사 ID
+        
+        Returns:
+            식사 기록 객체 또는 None
+        """
+        try:
+            response = self.client.get_item(
+                TableName=self.diet_table,
+                Key={
+                    'user_id': {'S': user_id},
+                    'meal_id': {'S': meal_id}
+                }
+            )
+            
+            if 'Item' not in response:
+                return None
+            
+            return self._dynamodb_item_to_meal_record(response['Item'])
+            
+        except ClientError as e:
+            logger.error(f"Failed to get meal record: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error getting meal record: {e}")
+            return None
+    
+    # 이미지 분석 결과 캐시 (이미지 해시 + 인원 수 기준)
+    async def get_food_items_by_hash(
+        self,
+        user_id: str,
+        image_hash: str,
+        people_count: int
+    ) -> Optional[List[FoodItem]]:
+        """
+        같은 이미지의 이전 분석 결과 조회
+        
+        Args:
+            user_id: 사용자 ID
+            image_hash: 이미지 내용 해시
+            people_count: 함께 식사한 인원 수
+        
+        Returns:
+            음식 항목 리스트 또는 None
+        """
+        try:
+            response = self.client.get_item(
+                TableName=self.image_analysis_table,
+                Key={
+                    'user_id': {'S': user_id},
+                    'image_key': {'S': f"{image_hash}#{people_count}"}
+                }
+            )
+            
+            if 'Item' not in response:
+                return None
+            
+            foods_data = json.loads(response['Item']['foods']['S'])
+            return [FoodItem(**food_data) for food_data in foods_data]
+            
+        except ClientError as e:
+            logger.error(f"Failed to get cached image analysis: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error getting cached image analysis: {e}")
+            return None
+    
+    async def save_food_items_by_hash(
+        self,
+        user_id: str,
+        image_hash: str,
+        people_count: int,
+        food_items: List[FoodItem]
+    ) -> bool:
+        """
+        이미지 분석 결과 저장
+        
+        Args:
+            user_id: 사용자 ID
+            image_hash: 이미지 내용 해시
+            people_count: 함께 식사한 인원 수
+            food_items: 분석된 음식 항목 리스트
+        
+        Returns:
+            저장 성공 여부
+        """
+        try:
+            self.client.put_item(
+                TableName=self.image_analysis_table,
+                Item={
+                    'user_id': {'S': user_id},
+                    'image_key': {'S': f"{image_hash}#{people_count}"},
+                    'foods': {'S': json.dumps([food.dict() for food in food_items], ensure_ascii=False)},
+                    'created_at': {'S': format_datetime(datetime.now())}
+                }
+            )
+            return True
+            
+        except ClientError as e:
+            logger.error(f"Failed to save image analysis: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Unexpected error saving image analysis: {e}")
+            return False
+    
     async def get_user_meals(
         self,
         user_id: str,
@@ -168,39 +279,10 @@ class DynamoDBService:
             식사 기록 리스트
         """
         try:
-            # 쿼리 조건 구성
-            key_condition = 'user_id = :user_id'
-            expression_values = {':user_id': {'S': user_id}}
-            
-            if start_date and end_date:
-                key_condition += ' AND #ts BETWEEN :start_date AND :end_date'
-                expression_values.update({
-                    ':start_date': {'S': format_datetime(start_date)},
-                    ':end_date': {'S': format_datetime(end_date)}
-                })
-            
-            if start_date and end_date:
-                response = self.client.scan(
-                    TableName=self.diet_table,
-                    FilterExpression='user_id = :user_id AND #ts BETWEEN :start_date AND :end_date',
-                    ExpressionAttributeValues={
-                        ':user_id': {'S': user_id},
-                        ':start_date': {'S': format_datetime(start_date)},
-                        ':end_date': {'S': format_datetime(end_date)}
-                    },
-                    ExpressionAttributeNames={'#ts': 'timestamp'},
-                    Limit=limit
-                )
-            else:
-                response = self.client.scan(
-                    TableName=self.diet_table,
-                    FilterExpression='user_id = :user_id',
-                    ExpressionAttributeValues={':user_id': {'S': user_id}},
-                    Limit=limit
-                )
+            items = self._scan_user_meals(user_id, start_date, end_date, limit)
             
             meals = []
-            for item in response.get('Items', []):
+            for item in items:
                 meal = self._dynamodb_item_to_meal_record(item)
                 if meal:
                     meals.append(meal)
@@ -215,6 +297,103 @@ class DynamoDBService:
             logger.error(f"Unexpected error getting user meals: {e}")
             return []
     
+    async def get_user_meal_stats(
+        self,
+        user_id: str,
+        start_date: datetime,
+        end_date: datetime,
+        limit: int = 50
+    ) -> List[MealStats]:
+        """
+        식사 통계용 경량 조회 (meal_type, total_nutrition, foods 속성만 가져옴)
+        
+        Args:
+            user_id: 사용자 ID
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            limit: 최대 조회 개수
+        
+        Returns:
+            식사 통계 레코드 리스트
+        """
+        try:
+            items = self._scan_user_meals(
+                user_id, start_date, end_date, limit,
+                projection=('meal_type', 'total_nutrition', 'foods')
+            )
+            
+            stats = []
+            for item in items:
+                try:
+                    nutrition = json.loads(item['total_nutrition']['S'])
+                    foods = json.loads(item['foods']['S'])
+                    stats.append(MealStats(
+                        meal_type=item['meal_type']['S'],
+                        calories=nutrition['calories'],
+                        protein=nutrition['protein'],
+                        food_names=[food['name'] for food in foods]
+                    ))
+                except (KeyError, TypeError, json.JSONDecodeError) as e:
+                    logger.error(f"Failed to convert DynamoDB item to MealStats: {e}")
+            
+            return stats
+            
+        except ClientError as e:
+            logger.error(f"Failed to get user meal stats: {e}")
+            return []
+        except Exception as e:
+            logger.error(f"Unexpected error getting user meal stats: {e}")
+            return []
+    
+    def _scan_user_meals(
+        self,
+        user_id: str,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        limit: int,
+        projection: Optional[tuple[str, ...]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        사용자 식사 기록 원본 아이템 조회
+        
+        Args:
+            user_id: 사용자 ID
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            limit: 최대 조회 개수
+            projection: 가져올 속성 이름 (None이면 전체)
+        
+        Returns:
+            DynamoDB 아이템 리스트
+        """
+        scan_kwargs = {
+            'TableName': self.diet_table,
+            'FilterExpression': 'user_id = :user_id',
+            'ExpressionAttributeValues': {':user_id': {'S': user_id}},
+            'Limit': limit
+        }
+        attribute_names = {}
+        
+        if start_date and end_date:
+            scan_kwargs['FilterExpression'] += ' AND #ts BETWEEN :start_date AND :end_date'
+            scan_kwargs['ExpressionAttributeValues'].update({
+                ':start_date': {'S': format_datetime(start_date)},
+                ':end_date': {'S': format_datetime(end_date)}
+            })
+            attribute_names['#ts'] = 'timestamp'
+        
+        if projection:
+            # 예약어 충돌을 피하기 위해 모든 속성을 별칭으로 지정
+            aliases = [f"#p{i}" for i in range(len(projection))]
+            attribute_names.update(zip(aliases, projection))
+            scan_kwargs['ProjectionExpression'] = ', '.join(aliases)
+        
+        if attribute_names:
+            scan_kwargs['ExpressionAttributeNames'] = attribute_names
+        
+        response = self.client.scan(**scan_kwargs)
+        return response.get('Items', [])
+    
     async def get_daily_nutrition_summary(
         self,
         user_id: str,
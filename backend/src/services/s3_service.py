@@ -3,8 +3,10 @@ S3 서비스 모듈
 이미지 업로드, 다운로드, 관리 기능
 """
 
+import asyncio
 import os
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import IO, Optional, Dict, Any
 from botocore.exceptions import ClientError
 from PIL import Image
 import io
@@ -16,6 +18,26 @@ from ..utils.helpers import generate_unique_id, sanitize_filename
 logger = setup_logger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _parse_s3_url(s3_url: str, buckets: tuple[str, ...], region: str) -> Optional[tuple[str, str]]:
+    """
+    S3 URL을 (버킷, 키)로 파싱 (같은 URL 반복 조회 시 캐시 사용)
+    
+    Args:
+        s3_url: S3 URL
+        buckets: 확인할 버킷 이름 (앞에서부터 우선)
+        region: AWS 리전
+    
+    Returns:
+        (버킷, 키) 튜플 또는 None
+    """
+    for bucket in buckets:
+        if f"{bucket}.s3." in s3_url:
+            parts = s3_url.split(f"{bucket}.s3.{region}.amazonaws.com/")
+            return (bucket, parts[1]) if len(parts) > 1 else None
+    return None
+
+
 class S3Service:
     """S3 서비스 관리 클래스"""
     
@@ -46,13 +68,7 @@ class S3Service:
         """
         try:
             # 파일명 정리 및 고유 키 생성
-            clean_filename = sanitize_filename(filename)
-            file_extension = os.path.splitext(clean_filename)[1].lower()
-            
-            if meal_id:
-                s3_key = f"meals/{user_id}/{meal_id}/{generate_unique_id()}{file_extension}"
-            else:
-                s3_key = f"images/{user_id}/{generate_unique_id()}{file_extension}"
+            clean_filename, file_extension, s3_key = self._build_image_key(user_id, filename, meal_id)
             
             # 이미지 최적화
             optimized_image = await self._optimize_image(image_data)
@@ -71,7 +87,7 @@ class S3Service:
             )
             
             # URL 생성
-            s3_url = f"https://{self.image_bucket}.s3.{aws_config.region}.amazonaws.com/{s3_key}"
+            s3_url = self._build_image_url(s3_key)
             
             logger.info(f"Image uploaded successfully: {s3_url}")
             return s3_url
@@ -83,6 +99,93 @@ class S3Service:
             logger.error(f"Unexpected error during image upload: {e}")
             return None
     
+    async def upload_image_stream(
+        self,
+        image_stream: IO[bytes],
+        user_id: str,
+        filename: str,
+        meal_id: Optional[str] = None,
+        image_hash: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        이미지 스트림 업로드 (전체 바이트를 메모리에 올리지 않음)
+        
+        Args:
+            image_stream: 이미지 파일 객체 (읽기 가능한 바이너리 스트림)
+            user_id: 사용자 ID
+            filename: 원본 파일명
+            meal_id: 식사 ID (선택사항)
+            image_hash: 이미지 내용 해시 (지정 시 해시 기반 키로 저장하여 중복 업로드 감지)
+        
+        Returns:
+            업로드된 이미지의 S3 URL
+        """
+        try:
+            clean_filename, file_extension, s3_key = self._build_image_key(user_id, filename, meal_id, image_hash)
+            
+            # 이미지 최적화 (실패 시 원본 스트림 그대로 업로드)
+            optimized_stream = await self._optimize_image_stream(image_stream)
+            
+            # S3 업로드 (upload_fileobj는 큰 파일을 멀티파트로 나눠 전송, 블로킹 호출이므로 스레드에서 실행)
+            await asyncio.to_thread(
+                self.client.upload_fileobj,
+                optimized_stream,
+                self.image_bucket,
+                s3_key,
+                ExtraArgs={
+                    'ContentType': self._get_content_type(file_extension),
+                    'Metadata': {
+                        'user_id': user_id,
+                        'original_filename': clean_filename,
+                        'meal_id': meal_id or ''
+                    }
+                }
+            )
+            
+            s3_url = self._build_image_url(s3_key)
+            
+            logger.info(f"Image stream uploaded successfully: {s3_url}")
+            return s3_url
+            
+        except ClientError as e:
+            logger.error(f"Failed to upload image stream: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error during image stream upload: {e}")
+            return None
+    
+    async def find_image_by_hash(
+        self,
+        user_id: str,
+        image_hash: str,
+        filename: str
+    ) -> Optional[str]:
+        """
+        같은 내용의 이미지가 이미 업로드되어 있는지 확인
+        
+        Args:
+            user_id: 사용자 ID
+            image_hash: 이미지 내용 해시
+            filename: 원본 파일명 (확장자 확인용)
+        
+        Returns:
+            기존 이미지의 S3 URL (없으면 None)
+        """
+        try:
+            _, _, s3_key = self._build_image_key(user_id, filename, image_hash=image_hash)
+            
+            self.client.head_object(Bucket=self.image_bucket, Key=s3_key)
+            
+            return self._build_image_url(s3_key)
+            
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') not in ('404', 'NoSuchKey', 'NotFound'):
+                logger.error(f"Failed to check existing image: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error checking existing image: {e}")
+            return None
+    
     async def download_image(self, s3_url: str) -> Optional[bytes]:
         """
         이미지 다운로드
@@ -194,31 +297,98 @@ class S3Service:
             최적화된 이미지 데이터
         """
         try:
-            # PIL로 이미지 열기
-            image = Image.open(io.BytesIO(image_data))
-            
-            # RGBA를 RGB로 변환 (JPEG 호환성)
-            if image.mode in ('RGBA', 'LA', 'P'):
-                background = Image.new('RGB', image.size, (255, 255, 255))
-                if image.mode == 'P':
-                    image = image.convert('RGBA')
-                background.paste(image, mask=image.split()[-1] if image.mode == 'RGBA' else None)
-                image = background
-            
-            # 크기 조정 (최대 1920x1080)
-            max_size = (1920, 1080)
-            image.thumbnail(max_size, Image.Resampling.LANCZOS)
-            
-            # 최적화된 이미지를 바이트로 변환
-            output = io.BytesIO()
-            image.save(output, format='JPEG', quality=85, optimize=True)
-            
+            output = await asyncio.to_thread(self._encode_optimized_jpeg, io.BytesIO(image_data))
             return output.getvalue()
             
         except Exception as e:
             logger.warning(f"Image optimization failed, using original: {e}")
             return image_data
     
+    async def _optimize_image_stream(self, image_stream: IO[bytes]) -> IO[bytes]:
+        """
+        이미지 스트림 최적화 (크기 조정 및 압축)
+        
+        Args:
+            image_stream: 원본 이미지 스트림
+        
+        Returns:
+            최적화된 이미지 스트림 (실패 시 처음으로 되감은 원본 스트림)
+        """
+        try:
+            return await asyncio.to_thread(self._encode_optimized_jpeg, image_stream)
+            
+        except Exception as e:
+            logger.warning(f"Image optimization failed, using original: {e}")
+            image_stream.seek(0)
+            return image_stream
+    
+    @staticmethod
+    def _encode_optimized_jpeg(source: IO[bytes]) -> io.BytesIO:
+        """
+        이미지를 최대 1920x1080으로 줄이고 JPEG로 압축 (CPU 작업이므로 스레드에서 호출)
+        
+        Args:
+            source: 원본 이미지 스트림
+        
+        Returns:
+            처음으로 되감은 JPEG 스트림
+        """
+        # PIL로 이미지 열기
+        image = Image.open(source)
+        
+        # RGBA를 RGB로 변환 (JPEG 호환성)
+        if image.mode in ('RGBA', 'LA', 'P'):
+            background = Image.new('RGB', image.size, (255, 255, 255))
+            if image.mode == 'P':
+                image = image.convert('RGBA')
+            background.paste(image, mask=image.split()[-1] if image.mode == 'RGBA' else None)
+            image = background
+        
+        # 크기 조정 (최대 1920x1080)
+        image.thumbnail((1920, 1080), Image.Resampling.LANCZOS)
+        
+        # 최적화된 이미지를 스트림으로 변환
+        output = io.BytesIO()
+        image.save(output, format='JPEG', quality=85, optimize=True)
+        output.seek(0)
+        
+        return output
+    
+    def _build_image_key(
+        self,
+        user_id: str,
+        filename: str,
+        meal_id: Optional[str] = None,
+        image_hash: Optional[str] = None
+    ) -> tuple[str, str, str]:
+        """
+        이미지 업로드용 S3 키 생성
+        
+        Args:
+            user_id: 사용자 ID
+            filename: 원본 파일명
+            meal_id: 식사 ID (선택사항)
+            image_hash: 이미지 내용 해시 (선택사항, 지정 시 우선)
+        
+        Returns:
+            (정리된 파일명, 확장자, S3 키)
+        """
+        clean_filename = sanitize_filename(filename)
+        file_extension = os.path.splitext(clean_filename)[1].lower()
+        
+        if image_hash:
+            s3_key = f"meals/{user_id}/images/{image_hash}{file_extension}"
+        elif meal_id:
+            s3_key = f"meals/{user_id}/{meal_id}/{generate_unique_id()}{file_extension}"
+        else:
+            s3_key = f"images/{user_id}/{generate_unique_id()}{file_extension}"
+        
+        return clean_filename, file_extension, s3_key
+    
+    def _build_image_url(self, s3_key: str) -> str:
+        """이미지 버킷 객체의 S3 URL 생성"""
+        return f"https://{self.image_bucket}.s3.{aws_config.region}.amazonaws.com/{s3_key}"
+    
     def _get_content_type(self, file_extension: str) -> str:
         """
         파일 확장자에 따른 Content-Type 반환
@@ -249,16 +419,8 @@ class S3Service:
         Returns:
             추출된 S3 키
         """
-        try:
-            # URL 파싱하여 키 추출
-            if f"{self.image_bucket}.s3." in s3_url:
-                return s3_url.split(f"{self.image_bucket}.s3.{aws_config.region}.amazonaws.com/")[1]
-            elif f"{self.profile_bucket}.s3." in s3_url:
-                return s3_url.split(f"{self.profile_bucket}.s3.{aws_config.region}.amazonaws.com/")[1]
-            else:
-                return None
-        except IndexError:
-            return None
+        parsed = _parse_s3_url(s3_url, (self.image_bucket, self.profile_bucket), aws_config.region)
+        return parsed[1] if parsed else None
     
     async def list_user_images(self, user_id: str) -> list[str]:
         """
@@ -0,0 +1,73 @@
+"""
+수치 계산 가속 모듈
+numba가 설치되어 있으면 여러 사용자 일괄 계산을 JIT 컴파일해 병렬로 처리하고,
+없으면 같은 공식을 순수 Python으로 계산
+"""
+
+from typing import List, Sequence
+
+try:
+    # 선택 의존성: 코호트 단위 통계처럼 많은 사용자를 한 번에 계산할 때만 의미가 있음
+    import numpy as np
+    from numba import njit, prange
+except ImportError:
+    np = None
+    njit = None
+
+
+def bmr_male(weight: float, height: float, age: float) -> float:
+    """남성 기초대사율 (Harris-Benedict 공식)"""
+    return 88.362 + (13.397 * weight) + (4.799 * height) - (5.677 * age)
+
+
+def bmr_female(weight: float, height: float, age: float) -> float:
+    """여성 기초대사율 (Harris-Benedict 공식)"""
+    return 447.593 + (9.247 * weight) + (3.098 * height) - (4.330 * age)
+
+
+if njit is not None:
+    # fastmath는 연산 재배치/FMA로 스칼라 공식과 결과가 달라질 수 있어 사용하지 않음
+    @njit(cache=True, parallel=True, fastmath=False)
+    def _bmr_batch_jit(weights, heights, ages, is_male):
+        """기초대사율 배열 계산 (numba 병렬 루프)"""
+        result = np.empty(weights.shape[0])
+        for i in prange(weights.shape[0]):
+            if is_male[i]:
+                result[i] = 88.362 + (13.397 * weights[i]) + (4.799 * heights[i]) - (5.677 * ages[i])
+            else:
+                result[i] = 447.593 + (9.247 * weights[i]) + (3.098 * heights[i]) - (4.330 * ages[i])
+        return result
+
+
+def bmr_batch(
+    weights: Sequence[float],
+    heights: Sequence[float],
+    ages: Sequence[float],
+    genders: Sequence[str]
+) -> List[float]:
+    """
+    여러 사용자의 기초대사율 일괄 계산 (반올림 전 값)
+
+    Args:
+        weights: 체중 목록 (kg)
+        heights: 신장 목록 (cm)
+        ages: 나이 목록
+        genders: 성별 목록 (male/female)
+
+    Returns:
+        입력 순서와 같은 기초대사율 목록
+    """
+    is_male = [gender.lower() == 'male' for gender in genders]
+
+    if njit is None:
+        return [
+            bmr_male(weight, height, age) if male else bmr_female(weight, height, age)
+            for weight, height, age, male in zip(weights, heights, ages, is_male)
+        ]
+
+    return _bmr_batch_jit(
+        np.asarray(weights, dtype=np.float64),
+        np.asarray(heights, dtype=np.float64),
+        np.asarray(ages, dtype=np.float64),
+        np.asarray(is_male, dtype=np.bool_)
+    ).tolist()
@@ -3,13 +3,30 @@
 재사용 가능한 헬퍼 함수 모음
 """
 
-import uuid
+import os
 import hashlib
 import base64
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterator, Optional, List
 import json
+import asyncio
 import re
+import time
+from collections import OrderedDict
+
+from ._fast_math import bmr_male, bmr_female, bmr_batch
+
+
+# 자주 쓰는 정규식은 모듈 로드 시 한 번만 컴파일
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_FILENAME_RE = re.compile(r'[^\w\-_\.]')
+_DUP_UNDERSCORE_RE = re.compile(r'_+')
+
+try:
+    # 선택 의존성: 설치되어 있으면 표준 json보다 빠른 orjson으로 파싱
+    import orjson
+except ImportError:
+    orjson = None
 
 
 def generate_unique_id(prefix: str = "") -> str:
@@ -22,13 +39,27 @@ def generate_unique_id(prefix: str = "") -> str:
     Returns:
         생성된 고유 ID
     """
-    unique_id = str(uuid.uuid4())
+    # UUID 객체를 만들지 않고 128비트 난수를 바로 hex 문자열로 변환
+    unique_id = os.urandom(16).hex()
     return f"{prefix}_{unique_id}" if prefix else unique_id
 
 
 def generate_hash(data: str) -> str:
     """
-    데이터 해시 생성
+    데이터 해시 생성 (캐시 키/중복 확인용, 암호학적 용도에는 generate_hash_secure 사용)
+    
+    Args:
+        data: 해시할 데이터
+    
+    Returns:
+        BLAKE2b 해시값 (128비트, 32자리 hex)
+    """
+    return hashlib.blake2b(data.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def generate_hash_secure(data: str) -> str:
+    """
+    암호학적 용도의 데이터 해시 생성
     
     Args:
         data: 해시할 데이터
@@ -36,7 +67,7 @@ def generate_hash(data: str) -> str:
     Returns:
         SHA256 해시값
     """
-    return hashlib.sha256(data.encode()).hexdigest()
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
 
 
 def encode_base64(data: bytes) -> str:
@@ -65,7 +96,12 @@ def decode_base64(encoded_data: str) -> bytes:
     return base64.b64decode(encoded_data)
 
 
-def format_datetime(dt: datetime, format_str: str = "%Y-%m-%d %H:%M:%S") -> str:
+# 기본 날짜시간 포맷 (isoformat과 같은 형태이므로 C로 구현된 isoformat/fromisoformat 사용)
+DEFAULT_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+DATE_FORMAT = "%Y-%m-%d"
+
+
+def format_datetime(dt: datetime, format_str: str = DEFAULT_DATETIME_FORMAT) -> str:
     """
     날짜시간 포맷팅
     
@@ -76,10 +112,16 @@ def format_datetime(dt: datetime, format_str: str = "%Y-%m-%d %H:%M:%S") -> str:
     Returns:
         포맷된 날짜시간 문자열
     """
+    # 타임존이 있으면 isoformat에 오프셋이 붙으므로 strftime 사용
+    if dt.tzinfo is None:
+        if format_str == DEFAULT_DATETIME_FORMAT:
+            return dt.isoformat(sep=' ', timespec='seconds')
+        if format_str == DATE_FORMAT:
+            return dt.date().isoformat()
     return dt.strftime(format_str)
 
 
-def parse_datetime(date_str: str, format_str: str = "%Y-%m-%d %H:%M:%S") -> datetime:
+def parse_datetime(date_str: str, format_str: str = DEFAULT_DATETIME_FORMAT) -> datetime:
     """
     문자열을 날짜시간으로 파싱
     
@@ -90,6 +132,11 @@ def parse_datetime(date_str: str, format_str: str = "%Y-%m-%d %H:%M:%S") -> date
     Returns:
         파싱된 날짜시간 객체
     """
+    # fromisoformat은 'T' 구분자 등도 허용하므로, 구분자 위치(4, 7, 10, 13, 16)까지
+    # 'YYYY-MM-DD HH:MM:SS'와 일치할 때만 빠른 경로 사용 (그 외에는 strptime으로 검증)
+    if (format_str == DEFAULT_DATETIME_FORMAT and len(date_str) == 19
+            and date_str[4::3] == '-- ::'):
+        return datetime.fromisoformat(date_str)
     return datetime.strptime(date_str, format_str)
 
 
@@ -104,14 +151,8 @@ def calculate_age(birth_date: datetime) -> int:
         계산된 나이
     """
     today = datetime.now()
-    age = today.year - birth_date.year
-    
-    # 생일이 지나지 않았으면 1살 빼기
-    if today.month < birth_date.month or \
-       (today.month == birth_date.month and today.day < birth_date.day):
-        age -= 1
-    
-    return age
+    # 올해 생일이 지나지 않았으면 비교 결과(True=1)만큼 1살 빼기
+    return today.year - birth_date.year - ((today.month, today.day) < (birth_date.month, birth_date.day))
 
 
 def calculate_bmi(weight: float, height: float) -> float:
@@ -163,13 +204,34 @@ def calculate_bmr(weight: float, height: float, age: int, gender: str) -> float:
         기초대사율 (kcal/day)
     """
     if gender.lower() == 'male':
-        bmr = 88.362 + (13.397 * weight) + (4.799 * height) - (5.677 * age)
+        bmr = bmr_male(weight, height, age)
     else:
-        bmr = 447.593 + (9.247 * weight) + (3.098 * height) - (4.330 * age)
+        bmr = bmr_female(weight, height, age)
     
     return round(bmr, 2)
 
 
+def calculate_bmr_batch(
+    weights: List[float],
+    heights: List[float],
+    ages: List[int],
+    genders: List[str]
+) -> List[float]:
+    """
+    여러 사용자의 기초대사율(BMR) 일괄 계산 (numba가 있으면 JIT 병렬 계산, 결과는 calculate_bmr과 동일)
+    
+    Args:
+        weights: 체중 목록 (kg)
+        heights: 신장 목록 (cm)
+        ages: 나이 목록
+        genders: 성별 목록 (male/female)
+    
+    Returns:
+        입력 순서와 같은 기초대사율 목록 (kcal/day)
+    """
+    return [round(bmr, 2) for bmr in bmr_batch(weights, heights, ages, genders)]
+
+
 def calculate_tdee(bmr: float, activity_level: str) -> float:
     """
     총 일일 에너지 소비량(TDEE) 계산
@@ -201,8 +263,7 @@ def validate_email(email: str) -> bool:
     Returns:
         유효성 여부
     """
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_RE.match(email))
 
 
 def sanitize_filename(filename: str) -> str:
@@ -216,24 +277,202 @@ def sanitize_filename(filename: str) -> str:
         정리된 파일명
     """
     # 특수문자를 언더스코어로 대체
-    sanitized = re.sub(r'[^\w\-_\.]', '_', filename)
+    sanitized = _FILENAME_RE.sub('_', filename)
     # 연속된 언더스코어 제거
-    sanitized = re.sub(r'_+', '_', sanitized)
+    sanitized = _DUP_UNDERSCORE_RE.sub('_', sanitized)
     return sanitized
 
 
-def chunk_list(lst: List[Any], chunk_size: int) -> List[List[Any]]:
+def chunk_list(lst: List[Any], chunk_size: int) -> Iterator[List[Any]]:
     """
-    리스트를 청크로 분할
+    리스트를 청크로 분할 (필요할 때마다 하나씩 생성, 리스트가 필요하면 list()로 감싸서 사용)
     
     Args:
         lst: 분할할 리스트
         chunk_size: 청크 크기
     
+    Yields:
+        분할된 청크
+    """
+    for i in range(0, len(lst), chunk_size):
+        yield lst[i:i + chunk_size]
+
+
+def fast_json_loads(data: str | bytes) -> Any:
+    """
+    JSON 파싱 (orjson이 있으면 orjson, 없으면 표준 json 사용)
+    
+    Args:
+        data: JSON 문자열 또는 바이트
+    
     Returns:
-        분할된 청크 리스트
+        파싱된 객체
+    
+    Raises:
+        json.JSONDecodeError: 올바른 JSON이 아닌 경우
     """
-    return [lst[i:i + chunk_size] for i in range(0, len(lst), chunk_size)]
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def extract_json(text: str, opener: str = "{") -> Optional[str]:
+    """
+    텍스트에서 처음 나오는 균형 잡힌 JSON 객체(또는 배열) 부분 추출
+    
+    문자열 리터럴 안의 괄호와 이스케이프를 건너뛰며 한 번만 훑습니다.
+    
+    Args:
+        text: LLM 응답 등 JSON이 섞인 텍스트
+        opener: 시작 괄호 ('{' 또는 '[')
+    
+    Returns:
+        JSON 부분 문자열, 없으면 None
+    """
+    closer = "}" if opener == "{" else "]"
+    start = text.find(opener)
+    if start < 0:
+        return None
+    
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == opener:
+            depth += 1
+        elif char == closer:
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    
+    return None
+
+
+class IncrementalJsonScanner:
+    """
+    조각 단위로 들어오는 텍스트에서 지정한 깊이의 JSON 객체가 닫힐 때마다 꺼내는 스캐너
+    
+    스트리밍 응답을 끝까지 기다리지 않고 항목별로 처리할 때 사용합니다.
+    예: item_depth=2이면 {"foods": [{...}, {...}]}의 각 음식 객체를 닫히는 즉시 반환합니다.
+    JSON 앞의 설명 문장에 '{'가 있어도, 뒤에 '}' 또는 '"키":'가 오는 '{'만 루트 객체로 인정합니다.
+    """
+    
+    def __init__(self, item_depth: int = 1):
+        """
+        Args:
+            item_depth: 꺼낼 객체가 시작되는 중첩 깊이 (루트 객체 안 = 1, 루트 안 배열의 원소 = 2)
+        
+        Raises:
+            ValueError: item_depth가 1보다 작은 경우
+        """
+        if item_depth < 1:
+            raise ValueError("item_depth must be at least 1")
+        
+        self.item_depth = item_depth
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._parts: Optional[List[str]] = None
+        # 루트 후보 '{' 이후 아직 확인되지 않은 문자들과 확인 단계 (open/key/key_escape/colon)
+        self._candidate: Optional[List[str]] = None
+        self._candidate_state = ""
+    
+    def feed(self, chunk: str) -> List[str]:
+        """
+        텍스트 조각 입력
+        
+        Args:
+            chunk: 새로 도착한 텍스트 조각
+        
+        Returns:
+            이번 조각에서 닫힌 객체들의 JSON 문자열 목록
+        """
+        items: List[str] = []
+        for char in chunk:
+            self._step(char, items)
+        return items
+    
+    def _step(self, char: str, items: List[str]) -> None:
+        """문자 하나 처리"""
+        if self._depth == 0:
+            self._step_root(char, items)
+            return
+        
+        if self._parts is not None:
+            self._parts.append(char)
+        
+        if self._in_string:
+            if self._escaped:
+                self._escaped = False
+            elif char == "\\":
+                self._escaped = True
+            elif char == '"':
+                self._in_string = False
+        elif char == '"':
+            self._in_string = True
+        elif char == "{" or char == "[":
+            if char == "{" and self._depth == self.item_depth and self._parts is None:
+                self._parts = [char]
+            self._depth += 1
+        elif char == "}" or char == "]":
+            self._depth -= 1
+            if self._parts is not None and self._depth == self.item_depth:
+                items.append("".join(self._parts))
+                self._parts = None
+    
+    def _step_root(self, char: str, items: List[str]) -> None:
+        """JSON 바깥 문자 처리 ('{' 다음에 '}' 또는 '"키":'가 와야 루트 객체로 확정)"""
+        if self._candidate is None:
+            if char == "{":
+                self._candidate = [char]
+                self._candidate_state = "open"
+            return
+        
+        self._candidate.append(char)
+        state = self._candidate_state
+        
+        if state == "open":
+            if char.isspace():
+                return
+            if char == '"':
+                self._candidate_state = "key"
+                return
+            if char == "}":
+                # 빈 루트 객체: 꺼낼 항목 없음
+                self._candidate = None
+                return
+        elif state == "key":
+            if char == "\\":
+                self._candidate_state = "key_escape"
+            elif char == '"':
+                self._candidate_state = "colon"
+            return
+        elif state == "key_escape":
+            self._candidate_state = "key"
+            return
+        elif state == "colon":
+            if char.isspace():
+                return
+            if char == ":":
+                self._candidate = None
+                self._depth = 1
+                return
+        
+        # 설명 문장 속 '{'였으므로 버리고, 그 뒤 문자들을 다시 확인
+        replay = self._candidate[1:]
+        self._candidate = None
+        for replay_char in replay:
+            self._step(replay_char, items)
 
 
 def safe_json_loads(json_str: str, default: Any = None) -> Any:
@@ -248,7 +487,7 @@ def safe_json_loads(json_str: str, default: Any = None) -> Any:
         파싱된 객체 또는 기본값
     """
     try:
-        return json.loads(json_str)
+        return fast_json_loads(json_str)
     except (json.JSONDecodeError, TypeError):
         return default
 
@@ -290,4 +529,79 @@ def get_week_dates(date: datetime) -> tuple[datetime, datetime]:
     week_start = date - timedelta(days=days_since_monday)
     week_end = week_start + timedelta(days=6)
     
-    return week_start, week_end
\ No newline at end of file
+    return week_start, week_end
+
+
+class AsyncTokenBucket:
+    """
+    asyncio용 토큰 버킷 속도 제한기
+    
+    초당 rate개씩 토큰이 채워지고(최대 capacity개), 토큰이 부족하면 순서대로 대기합니다.
+    토큰을 먼저 예약(음수 허용)한 뒤 잠들기 때문에 별도의 락이 필요 없습니다.
+    """
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+    
+    async def acquire(self) -> None:
+        """토큰 하나를 가져옴 (없으면 채워질 때까지 대기)"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+    
+    async def __aenter__(self) -> "AsyncTokenBucket":
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+
+class TTLCache:
+    """
+    만료 시간(TTL)이 있는 LRU 캐시
+    
+    maxsize를 넘으면 가장 오래 사용하지 않은 항목부터 제거하고,
+    ttl초가 지난 항목은 조회 시 없는 것으로 취급합니다.
+    """
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Any, tuple[float, Any]]" = OrderedDict()
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        """캐시 조회 (없거나 만료된 경우 default 반환)"""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+    
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def pop(self, key: Any, default: Any = None) -> Any:
+        """항목 제거 후 값 반환"""
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+    
+    def keys(self) -> List[Any]:
+        """현재 저장된 키 목록 (만료 여부와 무관)"""
+        return list(self._data)
+    
+    def __len__(self) -> int:
+        return len(self._data)
@@ -5,38 +5,139 @@ Claude Sonnet 4.5 모델 테스트
 
 import boto3
 import json
-import os
+import re
+import sys
+from functools import lru_cache
+from os import environ
 from dotenv import load_dotenv
 
 load_dotenv()
 
-# AWS 자격 증명 확인
-print(f"AWS_ACCESS_KEY_ID: {os.getenv('AWS_ACCESS_KEY_ID')[:10]}...")
-print(f"AWS_SECRET_ACCESS_KEY: {os.getenv('AWS_SECRET_ACCESS_KEY')[:10]}...")
-print(f"AWS_REGION: {os.getenv('AWS_REGION')}")
+# AWS 자격 증명 확인 (환경 변수는 한 번만 조회하고, 없으면 즉시 종료)
+try:
+    creds = {k: environ[k] for k in ('AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY', 'AWS_REGION')}
+except KeyError as e:
+    print(f"❌ 환경 변수 {e.args[0]}가 설정되지 않았습니다. .env 파일을 확인하세요.")
+    sys.exit(1)
 
-def test_sonnet_model():
-    """Claude Sonnet 4.5 모델 테스트"""
+print(f"AWS_ACCESS_KEY_ID: {creds['AWS_ACCESS_KEY_ID'][:10]}...")
+print(f"AWS_SECRET_ACCESS_KEY: {creds['AWS_SECRET_ACCESS_KEY'][:10]}...")
+print(f"AWS_REGION: {creds['AWS_REGION']}")
+
+# 사용자와 무관하게 재사용되는 고정 페르소나 (cachePoint로 프리픽스 캐싱)
+STATIC_PERSONA = (
+    "당신은 전문적인 다이어트 조언을 제공하는 AI 코치입니다. "
+    "사용자의 신체 정보를 바탕으로 식단과 운동에 대해 구체적이고 실행 가능한 조언을 한국어로 제공하세요."
+)
+
+# cachePoint를 지원하는 모델 (미지원 모델에 보내면 ValidationException 발생)
+# 주의: cachePoint는 일부 모델에서 performanceConfig(latency=optimized)와 함께 쓸 수 없으므로
+# 이 호출 경로에서는 프롬프트 캐싱만 사용한다.
+_PROMPT_CACHE_MODELS = ("claude-3-5-haiku", "claude-3-7-sonnet", "claude-sonnet-4")
+
+
+def _system_blocks(model_id: str) -> list[dict]:
+    """고정 페르소나 system 블록 구성 (지원 모델이면 cachePoint 추가)"""
+    blocks = [{"text": STATIC_PERSONA}]
+    if any(name in model_id for name in _PROMPT_CACHE_MODELS):
+        blocks.append({"cachePoint": {"type": "default"}})
+    return blocks
+
+
+@lru_cache(maxsize=32)
+def _converse_cached(bedrock_runtime, model_id: str, messages_key: str) -> str:
+    """동일한 (model_id, messages) 호출 결과를 프로세스 내에서 재사용"""
+    response = bedrock_runtime.converse(
+        modelId=model_id,
+        system=_system_blocks(model_id),
+        messages=json.loads(messages_key),
+    )
+    return response['output']['message']['content'][0]['text']
+
+
+def converse_text(bedrock_runtime, model_id: str, user_text: str) -> str:
+    """고정 페르소나 + 사용자 입력으로 converse 호출 (결과 캐싱)"""
+    messages = [{"role": "user", "content": [{"text": user_text}]}]
+    messages_key = json.dumps(messages, ensure_ascii=False, sort_keys=True)
+    return _converse_cached(bedrock_runtime, model_id, messages_key)
+
+
+# 배치 프롬프트 설정: 20개 초과 시 10개씩 나눠 출력 토큰 한도 내로 유지
+BATCH_MAX_PROMPTS = 20
+BATCH_CHUNK_SIZE = 10
+_BATCH_MARKER = re.compile(r'^\s*\[(\d+)\]:?\s*', re.MULTILINE)
+
+
+def _build_batch_prompt(prompts: list[str]) -> str:
+    """여러 질문을 [N] 번호가 붙은 하나의 메시지로 구성"""
+    numbered = "\n".join(f"[{i}] {prompt}" for i, prompt in enumerate(prompts, 1))
+    return f"Answer each question separately, prefixing each with [N]:\n{numbered}"
+
+
+def _split_batch_response(text: str, count: int) -> list[str]:
+    """[N] 마커 기준으로 응답을 분리 (누락된 답변은 빈 문자열)"""
+    answers = [""] * count
+    matches = list(_BATCH_MARKER.finditer(text))
+    for match, next_match in zip(matches, matches[1:] + [None]):
+        index = int(match.group(1)) - 1
+        if 0 <= index < count:
+            end = next_match.start() if next_match else len(text)
+            answers[index] = text[match.end():end].strip()
+    return answers
+
+
+def converse_batch(bedrock_runtime, model_id: str, prompts: list[str]) -> list[str]:
+    """
+    여러 프롬프트를 하나의 converse 호출로 묶어 처리
+    
+    Args:
+        bedrock_runtime: bedrock-runtime 클라이언트
+        model_id: 사용할 모델 ID
+        prompts: 질문 리스트
+    
+    Returns:
+        질문 순서대로 정렬된 응답 리스트
+    """
+    if len(prompts) > BATCH_MAX_PROMPTS:
+        chunks = [prompts[i:i + BATCH_CHUNK_SIZE] for i in range(0, len(prompts), BATCH_CHUNK_SIZE)]
+    else:
+        chunks = [prompts]
+    
+    answers = []
+    for chunk in chunks:
+        text = converse_text(bedrock_runtime, model_id, _build_batch_prompt(chunk))
+        answers.extend(_split_batch_response(text, len(chunk)))
+    
+    return answers
+
+
+def test_sonnet_model(prompts: list[str] = None):
+    """Claude Sonnet 4.5 모델 테스트 (prompts 지정 시 한 번의 호출로 일괄 평가)"""
     
     bedrock_runtime = boto3.client(
-        'bedrock-runtime', 
-        region_name='ap-northeast-2',
-        aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-        aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY')
+        'bedrock-runtime',
+        region_name=creds['AWS_REGION'],
+        aws_access_key_id=creds['AWS_ACCESS_KEY_ID'],
+        aws_secret_access_key=creds['AWS_SECRET_ACCESS_KEY']
     )
     
     try:
         print("Claude 3.5 Haiku 모델 테스트 중...")
         
         model_id = "anthropic.claude-3-haiku-20240307-v1:0"
-        messages = [{"role": "user", "content": [{"text": "안녕하세요! 저는 키 170cm, 몸무게 70kg입니다. 전문적인 다이어트 조언을 부탁드립니다."}]}]
         
-        response = bedrock_runtime.converse(
-            modelId=model_id,
-            messages=messages,
-        )
+        if prompts:
+            answers = converse_batch(bedrock_runtime, model_id, prompts)
+            print(f"✅ {len(prompts)}개 프롬프트 일괄 테스트 성공!")
+            for i, answer in enumerate(answers, 1):
+                print(f"\n[{i}] {answer}")
+            return True
         
-        claude_response = response['output']['message']['content'][0]['text']
+        claude_response = converse_text(
+            bedrock_runtime,
+            model_id,
+            "안녕하세요! 저는 키 170cm, 몸무게 70kg입니다."
+        )
         
         print("✅ Claude Sonnet 4.5 테스트 성공!")
         print(f"\n응답:\n{claude_response}")
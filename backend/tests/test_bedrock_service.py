@@ -0,0 +1,258 @@
+"""
+Bedrock 서비스 테스트
+"""
+
+import asyncio
+import json
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from botocore.exceptions import ClientError
+
+from src.services.bedrock_service import (
+    BedrockService, CachedBedrockService, CoachingMessageBatcher, DEFAULT_MAX_TOKENS,
+    BEDROCK_THROTTLE_BASE_DELAY, BEDROCK_THROTTLE_RETRIES
+)
+from src.models.data_models import CoachingMessage, NutritionInfo, UserProfile
+
+
+def _make_profile(user_id: str) -> UserProfile:
+    """테스트용 사용자 프로필 생성"""
+    return UserProfile(
+        user_id=user_id,
+        name="홍길동",
+        age=30,
+        gender="male",
+        height=175.0,
+        weight=70.0,
+        health_goal="weight_loss",
+        preferred_exercises=["running"],
+        activity_level="moderate"
+    )
+
+
+class TestBedrockService:
+    """Bedrock 서비스 테스트 클래스"""
+    
+    @pytest.fixture
+    def service(self):
+        """테스트용 서비스 인스턴스"""
+        return BedrockService()
+    
+    @pytest.fixture
+    def user_profile(self):
+        """테스트용 사용자 프로필"""
+        return _make_profile("test_user")
+    
+    @pytest.mark.asyncio
+    async def test_process_natural_language_defaults_to_full_model(self, service, user_profile):
+        """모델/토큰 한도를 지정하지 않으면 기본 모델과 기본 한도 사용 테스트"""
+        service._invoke_bedrock_text = AsyncMock(return_value='{"intent": "general_chat"}')
+        
+        result = await service.process_natural_language("운동 계획 짜줘", user_profile, [])
+        
+        assert result == {"intent": "general_chat"}
+        kwargs = service._invoke_bedrock_text.call_args.kwargs
+        assert kwargs["model_id"] is None
+        assert kwargs["max_tokens"] == DEFAULT_MAX_TOKENS
+    
+    @pytest.mark.asyncio
+    async def test_process_natural_language_without_history(self, service, user_profile):
+        """대화 기록 없이 호출해도 Bedrock을 호출하고 응답을 파싱하는지 테스트"""
+        service._invoke_bedrock_text = AsyncMock(return_value='{"intent": "meal_question"}')
+        
+        result = await service.process_natural_language("점심 뭐 먹을까?", user_profile)
+        
+        assert result == {"intent": "meal_question"}
+        service._invoke_bedrock_text.assert_awaited_once()
+        assert "점심 뭐 먹을까?" in service._invoke_bedrock_text.call_args.args[0]
+    
+    @pytest.mark.asyncio
+    async def test_coaching_batch_keeps_request_order(self, service):
+        """배치 응답이 요청 순서대로 사용자에게 매핑되는지 테스트"""
+        requests = [(_make_profile(f"user_{i}"), [], "") for i in range(3)]
+        service._invoke_bedrock_text = AsyncMock(
+            return_value=json.dumps(["첫째", "둘째", "셋째"], ensure_ascii=False)
+        )
+        
+        messages = await service.generate_coaching_messages_batch(requests)
+        
+        assert [m.user_id for m in messages] == ["user_0", "user_1", "user_2"]
+        assert [m.content for m in messages] == ["첫째", "둘째", "셋째"]
+        service._invoke_bedrock_text.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_coaching_batch_partial_response_falls_back(self, service):
+        """배치 응답 개수가 모자라면 사용자별 개별 호출로 대체하는지 테스트"""
+        requests = [(_make_profile(f"user_{i}"), [], "") for i in range(3)]
+        service._invoke_bedrock_text = AsyncMock(side_effect=[
+            json.dumps(["첫째", "둘째"], ensure_ascii=False),
+            "개별 0", "개별 1", "개별 2"
+        ])
+        
+        messages = await service.generate_coaching_messages_batch(requests)
+        
+        assert [m.user_id for m in messages] == ["user_0", "user_1", "user_2"]
+        assert [m.content for m in messages] == ["개별 0", "개별 1", "개별 2"]
+        assert service._invoke_bedrock_text.await_count == 4
+
+    
+    @pytest.mark.asyncio
+    async def test_converse_retries_throttling_with_jittered_backoff(self, service):
+        """ThrottlingException을 지터를 준 지수 백오프로 재시도하는지 테스트"""
+        throttled = ClientError({"Error": {"Code": "ThrottlingException"}}, "Converse")
+        service.client = MagicMock()
+        service.client.converse.side_effect = [throttled, throttled, {"output": "ok"}]
+        service._limiter = None
+        
+        with patch("src.services.bedrock_service.aws_config") as config, \
+                patch("src.services.bedrock_service.random.uniform", side_effect=lambda low, high: high / 2) as uniform, \
+                patch("src.services.bedrock_service.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            config.has_async_clients = False
+            result = await service._converse(modelId="model")
+        
+        assert result == {"output": "ok"}
+        assert [c.args for c in uniform.call_args_list] == [
+            (0, BEDROCK_THROTTLE_BASE_DELAY), (0, BEDROCK_THROTTLE_BASE_DELAY * 2)
+        ]
+        assert [c.args[0] for c in sleep.await_args_list] == [
+            BEDROCK_THROTTLE_BASE_DELAY / 2, BEDROCK_THROTTLE_BASE_DELAY
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_converse_gives_up_after_retries(self, service):
+        """재시도 횟수를 넘기거나 다른 오류면 예외를 그대로 올리는지 테스트"""
+        throttled = ClientError({"Error": {"Code": "ThrottlingException"}}, "Converse")
+        service.client = MagicMock()
+        service.client.converse.side_effect = throttled
+        service._limiter = None
+        
+        with patch("src.services.bedrock_service.aws_config") as config, \
+                patch("src.services.bedrock_service.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            config.has_async_clients = False
+            with pytest.raises(ClientError):
+                await service._converse(modelId="model")
+        
+        assert service.client.converse.call_count == BEDROCK_THROTTLE_RETRIES + 1
+        assert sleep.await_count == BEDROCK_THROTTLE_RETRIES
+
+
+class TestCachedBedrockService:
+    """프롬프트 캐시 서비스 테스트 클래스"""
+    
+    @pytest.fixture
+    def service(self):
+        """Converse 호출을 가짜로 바꾼 캐시 서비스"""
+        service = CachedBedrockService()
+        service._converse = AsyncMock(side_effect=lambda **kwargs: {
+            "output": {"message": {"content": [{"text": '{"recommendations": [{"menu": "샐러드"}]}'}]}}
+        })
+        return service
+    
+    @pytest.mark.asyncio
+    async def test_coaching_and_chat_are_not_cached(self, service):
+        """코칭 메시지와 대화 응답은 같은 입력이어도 매번 새로 생성하는지 테스트"""
+        profile = _make_profile("user_0")
+        
+        await service.generate_coaching_message(profile, [], "")
+        await service.generate_coaching_message(profile, [], "")
+        await service.process_natural_language("안녕", profile, [])
+        await service.process_natural_language("안녕", profile, [])
+        
+        assert service._converse.await_count == 4
+        assert len(service._prompt_cache) == 0
+    
+    @pytest.mark.asyncio
+    async def test_diet_recommendations_are_cached(self, service):
+        """같은 영양 상태의 식단 추천은 캐시된 응답을 재사용하는지 테스트"""
+        profile = _make_profile("user_0")
+        nutrition = NutritionInfo(calories=500, carbohydrates=60, protein=20, fat=15)
+        
+        first = await service.generate_diet_recommendations(profile, nutrition, nutrition)
+        second = await service.generate_diet_recommendations(profile, nutrition, nutrition)
+        
+        assert first == second == [{"menu": "샐러드"}]
+        service._converse.assert_awaited_once()
+
+
+class TestCoachingMessageBatcher:
+    """코칭 메시지 마이크로 배처 테스트 클래스"""
+    
+    @staticmethod
+    def _echo_batch(requests):
+        """요청마다 사용자 ID를 내용으로 갖는 메시지 반환"""
+        return [
+            CoachingMessage(
+                message_id=f"msg_{profile.user_id}",
+                user_id=profile.user_id,
+                message_type="advice",
+                content=profile.user_id
+            )
+            for profile, _, _ in requests
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_batch(self):
+        """동시에 들어온 요청이 한 배치로 묶이고 각자 자기 결과를 받는지 테스트"""
+        service = AsyncMock()
+        service.generate_coaching_messages_batch.side_effect = self._echo_batch
+        batcher = CoachingMessageBatcher(service, max_batch_size=8, max_wait=0.01)
+        
+        messages = await asyncio.gather(
+            *(batcher.submit(_make_profile(f"user_{i}"), []) for i in range(3))
+        )
+        await batcher.aclose()
+        
+        assert [m.content for m in messages] == ["user_0", "user_1", "user_2"]
+        service.generate_coaching_messages_batch.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_batch_failure_reaches_every_caller(self):
+        """배치 생성 실패가 모든 요청자에게 전달되는지 테스트"""
+        service = AsyncMock()
+        service.generate_coaching_messages_batch.side_effect = RuntimeError("boom")
+        batcher = CoachingMessageBatcher(service, max_batch_size=8, max_wait=0.01)
+        
+        results = await asyncio.gather(
+            *(batcher.submit(_make_profile(f"user_{i}"), []) for i in range(2)),
+            return_exceptions=True
+        )
+        await batcher.aclose()
+        
+        assert all(isinstance(result, RuntimeError) for result in results)
+    
+    @pytest.mark.asyncio
+    async def test_short_batch_result_does_not_hang(self):
+        """결과 개수가 모자라도 요청자가 무한정 기다리지 않는지 테스트"""
+        service = AsyncMock()
+        service.generate_coaching_messages_batch.side_effect = (
+            lambda requests: self._echo_batch(requests[:1])
+        )
+        batcher = CoachingMessageBatcher(service, max_batch_size=8, max_wait=0.01)
+        
+        results = await asyncio.wait_for(asyncio.gather(
+            *(batcher.submit(_make_profile(f"user_{i}"), []) for i in range(2)),
+            return_exceptions=True
+        ), timeout=1)
+        await batcher.aclose()
+        
+        assert all(isinstance(result, ValueError) for result in results)
+    
+    @pytest.mark.asyncio
+    async def test_aclose_cancels_worker_and_pending_requests(self):
+        """종료 시 수집 태스크와 대기 중인 요청이 정리되는지 테스트"""
+        service = AsyncMock()
+        service.generate_coaching_messages_batch.side_effect = self._echo_batch
+        batcher = CoachingMessageBatcher(service, max_batch_size=8, max_wait=10)
+        
+        pending = asyncio.ensure_future(batcher.submit(_make_profile("user_0"), []))
+        await asyncio.sleep(0)
+        worker = batcher._worker
+        
+        await batcher.aclose()
+        
+        assert worker.done()
+        assert batcher._worker is None
+        with pytest.raises(asyncio.CancelledError):
+            await pending
+        service.generate_coaching_messages_batch.assert_not_awaited()
@@ -0,0 +1,58 @@
+"""
+코칭 파이프라인 테스트
+"""
+
+import pytest
+from unittest.mock import Mock, AsyncMock, patch
+
+from src.pipelines.coaching_pipeline import CoachingPipeline
+from src.models.data_models import UserProfile
+
+
+class TestCoachingPipeline:
+    """코칭 파이프라인 테스트 클래스"""
+    
+    @pytest.fixture
+    def pipeline(self):
+        """테스트용 파이프라인 인스턴스"""
+        return CoachingPipeline()
+    
+    @pytest.fixture
+    def user_profile(self):
+        """테스트용 사용자 프로필"""
+        return UserProfile(
+            user_id="test_user",
+            name="홍길동",
+            age=30,
+            gender="male",
+            height=175.0,
+            weight=70.0,
+            health_goal="weight_loss",
+            preferred_exercises=["running"],
+            activity_level="moderate"
+        )
+    
+    @pytest.mark.asyncio
+    async def test_stream_daily_coaching_without_profile(self, pipeline):
+        """프로필이 없으면 스트림을 만들지 않고 None 반환 테스트"""
+        with patch.object(pipeline.dynamodb_service, "get_user_profile", AsyncMock(return_value=None)), \
+                patch.object(pipeline.bedrock_service, "stream_coaching_message", Mock()) as stream_message:
+            result = await pipeline.stream_daily_coaching("missing_user")
+        
+        assert result is None
+        stream_message.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_stream_daily_coaching(self, pipeline, user_profile):
+        """프로필이 있으면 코칭 메시지 조각을 순서대로 스트리밍 테스트"""
+        async def fake_stream(**kwargs):
+            for chunk in ["오늘도 ", "힘내세요!"]:
+                yield chunk
+        
+        with patch.object(pipeline.dynamodb_service, "get_user_profile", AsyncMock(return_value=user_profile)), \
+                patch.object(pipeline.dynamodb_service, "get_user_meals", AsyncMock(return_value=[])), \
+                patch.object(pipeline.bedrock_service, "stream_coaching_message", fake_stream):
+            stream = await pipeline.stream_daily_coaching("test_user")
+            chunks = [chunk async for chunk in stream]
+        
+        assert chunks == ["오늘도 ", "힘내세요!"]
@@ -0,0 +1,58 @@
+"""
+데이터 모델 테스트
+"""
+
+import copy
+import pickle
+import pytest
+
+from src.models.data_models import UserProfile, ExerciseType
+
+
+class TestUserProfile:
+    """사용자 프로필 모델 테스트 클래스"""
+    
+    @pytest.fixture
+    def profile(self):
+        """테스트용 사용자 프로필"""
+        return UserProfile(
+            user_id="test_user",
+            name="홍길동",
+            age=30,
+            gender="male",
+            height=175.0,
+            weight=70.0,
+            health_goal="weight_loss",
+            preferred_exercises=["yoga", "running"],
+            activity_level="moderate",
+            target_calories=1800.0
+        )
+    
+    def test_to_prompt_context(self, profile):
+        """프롬프트 컨텍스트 값 테스트"""
+        context = profile.to_prompt_context()
+        
+        assert context["health_goal"] == "weight_loss"
+        assert context["preferred_exercises"] == "running, yoga"
+        assert context["dietary_restrictions"] == "없음"
+    
+    def test_equality_and_copy_after_context(self, profile):
+        """컨텍스트 생성 후에도 비교/복사/직렬화 가능 테스트"""
+        profile.to_prompt_context()
+        
+        assert profile == profile.model_copy()
+        assert copy.deepcopy(profile) == profile
+        assert profile.model_copy(deep=True) == profile
+        assert pickle.loads(pickle.dumps(profile)) == profile
+    
+    def test_context_reflects_mutation(self, profile):
+        """컨텍스트 생성 후 필드 변경 반영 테스트"""
+        profile.to_prompt_context()
+        
+        profile.preferred_exercises.append(ExerciseType.SWIMMING)
+        profile.name = "김철수"
+        
+        context = profile.to_prompt_context()
+        assert "swimming" in context["preferred_exercises"]
+        assert context["name"] == "김철수"
+        assert profile.model_copy(update={"age": 40}).to_prompt_context()["age"] == 40
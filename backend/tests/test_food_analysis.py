@@ -2,12 +2,14 @@
 음식 분석 파이프라인 테스트
 """
 
+import asyncio
+import io
 import pytest
 from unittest.mock import Mock, AsyncMock
 from datetime import datetime
 
 from src.pipelines.food_analysis_pipeline import FoodAnalysisPipeline
-from src.models.data_models import FoodItem, NutritionInfo, MealRecord
+from src.models.data_models import FoodItem, NutritionInfo, MealRecord, MealStats
 
 
 class TestFoodAnalysisPipeline:
@@ -53,17 +55,19 @@ class TestFoodAnalysisPipeline:
         assert default_item.nutrition.calories > 0
     
     @pytest.mark.asyncio
-    async def test_process_meal_image_success(self, pipeline):
+    async def test_process_meal_image_success(self, pipeline, sample_food_item):
         """식사 이미지 처리 성공 테스트"""
         # Mock 설정
-        pipeline.s3_service.upload_image = AsyncMock(return_value="https://s3.amazonaws.com/test.jpg")
+        pipeline.s3_service.find_image_by_hash = AsyncMock(return_value=None)
+        pipeline.s3_service.upload_image_stream = AsyncMock(return_value="https://s3.amazonaws.com/test.jpg")
         pipeline.bedrock_service.analyze_food_image = AsyncMock(return_value=[sample_food_item])
+        pipeline.dynamodb_service.save_food_items_by_hash = AsyncMock(return_value=True)
         pipeline.dynamodb_service.save_meal_record = AsyncMock(return_value=True)
         
         # 테스트 실행
         result = await pipeline.process_meal_image(
             user_id="test_user",
-            image_data=b"fake_image_data",
+            image_stream=io.BytesIO(b"fake_image_data"),
             filename="test.jpg",
             meal_type="점심"
         )
@@ -73,20 +77,149 @@ class TestFoodAnalysisPipeline:
         assert isinstance(result, MealRecord)
         assert result.user_id == "test_user"
         assert result.meal_type == "점심"
+        assert result.foods == [sample_food_item]
+        pipeline.s3_service.upload_image_stream.assert_awaited_once()
+        pipeline.bedrock_service.analyze_food_image.assert_awaited_once_with(
+            image_data=b"fake_image_data", people_count=1
+        )
     
     @pytest.mark.asyncio
     async def test_process_meal_image_s3_failure(self, pipeline):
         """S3 업로드 실패 테스트"""
         # Mock 설정
-        pipeline.s3_service.upload_image = AsyncMock(return_value=None)
+        pipeline.s3_service.find_image_by_hash = AsyncMock(return_value=None)
+        pipeline.s3_service.upload_image_stream = AsyncMock(return_value=None)
         
         # 테스트 실행
         result = await pipeline.process_meal_image(
             user_id="test_user",
-            image_data=b"fake_image_data",
+            image_stream=io.BytesIO(b"fake_image_data"),
             filename="test.jpg",
             meal_type="점심"
         )
         
         # 검증
-        assert result is None
\ No newline at end of file
+        assert result is None
+    
+    @pytest.mark.asyncio
+    async def test_process_meal_image_save_failure_keeps_shared_image(self, pipeline, sample_food_item):
+        """DynamoDB 저장 실패 시 다른 기록과 공유될 수 있는 이미지를 삭제하지 않는지 테스트"""
+        # Mock 설정
+        pipeline.s3_service.find_image_by_hash = AsyncMock(return_value=None)
+        pipeline.s3_service.upload_image_stream = AsyncMock(return_value="https://s3.amazonaws.com/test.jpg")
+        pipeline.s3_service.delete_image = AsyncMock(return_value=True)
+        pipeline.bedrock_service.analyze_food_image = AsyncMock(return_value=[sample_food_item])
+        pipeline.dynamodb_service.save_food_items_by_hash = AsyncMock(return_value=True)
+        pipeline.dynamodb_service.save_meal_record = AsyncMock(return_value=False)
+        
+        # 테스트 실행
+        result = await pipeline.process_meal_image(
+            user_id="test_user",
+            image_stream=io.BytesIO(b"fake_image_data"),
+            filename="test.jpg",
+            meal_type="점심"
+        )
+        
+        # 검증
+        assert result is None
+        pipeline.s3_service.delete_image.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_process_meal_image_reuses_duplicate(self, pipeline, sample_food_item):
+        """같은 이미지 재업로드 시 업로드/분석 생략 테스트"""
+        pipeline.s3_service.find_image_by_hash = AsyncMock(return_value="https://s3.amazonaws.com/dup.jpg")
+        pipeline.s3_service.upload_image_stream = AsyncMock()
+        pipeline.dynamodb_service.get_food_items_by_hash = AsyncMock(return_value=[sample_food_item])
+        pipeline.bedrock_service.analyze_food_image = AsyncMock()
+        pipeline.dynamodb_service.save_meal_record = AsyncMock(return_value=True)
+        
+        result = await pipeline.process_meal_image(
+            user_id="test_user",
+            image_stream=io.BytesIO(b"fake_image_data"),
+            filename="test.jpg",
+            meal_type="점심"
+        )
+        
+        assert result.image_url == "https://s3.amazonaws.com/dup.jpg"
+        assert result.foods == [sample_food_item]
+        pipeline.s3_service.upload_image_stream.assert_not_awaited()
+        pipeline.bedrock_service.analyze_food_image.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_batch_process_images_concurrent(self, pipeline):
+        """일괄 처리 동시 실행 및 순서 유지 테스트"""
+        in_flight = 0
+        max_in_flight = 0
+        timestamps = set()
+        
+        async def fake_process(**kwargs):
+            nonlocal in_flight, max_in_flight
+            timestamps.add(kwargs["timestamp"])
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if kwargs["filename"] == "bad.jpg":
+                raise RuntimeError("boom")
+            return kwargs["filename"]
+        
+        pipeline.process_meal_image = fake_process
+        batch = [
+            {"image_stream": io.BytesIO(b"x"), "filename": name, "meal_type": "점심"}
+            for name in ["a.jpg", "bad.jpg", "c.jpg", "d.jpg"]
+        ]
+        
+        results = await pipeline.batch_process_images("test_user", batch, concurrency=2)
+        
+        assert results == ["a.jpg", None, "c.jpg", "d.jpg"]
+        assert max_in_flight == 2
+        assert len(timestamps) == 1
+    
+    @pytest.mark.asyncio
+    async def test_reanalyze_meal_not_found(self, pipeline):
+        """재분석 대상 식사 기록 없음 테스트"""
+        pipeline.dynamodb_service.get_meal_record = AsyncMock(return_value=None)
+        
+        result = await pipeline.reanalyze_meal(meal_id="meal_x", user_id="test_user")
+        
+        assert result is None
+        pipeline.dynamodb_service.get_meal_record.assert_awaited_once_with(
+            user_id="test_user", meal_id="meal_x"
+        )
+    
+    @pytest.mark.asyncio
+    async def test_get_meal_analysis_summary_cached(self, pipeline, sample_food_item):
+        """식사 분석 요약 계산 및 캐시 테스트"""
+        meals = [
+            MealStats(meal_type=meal_type, calories=250.0, protein=20.0, food_names=["김치찌개"])
+            for meal_type in ["점심", "저녁", "점심"]
+        ]
+        pipeline.dynamodb_service.get_user_meal_stats = AsyncMock(return_value=meals)
+        
+        summary = await pipeline.get_meal_analysis_summary("test_user")
+        cached = await pipeline.get_meal_analysis_summary("test_user")
+        
+        assert summary["total_meals"] == 3
+        assert summary["average_calories_per_meal"] == 250.0
+        assert summary["meal_types_distribution"]["점심"] == {"count": 2, "total_calories": 500.0}
+        assert summary["most_frequent_foods"] == [("김치찌개", 3)]
+        assert cached is summary
+        pipeline.dynamodb_service.get_user_meal_stats.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_stream_food_analysis(self, pipeline, sample_food_item):
+        """음식 분석 스트리밍 테스트 (스트림 전체를 읽어 Bedrock 스트리밍에 전달)"""
+        received = {}
+        
+        async def fake_stream(image_data, people_count):
+            received.update(image_data=image_data, people_count=people_count)
+            yield sample_food_item
+        
+        pipeline.bedrock_service.stream_food_analysis = fake_stream
+        image_stream = io.BytesIO(b"fake_image_data")
+        image_stream.read(4)
+        
+        items = [item async for item in pipeline.stream_food_analysis(image_stream, people_count=2)]
+        
+        assert items == [sample_food_item]
+        assert received == {"image_data": b"fake_image_data", "people_count": 2}
@@ -0,0 +1,183 @@
+"""
+공통 유틸리티 함수 테스트
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.utils.helpers import (
+    AsyncTokenBucket, IncrementalJsonScanner, TTLCache,
+    calculate_bmr, calculate_bmr_batch, parse_datetime
+)
+from src.utils import _fast_math
+
+
+FOODS_JSON = json.dumps(
+    {"foods": [{"name": "밥 {}\"", "tags": [1, {"a": 2}]}, {"name": "국"}]},
+    ensure_ascii=False
+)
+
+
+def _scan(text: str, chunk_size: int) -> list:
+    """텍스트를 chunk_size 단위로 나눠 스캐너에 넣고 꺼낸 항목 이름 반환"""
+    scanner = IncrementalJsonScanner(item_depth=2)
+    items = []
+    for i in range(0, len(text), chunk_size):
+        items.extend(scanner.feed(text[i:i + chunk_size]))
+    return [json.loads(item)["name"] for item in items]
+
+
+class TestIncrementalJsonScanner:
+    """증분 JSON 스캐너 테스트 클래스"""
+    
+    def test_split_chunks(self):
+        """조각 크기와 무관하게 같은 항목 추출 테스트"""
+        for chunk_size in (1, 3, 7, len(FOODS_JSON)):
+            assert _scan(FOODS_JSON, chunk_size) == ['밥 {}"', "국"]
+    
+    def test_braces_inside_strings(self):
+        """문자열 안의 괄호/이스케이프된 따옴표 무시 테스트"""
+        items = IncrementalJsonScanner(item_depth=2).feed(FOODS_JSON)
+        
+        assert json.loads(items[0])["tags"] == [1, {"a": 2}]
+    
+    def test_prose_before_json(self):
+        """JSON 앞 설명 문장 속 '{' 무시 테스트"""
+        for prose in ('He said "hi {" then ', "set {a} and {'b'} ", '{ "x" 1 '):
+            assert _scan(prose + FOODS_JSON + " 끝 }", 4) == ['밥 {}"', "국"]
+    
+    def test_items_emitted_before_end(self):
+        """루트 객체가 닫히기 전에 항목 반환 테스트"""
+        scanner = IncrementalJsonScanner(item_depth=2)
+        
+        assert scanner.feed('{"foods": [{"name": "국"}, {"na') == ['{"name": "국"}']
+        assert scanner.feed('me": "밥"}]}') == ['{"name": "밥"}']
+
+
+class TestParseDatetime:
+    """날짜시간 파싱 테스트 클래스"""
+    
+    def test_default_format(self):
+        """기본 포맷 파싱 테스트"""
+        assert parse_datetime("2024-01-02 03:04:05") == datetime(2024, 1, 2, 3, 4, 5)
+    
+    @pytest.mark.parametrize("date_str", [
+        "2024-01-02T03:04:05",
+        "2024-01-02 03:04+05",
+        "2024-01-02",
+    ])
+    def test_rejects_other_iso_forms(self, date_str):
+        """기본 포맷과 다른 ISO 형태는 거부하는지 테스트"""
+        with pytest.raises(ValueError):
+            parse_datetime(date_str)
+    
+    def test_custom_format(self):
+        """사용자 지정 포맷 파싱 테스트"""
+        assert parse_datetime("2024/01/02", "%Y/%m/%d") == datetime(2024, 1, 2)
+
+
+class TestAsyncTokenBucket:
+    """토큰 버킷 속도 제한기 테스트 클래스"""
+    
+    @pytest.mark.asyncio
+    async def test_waits_for_refill(self):
+        """토큰이 바닥나면 부족한 만큼만 기다리고 시간이 지나면 다시 채워지는지 테스트"""
+        clock = [100.0]
+        with patch("src.utils.helpers.time.monotonic", side_effect=lambda: clock[0]), \
+                patch("src.utils.helpers.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            bucket = AsyncTokenBucket(rate=2, capacity=2)
+            
+            # 가득 찬 버킷에서는 기다리지 않음
+            await bucket.acquire()
+            await bucket.acquire()
+            sleep.assert_not_awaited()
+            
+            # 세 번째, 네 번째 요청은 예약 순서대로 0.5초, 1초 대기
+            await bucket.acquire()
+            await bucket.acquire()
+            assert [c.args[0] for c in sleep.await_args_list] == [0.5, 1.0]
+            
+            # 예약분까지 채워질 만큼 시간이 흐르면 다시 기다리지 않음
+            sleep.reset_mock()
+            clock[0] += 2.0
+            await bucket.acquire()
+            sleep.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_refill_is_capped_at_capacity(self):
+        """오래 쉬어도 capacity 이상 쌓이지 않는지 테스트"""
+        clock = [0.0]
+        with patch("src.utils.helpers.time.monotonic", side_effect=lambda: clock[0]), \
+                patch("src.utils.helpers.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            bucket = AsyncTokenBucket(rate=1, capacity=2)
+            clock[0] += 60.0
+            
+            for _ in range(3):
+                await bucket.acquire()
+            
+            sleep.assert_awaited_once_with(1.0)
+
+
+class TestTTLCache:
+    """TTL LRU 캐시 테스트 클래스"""
+    
+    def test_entry_expires_after_ttl(self):
+        """ttl이 지나면 조회되지 않고 제거되는지 테스트"""
+        clock = [0.0]
+        with patch("src.utils.helpers.time.monotonic", side_effect=lambda: clock[0]):
+            cache = TTLCache(maxsize=4, ttl=10)
+            cache["a"] = 1
+            
+            clock[0] = 10.0
+            assert cache.get("a") == 1
+            
+            clock[0] = 10.5
+            assert cache.get("a", "missing") == "missing"
+            assert len(cache) == 0
+    
+    def test_evicts_least_recently_used(self):
+        """maxsize를 넘으면 가장 오래 사용하지 않은 항목부터 제거되는지 테스트"""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache.get("a")
+        cache["c"] = 3
+        
+        assert cache.keys() == ["a", "c"]
+        assert cache.get("b") is None
+
+
+class TestCalculateBmrBatch:
+    """기초대사율 일괄 계산 테스트 클래스"""
+    
+    WEIGHTS = [70.0, 55.5, 92.3, 48.0]
+    HEIGHTS = [175.0, 162.4, 181.2, 150.0]
+    AGES = [30, 45, 22, 67]
+    GENDERS = ["male", "female", "MALE", "Female"]
+    
+    def _expected(self) -> list:
+        """같은 입력을 calculate_bmr로 하나씩 계산한 결과"""
+        return [
+            calculate_bmr(weight, height, age, gender)
+            for weight, height, age, gender in zip(self.WEIGHTS, self.HEIGHTS, self.AGES, self.GENDERS)
+        ]
+    
+    def test_matches_scalar_formula(self):
+        """일괄 계산 결과가 calculate_bmr과 같은지 테스트 (numba 설치 여부와 무관)"""
+        result = calculate_bmr_batch(self.WEIGHTS, self.HEIGHTS, self.AGES, self.GENDERS)
+        
+        assert result == self._expected()
+    
+    def test_pure_python_fallback(self):
+        """numba가 없을 때 순수 Python 경로로 같은 결과를 내는지 테스트"""
+        with patch.object(_fast_math, "njit", None):
+            result = calculate_bmr_batch(self.WEIGHTS, self.HEIGHTS, self.AGES, self.GENDERS)
+        
+        assert result == self._expected()
+    
+    def test_empty_input(self):
+        """빈 입력이면 빈 목록 반환 테스트"""
+        assert calculate_bmr_batch([], [], [], []) == []
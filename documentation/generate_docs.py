@@ -4,28 +4,430 @@ AI 식단 코치 프로젝트 문서 생성기
 프로젝트 분석 후 6개 문서를 docx 형식으로 생성
 """
 
+import argparse
+import asyncio
+import functools
+import hashlib
+import io
+import json
 import os
+import shutil
 import sys
+import tempfile
+import types
+import zipfile
 from pathlib import Path
-from docx import Document
-from docx.shared import Inches, Pt
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.style import WD_STYLE_TYPE
 from datetime import datetime
+from xml.sax.saxutils import escape
+
+
+# 로컬 산출물용 문서는 작아서 압축 시간이 저장 시간을 좌우하므로 DEFLATE 레벨 1로 저장
+DOCX_COMPRESSLEVEL = 1
+
+
+@functools.cache
+def _get_docx_module():
+    """python-docx 지연 로드 (생성기가 실제로 호출될 때만 import)"""
+    import docx
+    import docx.enum.text
+    from docx.opc import phys_pkg
+    
+    class _FastZipPkgWriter(phys_pkg._ZipPkgWriter):
+        """DOCX_COMPRESSLEVEL로 압축하는 패키지 writer"""
+        
+        def __init__(self, pkg_file):
+            self._zipf = zipfile.ZipFile(
+                pkg_file, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=DOCX_COMPRESSLEVEL
+            )
+    
+    # PhysPkgWriter 팩토리가 모듈 전역의 _ZipPkgWriter를 생성하므로 교체
+    phys_pkg._ZipPkgWriter = _FastZipPkgWriter
+    return docx
+
+
+# StaticDocxWriter용 고정 OOXML 파트
+_W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+
+_CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '<Override PartName="/word/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>'
+    '<Override PartName="/word/numbering.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.numbering+xml"/>'
+    '</Types>'
+)
+
+_PACKAGE_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    '</Relationships>'
+)
+
+_DOCUMENT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/>'
+    '<Relationship Id="rId2" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/numbering" '
+    'Target="numbering.xml"/>'
+    '</Relationships>'
+)
+
+
+def _heading_style(level, size, color):
+    return (
+        f'<w:style w:type="paragraph" w:styleId="Heading{level}">'
+        f'<w:name w:val="heading {level}"/><w:basedOn w:val="Normal"/><w:next w:val="Normal"/>'
+        f'<w:qFormat/><w:pPr><w:keepNext/><w:spacing w:before="{480 if level == 1 else 200}" w:after="0"/>'
+        f'<w:outlineLvl w:val="{level - 1}"/></w:pPr>'
+        f'<w:rPr><w:b/><w:color w:val="{color}"/><w:sz w:val="{size}"/></w:rPr>'
+        '</w:style>'
+    )
+
+
+_STYLES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    f'<w:styles xmlns:w="{_W_NS}">'
+    '<w:docDefaults><w:rPrDefault><w:rPr>'
+    '<w:rFonts w:ascii="Calibri" w:hAnsi="Calibri" w:eastAsia="맑은 고딕" w:cs="Calibri"/>'
+    '<w:sz w:val="22"/><w:lang w:val="en-US" w:eastAsia="ko-KR"/>'
+    '</w:rPr></w:rPrDefault>'
+    '<w:pPrDefault><w:pPr><w:spacing w:after="200" w:line="276" w:lineRule="auto"/></w:pPr></w:pPrDefault>'
+    '</w:docDefaults>'
+    '<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/><w:qFormat/></w:style>'
+    '<w:style w:type="paragraph" w:styleId="Title">'
+    '<w:name w:val="Title"/><w:basedOn w:val="Normal"/><w:next w:val="Normal"/><w:qFormat/>'
+    '<w:pPr><w:spacing w:after="300"/></w:pPr>'
+    '<w:rPr><w:color w:val="17365D"/><w:sz w:val="52"/></w:rPr>'
+    '</w:style>'
+    + _heading_style(1, 28, '365F91')
+    + _heading_style(2, 26, '4F81BD')
+    + _heading_style(3, 22, '4F81BD') +
+    '<w:style w:type="paragraph" w:styleId="ListBullet">'
+    '<w:name w:val="List Bullet"/><w:basedOn w:val="Normal"/>'
+    '<w:pPr><w:numPr><w:numId w:val="1"/></w:numPr><w:contextualSpacing/></w:pPr>'
+    '</w:style>'
+    '<w:style w:type="paragraph" w:styleId="ListNumber">'
+    '<w:name w:val="List Number"/><w:basedOn w:val="Normal"/>'
+    '<w:pPr><w:numPr><w:numId w:val="2"/></w:numPr><w:contextualSpacing/></w:pPr>'
+    '</w:style>'
+    '<w:style w:type="table" w:default="1" w:styleId="TableNormal">'
+    '<w:name w:val="Normal Table"/><w:tblPr><w:tblInd w:w="0" w:type="dxa"/>'
+    '<w:tblCellMar><w:left w:w="108" w:type="dxa"/><w:right w:w="108" w:type="dxa"/></w:tblCellMar>'
+    '</w:tblPr></w:style>'
+    '<w:style w:type="table" w:styleId="TableGrid">'
+    '<w:name w:val="Table Grid"/><w:basedOn w:val="TableNormal"/>'
+    '<w:pPr><w:spacing w:after="0" w:line="240" w:lineRule="auto"/></w:pPr>'
+    '<w:tblPr><w:tblBorders>'
+    '<w:top w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+    '<w:left w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+    '<w:bottom w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+    '<w:right w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+    '<w:insideH w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+    '<w:insideV w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+    '</w:tblBorders></w:tblPr>'
+    '</w:style>'
+    '</w:styles>'
+)
+
+_NUMBERING_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    f'<w:numbering xmlns:w="{_W_NS}">'
+    '<w:abstractNum w:abstractNumId="0"><w:multiLevelType w:val="singleLevel"/>'
+    '<w:lvl w:ilvl="0"><w:start w:val="1"/><w:numFmt w:val="bullet"/><w:lvlText w:val="•"/>'
+    '<w:lvlJc w:val="left"/><w:pPr><w:ind w:left="360" w:hanging="360"/></w:pPr></w:lvl>'
+    '</w:abstractNum>'
+    '<w:abstractNum w:abstractNumId="1"><w:multiLevelType w:val="singleLevel"/>'
+    '<w:lvl w:ilvl="0"><w:start w:val="1"/><w:numFmt w:val="decimal"/><w:lvlText w:val="%1."/>'
+    '<w:lvlJc w:val="left"/><w:pPr><w:ind w:left="360" w:hanging="360"/></w:pPr></w:lvl>'
+    '</w:abstractNum>'
+    '<w:num w:numId="1"><w:abstractNumId w:val="0"/></w:num>'
+    '<w:num w:numId="2"><w:abstractNumId w:val="1"/></w:num>'
+    '</w:numbering>'
+)
+
+_DOCUMENT_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    f'<w:document xmlns:w="{_W_NS}"><w:body>'
+)
+
+_DOCUMENT_TAIL = (
+    '<w:sectPr><w:pgSz w:w="12240" w:h="15840"/>'
+    '<w:pgMar w:top="1440" w:right="1440" w:bottom="1440" w:left="1440" '
+    'w:header="720" w:footer="720" w:gutter="0"/></w:sectPr>'
+    '</w:body></w:document>'
+)
+
+# 본문 폭 (Letter 용지 - 좌우 여백, twip 단위)
+_BODY_WIDTH = 9360
+
+_CODE_RPR = '<w:rPr><w:rFonts w:ascii="Courier New" w:hAnsi="Courier New" w:cs="Courier New"/></w:rPr>'
+
+
+def _runs(text, rpr=''):
+    """텍스트를 <w:r> 문자열로 변환 (줄바꿈은 <w:br/>로 처리)"""
+    lines = '</w:t><w:br/><w:t xml:space="preserve">'.join(escape(line) for line in text.split('\n'))
+    return f'<w:r>{rpr}<w:t xml:space="preserve">{lines}</w:t></w:r>'
+
+
+def _paragraph(text, style=None, rpr='', ppr_extra=''):
+    """<w:p> 문자열 생성"""
+    style_xml = f'<w:pStyle w:val="{style}"/>' if style else ''
+    ppr = f'<w:pPr>{style_xml}{ppr_extra}</w:pPr>' if style_xml or ppr_extra else ''
+    return f'<w:p>{ppr}{_runs(text, rpr) if text else ""}</w:p>'
+
+
+def _table_xml(header, rows):
+    """Table Grid 스타일 <w:tbl> 문자열 생성 (header가 None이면 헤더 행 생략)"""
+    all_rows = [header, *rows] if header else list(rows)
+    cols = len(all_rows[0])
+    width = _BODY_WIDTH // cols
+    cell_pr = f'<w:tcPr><w:tcW w:w="{width}" w:type="dxa"/></w:tcPr>'
+    grid = ''.join(f'<w:gridCol w:w="{width}"/>' for _ in range(cols))
+    body = ''.join(
+        '<w:tr>' + ''.join(f'<w:tc>{cell_pr}{_paragraph(cell)}</w:tc>' for cell in row) + '</w:tr>'
+        for row in all_rows
+    )
+    return (
+        '<w:tbl><w:tblPr><w:tblStyle w:val="TableGrid"/><w:tblW w:w="0" w:type="auto"/>'
+        f'<w:tblLook w:val="04A0"/></w:tblPr><w:tblGrid>{grid}</w:tblGrid>{body}</w:tbl>'
+    )
+
+
+def _restart_numbering(doc, elements):
+    """연속된 List Number 문단마다 새 번호 정의를 할당하여 목록별로 1부터 다시 번호 매김"""
+    from docx.oxml.ns import qn
+    
+    numbering = doc.part.numbering_part.element
+    style_num_id = doc.styles['List Number'].element.pPr.numPr.numId.val
+    abstract_num_id = numbering.num_having_numId(style_num_id).abstractNumId.val
+    
+    num_id = None
+    for element in elements:
+        p_style = element.find(f'{qn("w:pPr")}/{qn("w:pStyle")}')
+        if p_style is None or p_style.get(qn('w:val')) != 'ListNumber':
+            num_id = None
+            continue
+        if num_id is None:
+            num = numbering.add_num(abstract_num_id)
+            num.add_lvlOverride(ilvl=0).add_startOverride(1)
+            num_id = num.numId
+        p_style.addnext(_get_docx_module().oxml.parse_xml(
+            f'<w:numPr xmlns:w="{_W_NS}"><w:ilvl w:val="0"/><w:numId w:val="{num_id}"/></w:numPr>'
+        ))
+
+
+def _append_xml(doc, xml):
+    """OOXML 조각을 한 번에 파싱하여 python-docx 문서 본문 끝(sectPr 앞)에 추가"""
+    from docx.oxml import parse_xml
+    
+    container = parse_xml(f'<w:body xmlns:w="{_W_NS}">{xml}</w:body>')
+    elements = list(container)
+    if 'w:val="ListNumber"' in xml:
+        _restart_numbering(doc, elements)
+    
+    body = doc.element.body
+    sect_pr = body.sectPr
+    for element in elements:
+        if sect_pr is not None:
+            sect_pr.addprevious(element)
+        else:
+            body.append(element)
+
+
+def _build_list(doc, items, style='ListNumber'):
+    """목록 문단 전체를 한 번의 parse_xml로 추가"""
+    _append_xml(doc, ''.join(_paragraph(item, style) for item in items))
+
+
+def _build_bullets(doc, items):
+    """글머리 기호 목록 전체를 한 번의 parse_xml로 추가"""
+    _build_list(doc, items, style='ListBullet')
+
+
+def _add_code(doc, text):
+    """Courier New 코드 문단을 미리 만든 rPr 템플릿으로 추가"""
+    _append_xml(doc, _paragraph(text, rpr=_CODE_RPR))
+
+
+def _build_table(doc, header, rows):
+    """표 전체를 한 번의 parse_xml로 추가 (header가 None이면 헤더 행 생략)"""
+    _append_xml(doc, _table_xml(header, rows))
+
+
+class StaticDocxWriter:
+    """
+    정적 문서용 docx 작성기
+    python-docx 객체 모델을 거치지 않고 word/document.xml을 문자열로 조립하여 저장
+    """
+    
+    def __init__(self):
+        self._parts = []
+    
+    def title(self, text):
+        """가운데 정렬 제목"""
+        self._parts.append(_paragraph(text, 'Title', ppr_extra='<w:jc w:val="center"/>'))
+    
+    def heading(self, text, level=1):
+        """제목 (level 1~3)"""
+        self._parts.append(_paragraph(text, f'Heading{level}'))
+    
+    def p(self, text=''):
+        """일반 문단"""
+        self._parts.append(_paragraph(text))
+    
+    def bullet(self, text):
+        """글머리 기호 목록 항목"""
+        self._parts.append(_paragraph(text, 'ListBullet'))
+    
+    def number(self, text):
+        """번호 매기기 목록 항목"""
+        self._parts.append(_paragraph(text, 'ListNumber'))
+    
+    def code(self, text):
+        """Courier New 코드 블록"""
+        self._parts.append(_paragraph(text, rpr=_CODE_RPR))
+    
+    def table(self, header, rows):
+        """Table Grid 스타일 표 (header가 None이면 헤더 행 생략)"""
+        self._parts.append(_table_xml(header, rows))
+    
+    def body_xml(self):
+        """지금까지 추가된 본문 XML"""
+        return ''.join(self._parts)
+    
+    def save(self, target):
+        """docx 패키지로 저장 (target: 파일 경로 또는 바이너리 스트림)"""
+        document_xml = _DOCUMENT_HEAD + self.body_xml() + _DOCUMENT_TAIL
+        with zipfile.ZipFile(target, 'w', zipfile.ZIP_DEFLATED, compresslevel=DOCX_COMPRESSLEVEL) as zf:
+            zf.writestr('[Content_Types].xml', _CONTENT_TYPES_XML)
+            zf.writestr('_rels/.rels', _PACKAGE_RELS_XML)
+            zf.writestr('word/_rels/document.xml.rels', _DOCUMENT_RELS_XML)
+            zf.writestr('word/styles.xml', _STYLES_XML)
+            zf.writestr('word/numbering.xml', _NUMBERING_XML)
+            zf.writestr('word/document.xml', document_xml)
+
+
+MANIFEST_NAME = '.manifest.json'
+
+
+def _hash_code(code, h):
+    """코드 객체의 바이트코드와 상수(문서 내용 리터럴 포함)를 해시에 반영"""
+    h.update(code.co_code)
+    h.update(' '.join(code.co_names).encode('utf-8'))
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _hash_code(const, h)
+        else:
+            h.update(repr(const).encode('utf-8'))
+
+
+@functools.cache
+def _render_digest():
+    """모든 문서가 공유하는 렌더링 헬퍼와 고정 XML 파트의 해시"""
+    h = hashlib.blake2b(digest_size=16)
+    helpers = [
+        _runs, _paragraph, _table_xml, _restart_numbering, _append_xml,
+        _build_list, _build_bullets, _build_table, _add_code,
+        DocumentGenerator._new_document, DocumentGenerator._save,
+        *(member for member in vars(StaticDocxWriter).values() if isinstance(member, types.FunctionType)),
+    ]
+    for helper in helpers:
+        _hash_code(helper.__code__, h)
+    for part in (_STYLES_XML, _NUMBERING_XML, _DOCUMENT_TAIL, _CODE_RPR, str(DOCX_COMPRESSLEVEL)):
+        h.update(part.encode('utf-8'))
+    return h.digest()
+
 
 class DocumentGenerator:
     def __init__(self, project_path):
         self.project_path = Path(project_path)
         self.output_dir = Path("generated_docs")
-        self.output_dir.mkdir(exist_ok=True)
-        
-    def create_project_overview(self):
-        """프로젝트 개요서 생성"""
-        doc = Document()
-        
-        # 제목
-        title = doc.add_heading('AI 식단 코치 프로젝트 개요서', 0)
-        title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        # 파일명 -> docx 바이트 (flush 시 한 번에 기록)
+        self._outputs = {}
+    
+    def _content_hash(self, method_name):
+        """생성 메서드의 내용 해시 (메서드 상수 + 공유 렌더링 헬퍼)"""
+        h = hashlib.blake2b(_render_digest(), digest_size=16)
+        method_names = [method_name]
+        if method_name == 'create_combined_document':
+            method_names += [name for name, _ in COMBINED_SECTIONS]
+        for name in method_names:
+            _hash_code(getattr(type(self), name).__code__, h)
+        return h.hexdigest()
+    
+    def _load_manifest(self):
+        """이전 실행의 {메서드명: 해시} manifest 로드"""
+        try:
+            return json.loads((self.output_dir / MANIFEST_NAME).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+    
+    def _save(self, doc, filename):
+        """문서를 메모리에 저장"""
+        buf = io.BytesIO()
+        doc.save(buf)
+        self._outputs[filename] = buf.getvalue()
+    
+    async def _write_outputs(self, target_dir):
+        """메모리에 생성된 문서를 target_dir에 동시에 기록"""
+        await asyncio.gather(*(
+            asyncio.to_thread((target_dir / filename).write_bytes, data)
+            for filename, data in self._outputs.items()
+        ))
+    
+    def flush(self):
+        """생성된 문서를 임시 폴더에 기록한 뒤 출력 폴더와 교체 (중단 시 기존 폴더 유지)"""
+        if not self._outputs:
+            return
+        
+        tmp_dir = Path(tempfile.mkdtemp(
+            prefix=f'.{self.output_dir.name}-', dir=self.output_dir.resolve().parent
+        ))
+        try:
+            tmp_dir.chmod(0o755)
+            asyncio.run(self._write_outputs(tmp_dir))
+            
+            if self.output_dir.exists():
+                # 이번에 생성하지 않은 기존 파일은 그대로 유지
+                for existing in self.output_dir.iterdir():
+                    if existing.is_file() and existing.name not in self._outputs:
+                        shutil.copy2(existing, tmp_dir / existing.name)
+                old_dir = tmp_dir.with_name(f'{tmp_dir.name}.old')
+                os.replace(self.output_dir, old_dir)
+                os.replace(tmp_dir, self.output_dir)
+                shutil.rmtree(old_dir, ignore_errors=True)
+            else:
+                os.replace(tmp_dir, self.output_dir)
+        except BaseException:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+        
+        self._outputs.clear()
+    
+    def _new_document(self, title_text, doc=None):
+        """제목이 가운데 정렬된 새 문서 생성 (doc이 주어지면 해당 문서에 제목만 추가)"""
+        docx = _get_docx_module()
+        if doc is None:
+            doc = docx.Document()
+        title = doc.add_heading(title_text, 0)
+        title.alignment = docx.enum.text.WD_ALIGN_PARAGRAPH.CENTER
+        return doc
+        
+    def create_project_overview(self, doc=None):
+        """프로젝트 개요서 생성 (doc이 주어지면 해당 문서에 섹션으로 추가)"""
+        standalone = doc is None
+        doc = self._new_document('AI 식단 코치 프로젝트 개요서', doc)
         
         # 기본 정보
         doc.add_heading('1. 프로젝트 기본 정보', level=1)
@@ -88,24 +490,22 @@ class DocumentGenerator:
         
         # 기대 효과
         doc.add_heading('5. 기대 효과', level=1)
-        doc.add_paragraph(
-            '• 개인 맞춤형 식단 관리를 통한 건강 개선\n'
-            '• AI 기반 자동 분석으로 사용자 편의성 향상\n'
-            '• 실시간 코칭을 통한 지속적인 동기 부여\n'
-            '• 스케줄 연동을 통한 체계적인 식습관 관리\n'
-            '• 데이터 기반 개인화 추천으로 효과적인 건강 관리'
-        )
-        
-        doc.save(self.output_dir / '01_프로젝트_개요서.docx')
-        print("✅ 프로젝트 개요서 생성 완료")
+        _build_bullets(doc, [
+            '개인 맞춤형 식단 관리를 통한 건강 개선',
+            'AI 기반 자동 분석으로 사용자 편의성 향상',
+            '실시간 코칭을 통한 지속적인 동기 부여',
+            '스케줄 연동을 통한 체계적인 식습관 관리',
+            '데이터 기반 개인화 추천으로 효과적인 건강 관리'
+        ])
+        
+        if standalone:
+            self._save(doc, '01_프로젝트_개요서.docx')
+            print("✅ 프로젝트 개요서 생성 완료")
 
-    def create_requirements_document(self):
-        """요구사항 정의서 생성"""
-        doc = Document()
-        
-        # 제목
-        title = doc.add_heading('AI 식단 코치 요구사항 정의서', 0)
-        title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    def create_requirements_document(self, doc=None):
+        """요구사항 정의서 생성 (doc이 주어지면 해당 문서에 섹션으로 추가)"""
+        standalone = doc is None
+        doc = self._new_document('AI 식단 코치 요구사항 정의서', doc)
         
         # 1. 기능 요구사항
         doc.add_heading('1. 기능 요구사항', level=1)
@@ -166,16 +566,14 @@ class DocumentGenerator:
         for req in performance_reqs:
             doc.add_paragraph(req, style='List Bullet')
         
-        doc.save(self.output_dir / '02_요구사항_정의서.docx')
-        print("✅ 요구사항 정의서 생성 완료")
+        if standalone:
+            self._save(doc, '02_요구사항_정의서.docx')
+            print("✅ 요구사항 정의서 생성 완료")
 
-    def create_architecture_document(self):
-        """시스템 아키텍처 다이어그램 생성"""
-        doc = Document()
-        
-        # 제목
-        title = doc.add_heading('AI 식단 코치 시스템 아키텍처', 0)
-        title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    def create_architecture_document(self, doc=None):
+        """시스템 아키텍처 다이어그램 생성 (doc이 주어지면 해당 문서에 섹션으로 추가)"""
+        standalone = doc is None
+        doc = self._new_document('AI 식단 코치 시스템 아키텍처', doc)
         
         # 1. 전체 아키텍처 개요
         doc.add_heading('1. 전체 아키텍처 개요', level=1)
@@ -231,15 +629,11 @@ class DocumentGenerator:
             '5. 분석 결과를 DynamoDB에 저장',
             '6. 사용자에게 분석 결과 반환'
         ]
-        for step in flow_steps:
-            doc.add_paragraph(step, style='List Number')
+        _build_list(doc, flow_steps)
         
         # 4. 기술 스택
         doc.add_heading('4. 기술 스택', level=1)
         
-        tech_table = doc.add_table(rows=6, cols=2)
-        tech_table.style = 'Table Grid'
-        
         tech_data = [
             ('백엔드 프레임워크', 'FastAPI (Python)'),
             ('AI/ML 서비스', 'AWS Bedrock (Claude, Titan)'),
@@ -248,10 +642,7 @@ class DocumentGenerator:
             ('배포 환경', 'AWS Lambda / EC2'),
             ('모니터링', 'CloudWatch')
         ]
-        
-        for i, (category, tech) in enumerate(tech_data):
-            tech_table.cell(i, 0).text = category
-            tech_table.cell(i, 1).text = tech
+        _build_table(doc, None, tech_data)
         
         # 5. 보안 아키텍처
         doc.add_heading('5. 보안 아키텍처', level=1)
@@ -265,16 +656,14 @@ class DocumentGenerator:
         for feature in security_features:
             doc.add_paragraph(feature, style='List Bullet')
         
-        doc.save(self.output_dir / '03_시스템_아키텍처.docx')
-        print("✅ 시스템 아키텍처 문서 생성 완료")
+        if standalone:
+            self._save(doc, '03_시스템_아키텍처.docx')
+            print("✅ 시스템 아키텍처 문서 생성 완료")
 
-    def create_database_design(self):
-        """DB 설계서 생성"""
-        doc = Document()
-        
-        # 제목
-        title = doc.add_heading('AI 식단 코치 데이터베이스 설계서', 0)
-        title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    def create_database_design(self, doc=None):
+        """DB 설계서 생성 (doc이 주어지면 해당 문서에 섹션으로 추가)"""
+        standalone = doc is None
+        doc = self._new_document('AI 식단 코치 데이터베이스 설계서', doc)
         
         # 1. 데이터베이스 개요
         doc.add_heading('1. 데이터베이스 개요', level=1)
@@ -411,16 +800,14 @@ class DocumentGenerator:
         for rel in relationships:
             doc.add_paragraph(rel, style='List Bullet')
         
-        doc.save(self.output_dir / '04_DB_설계서.docx')
-        print("✅ DB 설계서 생성 완료")
+        if standalone:
+            self._save(doc, '04_DB_설계서.docx')
+            print("✅ DB 설계서 생성 완료")
 
-    def create_api_specification(self):
-        """API 명세서 생성"""
-        doc = Document()
-        
-        # 제목
-        title = doc.add_heading('AI 식단 코치 API 명세서', 0)
-        title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    def create_api_specification(self, doc=None):
+        """API 명세서 생성 (doc이 주어지면 해당 문서에 섹션으로 추가)"""
+        standalone = doc is None
+        doc = self._new_document('AI 식단 코치 API 명세서', doc)
         
         # 1. API 개요
         doc.add_heading('1. API 개요', level=1)
@@ -466,8 +853,7 @@ class DocumentGenerator:
   "activity_level": "moderate"
 }
         '''
-        p = doc.add_paragraph()
-        p.add_run(request_example).font.name = 'Courier New'
+        _add_code(doc, request_example)
         
         # 응답 예시
         doc.add_heading('응답 예시:', level=3)
@@ -480,8 +866,7 @@ class DocumentGenerator:
   }
 }
         '''
-        p = doc.add_paragraph()
-        p.add_run(response_example).font.name = 'Courier New'
+        _add_code(doc, response_example)
         
         # 2.2 사용자 프로필 조회
         doc.add_heading('2.2 사용자 프로필 조회', level=2)
@@ -560,27 +945,26 @@ class DocumentGenerator:
             error_table.cell(i, 0).text = code
             error_table.cell(i, 1).text = desc
         
-        doc.save(self.output_dir / '05_API_명세서.docx')
-        print("✅ API 명세서 생성 완료")
+        if standalone:
+            self._save(doc, '05_API_명세서.docx')
+            print("✅ API 명세서 생성 완료")
 
-    def create_readme_document(self):
-        """README 문서 생성"""
-        doc = Document()
-        
-        # 제목
-        title = doc.add_heading('AI 식단 코치 README', 0)
-        title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    def create_readme_document(self, doc=None):
+        """README 문서 생성 (doc이 주어지면 해당 문서에 섹션으로 추가)"""
+        target = doc
+        doc = StaticDocxWriter()
+        doc.title('AI 식단 코치 README')
         
         # 1. 프로젝트 소개
-        doc.add_heading('1. 프로젝트 소개', level=1)
-        doc.add_paragraph(
+        doc.heading('1. 프로젝트 소개', level=1)
+        doc.p(
             'AI 식단 코치는 AWS 기반의 개인 맞춤형 식단 관리 AI 솔루션입니다. '
             '식사 사진을 촬영하면 자동으로 음식을 인식하고 영양소를 분석하여, '
             '개인의 건강 목표에 맞는 맞춤형 코칭을 제공합니다.'
         )
         
         # 2. 주요 기능
-        doc.add_heading('2. 주요 기능', level=1)
+        doc.heading('2. 주요 기능', level=1)
         features = [
             '🍽️ 식사 이미지 자동 분석 및 영양소 계산',
             '🤖 AI 기반 개인 맞춤형 식단 코칭',
@@ -589,16 +973,10 @@ class DocumentGenerator:
             '📊 일일/주간 영양 리포트 생성'
         ]
         for feature in features:
-            doc.add_paragraph(feature, style='List Bullet')
+            doc.bullet(feature)
         
         # 3. 기술 스택
-        doc.add_heading('3. 기술 스택', level=1)
-        
-        tech_table = doc.add_table(rows=7, cols=2)
-        tech_table.style = 'Table Grid'
-        
-        tech_table.cell(0, 0).text = '분야'
-        tech_table.cell(0, 1).text = '기술'
+        doc.heading('3. 기술 스택', level=1)
         
         tech_stack = [
             ('Backend', 'Python 3.12, FastAPI'),
@@ -608,13 +986,10 @@ class DocumentGenerator:
             ('Deployment', 'AWS Lambda, EC2'),
             ('Monitoring', 'CloudWatch')
         ]
-        
-        for i, (category, tech) in enumerate(tech_stack, 1):
-            tech_table.cell(i, 0).text = category
-            tech_table.cell(i, 1).text = tech
+        doc.table(('분야', '기술'), tech_stack)
         
         # 4. 시스템 요구사항
-        doc.add_heading('4. 시스템 요구사항', level=1)
+        doc.heading('4. 시스템 요구사항', level=1)
         requirements = [
             'Python 3.12 이상',
             'AWS 계정 및 자격 증명',
@@ -623,16 +998,15 @@ class DocumentGenerator:
             '인터넷 연결'
         ]
         for req in requirements:
-            doc.add_paragraph(req, style='List Bullet')
+            doc.bullet(req)
         
         # 5. 설치 및 설정
-        doc.add_heading('5. 설치 및 설정', level=1)
+        doc.heading('5. 설치 및 설정', level=1)
         
-        doc.add_heading('5.1 프로젝트 클론', level=2)
-        p = doc.add_paragraph()
-        p.add_run('git clone https://github.com/yschoi128/markany-10team.git\ncd markany-10team').font.name = 'Courier New'
+        doc.heading('5.1 프로젝트 클론', level=2)
+        doc.code('git clone https://github.com/yschoi128/markany-10team.git\ncd markany-10team')
         
-        doc.add_heading('5.2 가상환경 설정', level=2)
+        doc.heading('5.2 가상환경 설정', level=2)
         venv_commands = '''
 # 가상환경 생성
 python -m venv venv
@@ -643,17 +1017,14 @@ source venv/bin/activate
 # 가상환경 활성화 (Windows)
 venv\\Scripts\\activate
         '''
-        p = doc.add_paragraph()
-        p.add_run(venv_commands).font.name = 'Courier New'
+        doc.code(venv_commands)
         
-        doc.add_heading('5.3 의존성 설치', level=2)
-        p = doc.add_paragraph()
-        p.add_run('pip install -r requirements.txt').font.name = 'Courier New'
+        doc.heading('5.3 의존성 설치', level=2)
+        doc.code('pip install -r requirements.txt')
         
-        doc.add_heading('5.4 환경 변수 설정', level=2)
-        p = doc.add_paragraph()
-        p.add_run('cp .env.example .env').font.name = 'Courier New'
-        doc.add_paragraph('.env 파일을 편집하여 AWS 자격 증명을 설정하세요:')
+        doc.heading('5.4 환경 변수 설정', level=2)
+        doc.code('cp .env.example .env')
+        doc.p('.env 파일을 편집하여 AWS 자격 증명을 설정하세요:')
         
         env_example = '''
 AWS_ACCESS_KEY_ID=your_access_key
@@ -663,13 +1034,12 @@ S3_BUCKET_NAME=ai-diet-coach-images
 DYNAMODB_DIET_TABLE=diet_records
 BEDROCK_MODEL_ID=anthropic.claude-3-sonnet-20240229-v1:0
         '''
-        p = doc.add_paragraph()
-        p.add_run(env_example).font.name = 'Courier New'
+        doc.code(env_example)
         
         # 6. 실행 방법
-        doc.add_heading('6. 실행 방법', level=1)
+        doc.heading('6. 실행 방법', level=1)
         
-        doc.add_heading('6.1 개발 서버 실행', level=2)
+        doc.heading('6.1 개발 서버 실행', level=2)
         run_commands = '''
 # 방법 1: 직접 실행
 python run_agent.py
@@ -677,23 +1047,22 @@ python run_agent.py
 # 방법 2: uvicorn 사용
 uvicorn src.main:app --reload --host 0.0.0.0 --port 8000
         '''
-        p = doc.add_paragraph()
-        p.add_run(run_commands).font.name = 'Courier New'
+        doc.code(run_commands)
         
-        doc.add_heading('6.2 API 테스트', level=2)
-        doc.add_paragraph('서버 실행 후 다음 URL에서 API 문서를 확인할 수 있습니다:')
+        doc.heading('6.2 API 테스트', level=2)
+        doc.p('서버 실행 후 다음 URL에서 API 문서를 확인할 수 있습니다:')
         api_urls = [
             'API 문서: http://localhost:8000/docs',
             'ReDoc: http://localhost:8000/redoc',
             '헬스체크: http://localhost:8000/health'
         ]
         for url in api_urls:
-            doc.add_paragraph(url, style='List Bullet')
+            doc.bullet(url)
         
         # 7. 사용 예시
-        doc.add_heading('7. 사용 예시', level=1)
+        doc.heading('7. 사용 예시', level=1)
         
-        doc.add_heading('7.1 사용자 프로필 생성', level=2)
+        doc.heading('7.1 사용자 프로필 생성', level=2)
         user_example = '''
 curl -X POST "http://localhost:8000/users" \\
   -H "Content-Type: application/json" \\
@@ -706,10 +1075,9 @@ curl -X POST "http://localhost:8000/users" \\
     "health_goal": "weight_loss"
   }'
         '''
-        p = doc.add_paragraph()
-        p.add_run(user_example).font.name = 'Courier New'
+        doc.code(user_example)
         
-        doc.add_heading('7.2 식사 이미지 분석', level=2)
+        doc.heading('7.2 식사 이미지 분석', level=2)
         meal_example = '''
 curl -X POST "http://localhost:8000/meals/analyze" \\
   -F "user_id=user123" \\
@@ -717,11 +1085,10 @@ curl -X POST "http://localhost:8000/meals/analyze" \\
   -F "people_count=1" \\
   -F "image=@meal_photo.jpg"
         '''
-        p = doc.add_paragraph()
-        p.add_run(meal_example).font.name = 'Courier New'
+        doc.code(meal_example)
         
         # 8. 테스트
-        doc.add_heading('8. 테스트', level=1)
+        doc.heading('8. 테스트', level=1)
         test_commands = '''
 # 단위 테스트 실행
 python -m pytest tests/
@@ -732,15 +1099,14 @@ python -m pytest tests/ --cov=src
 # 특정 테스트 실행
 python -m pytest tests/test_food_analysis.py
         '''
-        p = doc.add_paragraph()
-        p.add_run(test_commands).font.name = 'Courier New'
+        doc.code(test_commands)
         
         # 9. 배포
-        doc.add_heading('9. 배포', level=1)
-        doc.add_paragraph('AWS Lambda 또는 EC2를 통해 배포할 수 있습니다. 자세한 배포 가이드는 별도 문서를 참조하세요.')
+        doc.heading('9. 배포', level=1)
+        doc.p('AWS Lambda 또는 EC2를 통해 배포할 수 있습니다. 자세한 배포 가이드는 별도 문서를 참조하세요.')
         
         # 10. 문제 해결
-        doc.add_heading('10. 문제 해결', level=1)
+        doc.heading('10. 문제 해결', level=1)
         troubleshooting = [
             'AWS 자격 증명 오류: .env 파일의 AWS 키 확인',
             'DynamoDB 테이블 없음: AWS 콘솔에서 테이블 생성 확인',
@@ -748,31 +1114,72 @@ python -m pytest tests/test_food_analysis.py
             'Bedrock 모델 오류: 모델 ID 및 리전 확인'
         ]
         for item in troubleshooting:
-            doc.add_paragraph(item, style='List Bullet')
+            doc.bullet(item)
         
         # 11. 기여하기
-        doc.add_heading('11. 기여하기', level=1)
-        doc.add_paragraph(
-            '1. Fork the repository\n'
-            '2. Create a feature branch\n'
-            '3. Commit your changes\n'
-            '4. Push to the branch\n'
-            '5. Open a Pull Request'
-        )
-        
-        doc.save(self.output_dir / '06_README.docx')
-        print("✅ README 문서 생성 완료")
+        doc.heading('11. 기여하기', level=1)
+        contribution_steps = [
+            'Fork the repository',
+            'Create a feature branch',
+            'Commit your changes',
+            'Push to the branch',
+            'Open a Pull Request'
+        ]
+        for step in contribution_steps:
+            doc.number(step)
+        
+        if target is None:
+            self._save(doc, '06_README.docx')
+            print("✅ README 문서 생성 완료")
+        else:
+            _append_xml(target, doc.body_xml())
 
-    def generate_all_documents(self):
-        """모든 문서 생성"""
+    def create_combined_document(self):
+        """6개 문서를 페이지 나누기로 구분한 하나의 통합 문서 생성 (저장 1회)"""
+        doc = self._new_document('AI 식단 코치 프로젝트 문서')
+        
+        # 목차
+        doc.add_heading('목차', level=1)
+        _build_bullets(doc, [title for _, title in COMBINED_SECTIONS])
+        
+        for method_name, _ in COMBINED_SECTIONS:
+            doc.add_page_break()
+            getattr(self, method_name)(doc)
+        
+        self._save(doc, '00_전체문서.docx')
+        print("✅ 통합 문서 생성 완료")
+    
+    def generate_documents(self, keys, force=False):
+        """
+        선택한 문서 생성
+        내용 해시가 manifest와 같고 대상 파일이 있으면 생성을 건너뜀
+        """
+        manifest = self._load_manifest()
+        
+        for key in keys:
+            method_name, filename = GENERATORS[key]
+            digest = self._content_hash(method_name)
+            if not force and manifest.get(method_name) == digest and (self.output_dir / filename).exists():
+                print(f"⏭️ {filename} 변경 없음 (건너뜀)")
+                continue
+            getattr(self, method_name)()
+            manifest[method_name] = digest
+        
+        if self._outputs:
+            self._outputs[MANIFEST_NAME] = json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8')
+        self.flush()
+    
+    def generate_all_documents(self, force=False, split=False):
+        """모든 문서 생성 (기본: 통합 문서 1개, split=True: 개별 문서 6개)"""
         print("🚀 AI 식단 코치 문서 생성을 시작합니다...")
         
-        self.create_project_overview()
-        self.create_requirements_document()
-        self.create_architecture_document()
-        self.create_database_design()
-        self.create_api_specification()
-        self.create_readme_document()
+        if not split:
+            self.generate_documents(['combined'], force=force)
+            print(f"\n✅ 통합 문서가 '{self.output_dir}' 폴더에 생성되었습니다!")
+            print("  📚 00_전체문서.docx")
+            return
+        
+        self.generate_documents(SECTION_KEYS, force=force)
         
         print(f"\n✅ 모든 문서가 '{self.output_dir}' 폴더에 생성되었습니다!")
         print("생성된 문서:")
@@ -783,7 +1190,59 @@ python -m pytest tests/test_food_analysis.py
         print("  🔌 05_API_명세서.docx")
         print("  📖 06_README.docx")
 
-if __name__ == "__main__":
+
+# --only 키 -> (생성 메서드, 출력 파일명)
+GENERATORS = {
+    'overview': ('create_project_overview', '01_프로젝트_개요서.docx'),
+    'requirements': ('create_requirements_document', '02_요구사항_정의서.docx'),
+    'architecture': ('create_architecture_document', '03_시스템_아키텍처.docx'),
+    'db': ('create_database_design', '04_DB_설계서.docx'),
+    'api': ('create_api_specification', '05_API_명세서.docx'),
+    'readme': ('create_readme_document', '06_README.docx'),
+    'combined': ('create_combined_document', '00_전체문서.docx'),
+}
+
+SECTION_KEYS = ('overview', 'requirements', 'architecture', 'db', 'api', 'readme')
+
+# 통합 문서 섹션 순서: (생성 메서드, 목차 제목)
+COMBINED_SECTIONS = (
+    ('create_project_overview', '프로젝트 개요서'),
+    ('create_requirements_document', '요구사항 정의서'),
+    ('create_architecture_document', '시스템 아키텍처'),
+    ('create_database_design', 'DB 설계서'),
+    ('create_api_specification', 'API 명세서'),
+    ('create_readme_document', 'README'),
+)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="AI 식단 코치 프로젝트 문서 생성기")
+    parser.add_argument(
+        '--only',
+        choices=[*GENERATORS, 'all'],
+        default='all',
+        help="생성할 문서 (기본값: all)"
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help="내용이 바뀌지 않았어도 다시 생성"
+    )
+    parser.add_argument(
+        '--split',
+        action='store_true',
+        help="all 선택 시 통합 문서 대신 개별 문서 6개 생성"
+    )
+    args = parser.parse_args(argv)
+    
     project_path = "/home/sunhk/q/markany-10team"
     generator = DocumentGenerator(project_path)
-    generator.generate_all_documents()
+    
+    if args.only == 'all':
+        generator.generate_all_documents(force=args.force, split=args.split)
+    else:
+        generator.generate_documents([args.only], force=args.force)
+
+
+if __name__ == "__main__":
+    main()
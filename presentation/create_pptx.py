@@ -1,32 +1,64 @@
-from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.enum.text import PP_ALIGN
-from pptx.dml.color import RGBColor
-from pptx.enum.shapes import MSO_SHAPE
+import hashlib
+import importlib.util
+import os
+import zipfile
+from pathlib import Path
+from xml.sax.saxutils import escape
 
-def create_presentation():
-    # 새 프레젠테이션 생성
-    prs = Presentation()
-    
-    # AWS 브랜드 컬러
-    aws_orange = RGBColor(255, 153, 0)
-    aws_blue = RGBColor(35, 47, 62)
-    
-    # 슬라이드 1: 타이틀
-    slide1 = prs.slides.add_slide(prs.slide_layouts[0])
-    title = slide1.shapes.title
-    subtitle = slide1.placeholders[1]
-    
-    title.text = "🤖 Agentic AI Diet Coach"
-    subtitle.text = "MarkAny 해커톤 - Team 10\n진정한 Agentic AI 시스템"
-    
+# 마스터/레이아웃/테마 파트는 python-pptx 기본 템플릿에서 그대로 복사 (객체 모델은 사용하지 않음)
+_TEMPLATE_PATH = os.path.join(
+    importlib.util.find_spec('pptx').submodule_search_locations[0], 'templates', 'default.pptx'
+)
+
+# 출력 파일 (스크립트와 같은 폴더)
+_OUTPUT_PATH = Path(__file__).resolve().parent / 'Agentic_AI_Diet_Coach.pptx'
+
+# 슬라이드 목록에 따라 새로 작성하는 파트 (나머지는 템플릿 그대로)
+_GENERATED_PARTS = frozenset({
+    '[Content_Types].xml',
+    'ppt/presentation.xml',
+    'ppt/_rels/presentation.xml.rels',
+})
+
+# 이보다 작은 파트는 압축 이득보다 DEFLATE 비용이 커서 무압축(ZIP_STORED)으로 저장
+_STORED_MAX_SIZE = 1024
+
+_SLIDE_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.presentationml.slide+xml'
+_REL_TYPE = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+
+# 슬라이드 XML 템플릿 (레이아웃의 placeholder를 상속하므로 위치/서식 지정 불필요)
+_SLIDE_XML_TEMPLATE = (
+    "<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+    '<p:sld xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"'
+    ' xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"'
+    ' xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<p:cSld><p:spTree><p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr><p:grpSpPr/>'
+    '<p:sp><p:nvSpPr><p:cNvPr id="2" name="Title 1"/><p:cNvSpPr><a:spLocks noGrp="1"/></p:cNvSpPr>'
+    '<p:nvPr><p:ph type="{title_type}"/></p:nvPr></p:nvSpPr><p:spPr/>'
+    '<p:txBody><a:bodyPr/><a:lstStyle/>{title}</p:txBody></p:sp>'
+    '<p:sp><p:nvSpPr><p:cNvPr id="3" name="{body_name}"/><p:cNvSpPr><a:spLocks noGrp="1"/></p:cNvSpPr>'
+    '<p:nvPr><p:ph {body_ph}idx="1"/></p:nvPr></p:nvSpPr><p:spPr/>'
+    '<p:txBody><a:bodyPr/><a:lstStyle/>{body}</p:txBody></p:sp>'
+    '</p:spTree></p:cSld><p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr></p:sld>'
+)
+
+_SLIDE_RELS_TEMPLATE = (
+    "<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="' + _REL_TYPE + '/slideLayout"'
+    ' Target="../slideLayouts/slideLayout{layout}.xml"/></Relationships>'
+)
+
+# 슬라이드 1: 타이틀 (제목, 부제목)
+_TITLE_SLIDE = (
+    "🤖 Agentic AI Diet Coach",
+    "MarkAny 해커톤 - Team 10\n진정한 Agentic AI 시스템",
+)
+
+# 슬라이드 2~11: (제목, 본문)
+_CONTENT_SLIDES = (
     # 슬라이드 2: 팀 정보
-    slide2 = prs.slides.add_slide(prs.slide_layouts[1])
-    title2 = slide2.shapes.title
-    content2 = slide2.placeholders[1]
-    
-    title2.text = "📋 팀 정보"
-    content2.text = """🏆 Team 10
+    ("📋 팀 정보", """🏆 Team 10
 
 • 서비스명: Agentic AI Diet Coach
 • 핵심 가치: "AI가 스스로 판단하고 행동하는 진정한 Agentic AI"
@@ -34,15 +66,9 @@ def create_presentation():
 
 💡 한 줄 소개
 "LLM이 스스로 상황을 판단하여 도구를 선택하고 실행하는 자율적 AI 식단 코치"
-"""
-    
+"""),
     # 슬라이드 3: 문제 정의
-    slide3 = prs.slides.add_slide(prs.slide_layouts[1])
-    title3 = slide3.shapes.title
-    content3 = slide3.placeholders[1]
-    
-    title3.text = "🎯 문제 정의"
-    content3.text = """기존 식단 앱의 한계:
+    ("🎯 문제 정의", """기존 식단 앱의 한계:
 
 ❌ 단순 칼로리 계산기 수준
 ❌ 획일적인 추천 시스템  
@@ -55,15 +81,9 @@ def create_presentation():
 📊 실시간 상황 분석 및 대응
 🎯 완전 개인화된 코칭
 💬 자연스러운 대화형 인터페이스
-"""
-    
+"""),
     # 슬라이드 4: 핵심 차별점
-    slide4 = prs.slides.add_slide(prs.slide_layouts[1])
-    title4 = slide4.shapes.title
-    content4 = slide4.placeholders[1]
-    
-    title4.text = "🌟 핵심 차별점"
-    content4.text = """1. 진정한 Agentic AI
+    ("🌟 핵심 차별점", """1. 진정한 Agentic AI
 • 기존: 고정된 if-else 로직
 • 우리: LLM이 상황별로 스스로 도구 선택
 
@@ -77,15 +97,9 @@ def create_presentation():
 
 3. 컨텍스트 유지
 • 대화 기록 메모리 관리 • 개인 목표 및 선호도 학습 • 연속적 개인화 서비스
-"""
-    
+"""),
     # 슬라이드 5: Agentic AI 아키텍처
-    slide5 = prs.slides.add_slide(prs.slide_layouts[1])
-    title5 = slide5.shapes.title
-    content5 = slide5.placeholders[1]
-    
-    title5.text = "🤖 Agentic AI 아키텍처"
-    content5.text = """
+    ("🤖 Agentic AI 아키텍처", """
 ┌─────────────────────────────────────────┐
 │           사용자 입력                    │
 └─────────────┬───────────────────────────┘
@@ -105,15 +119,9 @@ def create_presentation():
 │        Memory System                    │
 │  • 대화 기록  • 사용자 프로필  • 학습 데이터 │
 └─────────────────────────────────────────┘
-"""
-    
+"""),
     # 슬라이드 6: AWS 기술 스택
-    slide6 = prs.slides.add_slide(prs.slide_layouts[1])
-    title6 = slide6.shapes.title
-    content6 = slide6.placeholders[1]
-    
-    title6.text = "🛠️ AWS 기술 스택"
-    content6.text = """핵심 AI 서비스:
+    ("🛠️ AWS 기술 스택", """핵심 AI 서비스:
 • Amazon Bedrock: Claude 3.5 Sonnet (Agentic AI 엔진)
 • Amazon Rekognition: 음식 이미지 분석
 • Amazon DynamoDB: 사용자 데이터 및 메모리 저장
@@ -127,15 +135,9 @@ def create_presentation():
 1. 자율적 도구 선택 - AI가 상황에 따라 스스로 도구 조합 결정
 2. 다단계 추론 - 의도분석→정보수집→개인화추천→결과종합
 3. 안전장치 시스템 - AI 우선 처리, 실패시 하드코딩 폴백
-"""
-    
+"""),
     # 슬라이드 7: 데모 시나리오 1
-    slide7 = prs.slides.add_slide(prs.slide_layouts[1])
-    title7 = slide7.shapes.title
-    content7 = slide7.placeholders[1]
-    
-    title7.text = "🎭 데모 - 시나리오 1: 아침 인사"
-    content7.text = """👤 사용자: "안녕하세요! 오늘 아침 뭐 먹을까요?"
+    ("🎭 데모 - 시나리오 1: 아침 인사", """👤 사용자: "안녕하세요! 오늘 아침 뭐 먹을까요?"
 
 🤖 AI 자율 판단:
 ✓ get_user_profile() → 체중감량 목표 확인
@@ -145,15 +147,9 @@ def create_presentation():
 💬 응답: "체중 감량 목표에 맞춰 오트밀+베리+아몬드 (250kcal) 추천드려요!"
 
 🎯 핵심: AI가 스스로 판단하여 도구를 선택하고 실행하는 모습
-"""
-    
+"""),
     # 슬라이드 8: 데모 시나리오 2, 3
-    slide8 = prs.slides.add_slide(prs.slide_layouts[1])
-    title8 = slide8.shapes.title
-    content8 = slide8.placeholders[1]
-    
-    title8.text = "🎭 데모 - 시나리오 2, 3"
-    content8.text = """📸 시나리오 2: 이미지 분석
+    ("🎭 데모 - 시나리오 2, 3", """📸 시나리오 2: 이미지 분석
 👤 사용자: [음식 사진 업로드] "이거 칼로리 얼마나 될까요?"
 🤖 AI: analyze_food_image() → calculate_nutrition() → generate_advice()
 💬 응답: "김치찌개 1인분 약 320kcal입니다. 목표 칼로리 내 적절한 선택이에요!"
@@ -162,15 +158,9 @@ def create_presentation():
 👤 사용자: "치킨 먹어도 될까요? 점심에 햄버거 먹었어요."
 🤖 AI: calculate_daily_nutrition() → get_user_goals() → recommend_alternative()
 💬 응답: "햄버거로 이미 800kcal 섭취하셨네요. 치킨보다는 구운 닭가슴살 어떠세요?"
-"""
-    
+"""),
     # 슬라이드 9: Q Developer 활용
-    slide9 = prs.slides.add_slide(prs.slide_layouts[1])
-    title9 = slide9.shapes.title
-    content9 = slide9.placeholders[1]
-    
-    title9.text = "🤖 Q Developer 활용"
-    content9.text = """💻 개발 전 과정에서 Q Developer 활용
+    ("🤖 Q Developer 활용", """💻 개발 전 과정에서 Q Developer 활용
 
 1. 아키텍처 설계
 • Agent 패턴 구현 방법
@@ -189,15 +179,9 @@ class AgentCore:
 • 결과: 응답 시간 70% 단축
 
 📊 Q Developer 효과: 개발시간 40% 단축, 버그 60% 감소
-"""
-    
+"""),
     # 슬라이드 10: 소감 및 마무리
-    slide10 = prs.slides.add_slide(prs.slide_layouts[1])
-    title10 = slide10.shapes.title
-    content10 = slide10.placeholders[1]
-    
-    title10.text = "💭 소감 및 마무리"
-    content10.text = """🏆 성과
+    ("💭 소감 및 마무리", """🏆 성과
 ✅ 진정한 Agentic AI 구현 완료
 ✅ AWS 생태계 완전 활용
 ✅ Q Developer로 개발 효율성 극대화
@@ -211,15 +195,9 @@ class AgentCore:
 진정한 Agentic AI 서비스를 구현했습니다"
 
 감사합니다! 🎯
-"""
-    
+"""),
     # 슬라이드 11: 심사기준별 강점
-    slide11 = prs.slides.add_slide(prs.slide_layouts[1])
-    title11 = slide11.shapes.title
-    content11 = slide11.placeholders[1]
-    
-    title11.text = "📊 심사기준별 강점"
-    content11.text = """🌟 아이디어 참신성 (20점)
+    ("📊 심사기준별 강점", """🌟 아이디어 참신성 (20점)
 • 기존 칼로리 앱 → Agentic AI 코치로 패러다임 전환
 • 업계 최초 완전 개인화 식단 AI
 
@@ -236,12 +214,100 @@ class AgentCore:
 • 안정적인 폴백 시스템 구비
 
 💯 목표: 심사기준 만점 달성!
-"""
+"""),
+)
+
+
+def _text_body(text):
+    """줄바꿈마다 문단(a:p)을 나눈 txBody 내용 생성"""
+    return ''.join(
+        f'<a:p><a:r><a:t>{escape(line)}</a:t></a:r></a:p>' if line else '<a:p/>'
+        for line in text.split('\n')
+    )
+
+
+def _slide_xml(title, body, title_slide=False):
+    """제목/본문 슬라이드 XML 생성 (title_slide=True면 타이틀 레이아웃)"""
+    if title_slide:
+        return _SLIDE_XML_TEMPLATE.format(
+            title_type='ctrTitle', body_name='Subtitle 2', body_ph='type="subTitle" ',
+            title=_text_body(title), body=_text_body(body),
+        )
+    return _SLIDE_XML_TEMPLATE.format(
+        title_type='title', body_name='Content Placeholder 2', body_ph='',
+        title=_text_body(title), body=_text_body(body),
+    )
+
+
+def _writestr(zf, name, data):
+    """크기에 따라 압축 방식을 골라 zip 항목 작성"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    compress_type = zipfile.ZIP_STORED if len(data) < _STORED_MAX_SIZE else zipfile.ZIP_DEFLATED
+    zf.writestr(name, data, compress_type=compress_type)
+
+
+def _write_pptx(path, slides):
+    """
+    템플릿 파트를 복사하고 슬라이드 XML을 직접 작성하여 .pptx 저장
+
+    slides: [(슬라이드 XML, 레이아웃 번호), ...]
+    """
+    with zipfile.ZipFile(_TEMPLATE_PATH) as template, \
+            zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as out:
+        for name in template.namelist():
+            if name not in _GENERATED_PARTS:
+                _writestr(out, name, template.read(name))
+
+        content_types = template.read('[Content_Types].xml').decode('utf-8')
+        presentation = template.read('ppt/presentation.xml').decode('utf-8')
+        presentation_rels = template.read('ppt/_rels/presentation.xml.rels').decode('utf-8')
+
+        overrides, sld_ids, rels = [], [], []
+        for n, (xml, layout) in enumerate(slides, start=1):
+            _writestr(out, f'ppt/slides/slide{n}.xml', xml)
+            _writestr(out, f'ppt/slides/_rels/slide{n}.xml.rels', _SLIDE_RELS_TEMPLATE.format(layout=layout))
+            overrides.append(f'<Override PartName="/ppt/slides/slide{n}.xml" ContentType="{_SLIDE_CONTENT_TYPE}"/>')
+            # 템플릿이 rId1~rId6을 사용하므로 슬라이드는 rId101부터 부여
+            sld_ids.append(f'<p:sldId id="{255 + n}" r:id="rId{100 + n}"/>')
+            rels.append(f'<Relationship Id="rId{100 + n}" Type="{_REL_TYPE}/slide" Target="slides/slide{n}.xml"/>')
+
+        _writestr(out, '[Content_Types].xml', content_types.replace('</Types>', ''.join(overrides) + '</Types>'))
+        _writestr(out, 'ppt/presentation.xml', presentation.replace(
+            '</p:sldMasterIdLst>', '</p:sldMasterIdLst><p:sldIdLst>' + ''.join(sld_ids) + '</p:sldIdLst>'
+        ))
+        _writestr(out, 'ppt/_rels/presentation.xml.rels', presentation_rels.replace(
+            '</Relationships>', ''.join(rels) + '</Relationships>'
+        ))
+
+
+def _content_hash():
+    """슬라이드 내용과 XML 템플릿의 SHA-256 해시"""
+    parts = [_SLIDE_XML_TEMPLATE, _SLIDE_RELS_TEMPLATE, *_TITLE_SLIDE]
+    for title, body in _CONTENT_SLIDES:
+        parts += (title, body)
+    return hashlib.sha256('\x1f'.join(parts).encode('utf-8')).hexdigest()
+
+
+def create_presentation():
+    # 내용이 바뀌지 않았으면 (해시 사이드카 파일 일치) 재생성하지 않음
+    out = _OUTPUT_PATH
+    marker = out.with_suffix('.sha256')
+    digest = _content_hash()
+    if out.exists() and marker.exists() and marker.read_text() == digest:
+        print(f"PowerPoint file is up to date: {out}")
+        return out
+    
+    # 슬라이드 1: 타이틀 (레이아웃 1), 슬라이드 2~11: 제목 + 본문 (레이아웃 2)
+    slides = [(_slide_xml(*_TITLE_SLIDE, title_slide=True), 1)]
+    slides.extend((_slide_xml(title, body), 2) for title, body in _CONTENT_SLIDES)
     
     # 파일 저장
-    prs.save('d:\\ubuntu\\team10\\markany-10team\\presentation\\Agentic_AI_Diet_Coach.pptx')
+    _write_pptx(out, slides)
+    marker.write_text(digest)
     print("PowerPoint file created successfully!")
-    print("File location: d:\\ubuntu\\team10\\markany-10team\\presentation\\Agentic_AI_Diet_Coach.pptx")
+    print(f"File location: {out}")
+    return out
 
 if __name__ == "__main__":
     create_presentation()
\ No newline at end of file